@@ -0,0 +1,74 @@
+"""
+Micro-benchmark for the cost of a log call whose level is disabled.
+
+The benchmark compares the current `Logger` with a logger that still uses the
+previous level checks (a linear `in` over the supported levels followed by two
+`list.index()` lookups), so the effect of the precomputed severity window can
+be seen directly.
+
+Run it from the repository root:
+
+    python benchmarks/bench_disabled_call.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from loggingpython.logger import Logger  # noqa: E402
+from loggingpython.log_levels import LogLevel  # noqa: E402
+from loggingpython.error.invalid_log_level_error import \
+    InvalidLogLevelError  # noqa: E402
+
+
+class LegacyLogger(Logger):
+    """
+    A logger that performs the level checks the way `Logger._log` did before
+    log levels had integer severities.
+    """
+
+    def debug(self, message: str) -> None:
+        self._log(message, loglevel=LogLevel.DEBUG)
+
+    def _log(self, message: str,
+             loglevel: LogLevel = LogLevel.INFO) -> None:
+        if loglevel not in self._SUPPORTED_LEVELS:
+            raise InvalidLogLevelError(loglevel)
+        if self._SUPPORTED_LEVELS.index(loglevel) >= \
+                self._SUPPORTED_LEVELS.index(self.min_loglevel):
+            if self._SUPPORTED_LEVELS.index(loglevel) <= \
+                    self._SUPPORTED_LEVELS.index(self.max_loglevel):
+                formatted_message = self._format_message(message, loglevel)
+                for handler in self.handlers:
+                    handler.emit(formatted_message)
+
+
+def bench(logger: Logger, number: int) -> float:
+    """
+    Returns the average time of a disabled `debug()` call in nanoseconds.
+    """
+    timer = timeit.Timer("logger.debug('disabled message')",
+                         globals={"logger": logger})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main(number: int = 200_000) -> None:
+    results = {
+        "before": bench(LegacyLogger("legacy"), number),
+        "after": bench(Logger("current"), number),
+    }
+    guarded = Logger("guarded")
+    timer = timeit.Timer(
+        "if logger.isEnabledFor(DEBUG): logger.debug('message')",
+        globals={"logger": guarded, "DEBUG": LogLevel.DEBUG})
+    results["after (isEnabledFor guard)"] = \
+        min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+    for name, nanoseconds in results.items():
+        print(f"{name:<28} {nanoseconds:8.1f} ns per disabled call")
+
+
+if __name__ == "__main__":
+    main()
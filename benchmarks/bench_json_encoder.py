@@ -0,0 +1,67 @@
+"""
+Benchmark for encoding log records as JSON.
+
+The benchmark compares the previous path of the `SysHandler` and the
+`JSONHandler`, which copied the record into a dictionary together with the
+client name and called `json.dumps` on it, with the `JSONEncoder` using the
+standard library backend and, if it is installed, the orjson backend. The
+client name is passed as a static field, so it is encoded only once.
+
+Run it from the repository root:
+
+    python benchmarks/bench_json_encoder.py
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    from loggingpython import json_encoder  # noqa: E402
+from loggingpython.json_encoder import JSONEncoder  # noqa: E402
+from loggingpython.log_levels import LogLevel  # noqa: E402
+from loggingpython.logger import Logger  # noqa: E402
+
+
+def legacy_encode(record, name: str) -> bytes:
+    """
+    Encodes a record the way the handlers did before `JSONEncoder` existed.
+    """
+    return json.dumps(dict(record, client_name=name)).encode("utf-8")
+
+
+def bench(function, record, number: int) -> float:
+    """
+    Returns the average time of encoding the record in nanoseconds.
+    """
+    timer = timeit.Timer(lambda: function(record))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main(number: int = 100_000) -> None:
+    logger = Logger("benchmark")
+    record = logger._format_message("request /api/v1/items handled in 12 ms",
+                                    LogLevel.INFO)
+    results = {
+        "before (dict copy + json.dumps)":
+            bench(lambda record: legacy_encode(record, "client"), record,
+                  number),
+        "after (JSONEncoder, json)":
+            bench(JSONEncoder({"client_name": "client"},
+                              backend="json").encode, record, number),
+    }
+    if json_encoder.orjson is not None:
+        results["after (JSONEncoder, orjson)"] = bench(
+            JSONEncoder({"client_name": "client"}, backend="orjson").encode,
+            record, number)
+    for name, nanoseconds in results.items():
+        print(f"{name:<34} {nanoseconds:8.1f} ns per record")
+
+
+if __name__ == "__main__":
+    main()
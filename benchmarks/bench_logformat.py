@@ -0,0 +1,79 @@
+"""
+Benchmark for rendering log records with a handler's `logformat_string`.
+
+The benchmark compares the precompiled `LogFormat` renderer with the previous
+path, which copied the record into a fresh dictionary and applied
+`logformat_string % values` for every record, across several format strings.
+
+Run it from the repository root:
+
+    python benchmarks/bench_logformat.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from loggingpython.log_format import LogFormat  # noqa: E402
+from loggingpython.log_levels import LogLevel  # noqa: E402
+from loggingpython.logger import Logger  # noqa: E402
+
+
+LOGFORMAT_STRINGS = [
+    "%(asctime)s: [%(loggername)s]: [%(loglevel)s]: %(message)s",
+    "%(iso_8601_time)s %(loglevel)s %(message)s",
+    "[%(loglevel)s] %(message)s",
+    "%(message)s",
+]
+
+
+def legacy_render(logformat_string: str, record) -> str:
+    """
+    Renders a record the way the handlers did before `LogFormat` existed.
+    """
+    values = {
+        "loggername": record.get("loggername", ""),
+        "iso_8601_time": record.get("iso_8601_time", ""),
+        "asctime": record.get("asctime", ""),
+        "loglevel": record.get("loglevel", ""),
+        "message": record.get("message", ""),
+    }
+    return logformat_string % values
+
+
+def bench(statement: str, namespace: dict, number: int) -> float:
+    """
+    Returns the average time of the statement in nanoseconds.
+    """
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main(number: int = 100_000) -> None:
+    logger = Logger("benchmark", time_format="%Y-%m-%d %H:%M:%S")
+    for logformat_string in LOGFORMAT_STRINGS:
+        logformat = LogFormat(logformat_string)
+        namespace = {
+            "logger": logger,
+            "LogLevel": LogLevel,
+            "logformat": logformat,
+            "logformat_string": logformat_string,
+            "legacy_render": legacy_render,
+        }
+        # A fresh record per iteration, so that lazily rendered timestamps
+        # are paid for exactly as often as they are in a real handler.
+        record = "logger._format_message('message', LogLevel.INFO)"
+        baseline = bench(record, namespace, number)
+        before = bench(f"legacy_render(logformat_string, {record})",
+                       namespace, number) - baseline
+        after = bench(f"logformat.render({record})",
+                      namespace, number) - baseline
+        print(f"{logformat_string!r}")
+        print(f"    before (dict copy + %) {before:8.1f} ns per record")
+        print(f"    after (LogFormat)      {after:8.1f} ns per record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Compares two result files of `run_suite.py`, for example of two releases.
+
+For every scenario present in both files, the throughput and latency of the
+new results are printed relative to the old ones.
+
+Run it from the repository root:
+
+    python benchmarks/compare.py old.json new.json
+"""
+
+import json
+import sys
+
+
+METRICS = ("records_per_second", "p50_ns", "p99_ns",
+           "retained_bytes_per_record", "peak_bytes_per_record")
+
+
+def main(old_path: str, new_path: str) -> None:
+    with open(old_path) as file:
+        old = json.load(file)
+    with open(new_path) as file:
+        new = json.load(file)
+
+    print(f"{'scenario':<22} " + " ".join(f"{m:>26}" for m in METRICS))
+    for name, new_result in new["results"].items():
+        old_result = old["results"].get(name)
+        if old_result is None:
+            continue
+        ratios = []
+        for metric in METRICS:
+            if old_result[metric]:
+                ratio = new_result[metric] / old_result[metric]
+                ratios.append(f"{ratio:>25.2f}x")
+            else:
+                ratios.append(f"{'-':>26}")
+        print(f"{name:<22} " + " ".join(ratios))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: compare.py OLD.json NEW.json")
+    main(sys.argv[1], sys.argv[2])
@@ -0,0 +1,332 @@
+"""
+Benchmark suite for the loggers and every built-in handler.
+
+Each scenario sets up a logger, logs a number of records through it and
+reports:
+
+ - `records_per_second`: the throughput of the timed run.
+ - `p50_ns` / `p99_ns`: the median and 99th percentile latency of a single log
+   call in nanoseconds.
+ - `retained_bytes_per_record`: the memory that is still allocated after the
+   run, divided by the number of records (measured with tracemalloc in a
+   separate, shorter run).
+ - `peak_bytes_per_record`: the peak of the memory allocated during that run
+   above the starting point, divided by the number of records.
+
+The scenarios cover every handler (File, buffered File, File in atomic append
+mode, ring buffer, Console to a null stream, CSV, JSON as a document, as NDJSON
+and as a streamed array, column segments, SQL and SysHandler over TCP and UDP
+against a loopback server), disabled log levels, fan-out to several handlers
+and a baseline with the standard library `logging` module. The results are
+written as JSON, so the results of two versions can be diffed.
+
+Run it from the repository root:
+
+    python benchmarks/run_suite.py --output results.json
+    python benchmarks/run_suite.py --only file --only stdlib_file
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import loggingpython  # noqa: E402
+from loggingpython import (  # noqa: E402
+    Logger, LogLevel, SysProtocolls, FileHandler, ConsoleHandler,
+    CSVHandler, JSONHandler, SQLHandler, SysHandler, RingBufferHandler,
+    SegmentHandler, JSONFormat)
+
+
+MESSAGE = "request %s handled in %d ms"
+ARGS = ("/api/v1/items", 12)
+
+
+class LoopbackServer:
+    """
+    A minimal log server on the loopback interface that accepts what a
+    `SysHandler` client sends and acknowledges every TCP message.
+    """
+
+    def __init__(self, protocoll: SysProtocolls) -> None:
+        self.protocoll = protocoll
+        self.socket = socket.socket(socket.AF_INET, protocoll.value)
+        self.socket.bind(("127.0.0.1", 0))
+        self.port = self.socket.getsockname()[1]
+        if protocoll == SysProtocolls.TCP:
+            self.socket.listen(1)
+            target = self._serve_tcp
+        else:
+            target = self._serve_udp
+        threading.Thread(target=target, daemon=True).start()
+
+    def _serve_tcp(self) -> None:
+        connection, _ = self.socket.accept()
+        with connection:
+            while connection.recv(65536):
+                connection.sendall(b"Receive message")
+
+    def _serve_udp(self) -> None:
+        while True:
+            self.socket.recvfrom(65536)
+
+
+def logger_with(*handlers) -> Logger:
+    """
+    Returns a logger that logs from DEBUG upwards to the given handlers.
+    """
+    logger = Logger("benchmark", min_loglevel=LogLevel.DEBUG)
+    for handler in handlers:
+        logger.addHandler(handler)
+    return logger
+
+
+def stdlib_logger(*handlers: logging.Handler,
+                  level: int = logging.DEBUG) -> logging.Logger:
+    """
+    Returns a standard library logger with the given handlers.
+    """
+    logger = logging.getLogger(f"benchmark-{id(handlers)}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(level)
+    for handler in handlers:
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s: [%(name)s]: [%(levelname)s]: %(message)s"))
+        logger.addHandler(handler)
+    return logger
+
+
+def build_scenarios(directory: str) -> dict[str, Callable]:
+    """
+    Returns the scenarios of the suite. Every scenario is a function that
+    sets up the logger and returns the log call and a teardown function.
+    """
+    null_stream = open(os.devnull, "w")
+
+    def close(*handlers) -> Callable:
+        def teardown() -> None:
+            for handler in handlers:
+                handler.close()
+        return teardown
+
+    def file():
+        handler = FileHandler("file", directory)
+        return logger_with(handler).info, close(handler)
+
+    def file_buffered():
+        handler = FileHandler("file_buffered", directory, buffered=True)
+        return logger_with(handler).info, close(handler)
+
+    def file_atomic():
+        handler = FileHandler("file_atomic", directory, atomic_append=True)
+        return logger_with(handler).info, close(handler)
+
+    def ring_buffer():
+        handler = RingBufferHandler("ring_buffer", directory)
+        return logger_with(handler).info, close(handler)
+
+    def console():
+        handler = ConsoleHandler(stream=null_stream)
+        return logger_with(handler).info, close(handler)
+
+    def csv():
+        handler = CSVHandler("csv", directory)
+        return logger_with(handler).info, close(handler)
+
+    def json_():
+        handler = JSONHandler("json", directory)
+        return logger_with(handler).info, close(handler)
+
+    def json_ndjson():
+        handler = JSONHandler("json_ndjson", directory,
+                              json_format=JSONFormat.NDJSON)
+        return logger_with(handler).info, close(handler)
+
+    def json_array():
+        handler = JSONHandler("json_array", directory,
+                              json_format=JSONFormat.ARRAY)
+        return logger_with(handler).info, close(handler)
+
+    def segment():
+        handler = SegmentHandler("segment", directory)
+        return logger_with(handler).info, close(handler)
+
+    def sql():
+        handler = SQLHandler("sql", directory)
+        return logger_with(handler).info, close(handler)
+
+    def sys_tcp():
+        server = LoopbackServer(SysProtocolls.TCP)
+        handler = SysHandler(protocoll=SysProtocolls.TCP,
+                             server_name="127.0.0.1", port=server.port)
+        return logger_with(handler).info, close(handler)
+
+    def sys_udp():
+        server = LoopbackServer(SysProtocolls.UDP)
+        handler = SysHandler(protocoll=SysProtocolls.UDP,
+                             server_name="127.0.0.1", port=server.port)
+        return logger_with(handler).info, close(handler)
+
+    def disabled():
+        handler = FileHandler("disabled", directory)
+        logger = Logger("benchmark", min_loglevel=LogLevel.INFO)
+        logger.addHandler(handler)
+        return logger.debug, close(handler)
+
+    def fan_out():
+        handlers = (FileHandler("fan_out", directory),
+                    ConsoleHandler(stream=null_stream),
+                    CSVHandler("fan_out", directory))
+        return logger_with(*handlers).info, close(*handlers)
+
+    def stdlib_file():
+        handler = logging.FileHandler(os.path.join(directory, "stdlib.log"))
+        return stdlib_logger(handler).info, handler.close
+
+    def stdlib_console():
+        handler = logging.StreamHandler(null_stream)
+        return stdlib_logger(handler).info, handler.close
+
+    def stdlib_disabled():
+        handler = logging.FileHandler(os.path.join(directory, "stdlib.log"))
+        logger = stdlib_logger(handler, level=logging.INFO)
+        return logger.debug, handler.close
+
+    return {
+        "file": file,
+        "file_buffered": file_buffered,
+        "file_atomic": file_atomic,
+        "ring_buffer": ring_buffer,
+        "console": console,
+        "csv": csv,
+        "json": json_,
+        "json_ndjson": json_ndjson,
+        "json_array": json_array,
+        "segment": segment,
+        "sql": sql,
+        "sys_tcp": sys_tcp,
+        "sys_udp": sys_udp,
+        "disabled": disabled,
+        "fan_out": fan_out,
+        "stdlib_file": stdlib_file,
+        "stdlib_console": stdlib_console,
+        "stdlib_disabled": stdlib_disabled,
+    }
+
+
+# Handlers whose cost grows with the amount of data already written get
+# fewer records, so that the suite finishes in reasonable time.
+RECORD_LIMITS = {
+    "json": 1_000,
+}
+
+
+def percentile(sorted_values: list[int], fraction: float) -> int:
+    """
+    Returns the value at the given fraction of the sorted values.
+    """
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run_scenario(scenario: Callable, records: int) -> dict:
+    """
+    Runs a scenario once for timing and once for memory measurement.
+    """
+    log, teardown = scenario()
+    latencies = []
+    perf_counter_ns = time.perf_counter_ns
+    try:
+        start = perf_counter_ns()
+        for _ in range(records):
+            before = perf_counter_ns()
+            log(MESSAGE, *ARGS)
+            latencies.append(perf_counter_ns() - before)
+        elapsed = perf_counter_ns() - start
+    finally:
+        teardown()
+    latencies.sort()
+
+    memory_records = max(records // 10, 1)
+    log, teardown = scenario()
+    try:
+        tracemalloc.start()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(memory_records):
+            log(MESSAGE, *ARGS)
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        teardown()
+
+    return {
+        "records": records,
+        "records_per_second": records / (elapsed / 1e9),
+        "p50_ns": percentile(latencies, 0.50),
+        "p99_ns": percentile(latencies, 0.99),
+        "retained_bytes_per_record":
+            (current_bytes - start_bytes) / memory_records,
+        "peak_bytes_per_record": (peak_bytes - start_bytes) / memory_records,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=20_000,
+                        help="records per scenario (default: 20000)")
+    parser.add_argument("--only", action="append", default=[],
+                        help="run only the named scenario (repeatable)")
+    parser.add_argument("--output", default="-",
+                        help="file for the JSON results (default: stdout)")
+    arguments = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="loggingpython-benchmark-")
+    results = {}
+    try:
+        scenarios = build_scenarios(directory)
+        for name, scenario in scenarios.items():
+            if arguments.only and name not in arguments.only:
+                continue
+            records = min(arguments.records,
+                          RECORD_LIMITS.get(name, arguments.records))
+            # SysHandler prints every acknowledgement it receives.
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[name] = run_scenario(scenario, records)
+            print(f"{name:<22} {results[name]['records_per_second']:12.0f} "
+                  f"records/s", file=sys.stderr)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    report = {
+        "loggingpython": loggingpython.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = json.dumps(report, indent=4)
+    if arguments.output == "-":
+        print(output)
+    else:
+        with open(arguments.output, "w") as file:
+            file.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
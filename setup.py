@@ -17,7 +17,12 @@ setup(
     url='https://github.com/loggingpython-Community/loggingpython',
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
-    install_requires=['colorama', 'pandas'],
+    install_requires=['colorama'],
+    extras_require={
+        'fast': ['orjson'],
+        'analysis': ['numpy', 'pandas'],
+        'parquet': ['pyarrow'],
+    },
     license='MIT',
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -62,21 +62,43 @@ projects.
 import importlib
 
 from .logger import Logger
+from .async_logger import AsyncLogger
+from .log_funnel import LogFunnel
 
 from .log_levels import LogLevel
+from .log_record import LogRecord
 from .sys_protocolls import SysProtocolls
-
+from .overflow_policy import OverflowPolicy
+from .rotation_interval import RotationInterval
+from .rotation import Rotation
+from .compression import Compression
+from .json_format import JSONFormat
+from .archiver import Archiver
+from .json_encoder import JSONEncoder
+from .lifecycle import shutdown
+
+from .handler.handler import Handler
 from .handler.filehandler import FileHandler
 from .handler.consolehandler import ConsoleHandler
 from .handler.jsonhandler import JSONHandler
 from .handler.sqlhandler import SQLHandler
 from .handler.csvhandler import CSVHandler
 from .handler.syshandler import SysHandler
+from .handler.queuehandler import QueueHandler
+from .handler.asynchandler import AsyncHandler
+from .handler.executorhandler import ExecutorHandler
+from .handler.asyncsyshandler import AsyncSysHandler
+from .handler.processhandler import ProcessHandler
+from .handler.ringbufferhandler import RingBufferHandler
+from .handler.sharedhandler import SharedHandler
+from .handler.deduphandler import DedupHandler
+from .handler.segmenthandler import SegmentHandler
 
 from .error.server_unreachable_error import ServerUnreachableError
 from .error.server_method_call_error import ServerMethodCallError
 from .error.client_method_call_error import ClientMethodCallError
 from .error.invalid_log_level_error import InvalidLogLevelError
+from .error.invalid_log_format_error import InvalidLogFormatError
 from .error.invalid_handler_method_error import InvalidHandlerMethodError
 from .error.handler_not_found_error import HandlerNotFoundError
 
@@ -85,10 +107,20 @@ __version__ = "1.4.17"
 __all__ = [
     # Bacis
     "Logger",
+    "AsyncLogger",
+    "LogRecord",
+    "LogFunnel",
+    "Rotation",
+    "Archiver",
+    "JSONEncoder",
 
     # Enum
     "LogLevel",
     "SysProtocolls",
+    "OverflowPolicy",
+    "RotationInterval",
+    "Compression",
+    "JSONFormat",
 
     # Hander
     "Handler",
@@ -98,14 +130,27 @@ __all__ = [
     "SQLHandler",
     "CSVHandler",
     "SysHandler",
+    "QueueHandler",
+    "AsyncHandler",
+    "ExecutorHandler",
+    "AsyncSysHandler",
+    "ProcessHandler",
+    "RingBufferHandler",
+    "SharedHandler",
+    "DedupHandler",
+    "SegmentHandler",
 
     # Error
     "ServerUnreachableError",
     "ServerMethodCallError",
     "ClientMethodCallError",
     "InvalidLogLevelError",
+    "InvalidLogFormatError",
     "InvalidHandlerMethodError",
-    "HandlerNotFoundError"
+    "HandlerNotFoundError",
+
+    # Functions
+    "shutdown"
     ]
 
 __license__ = "MIT"
@@ -146,11 +191,14 @@ def getBasicLogger() -> Logger:
     Creates a logger with predefined handlers for file and console output.
         console output.
 
+    The file handler is shared, so every basic logger writes through the
+    same open log file.
+
     Returns:
         Logger: A logger with predefined handlers.
     """
     logger: Logger = getLogger()
-    logger.addHandler(FileHandler(logger.name))
+    logger.addHandler(SharedHandler(FileHandler, logger.name))
     logger.addHandler(ConsoleHandler())
     return logger
 
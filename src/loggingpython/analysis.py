@@ -0,0 +1,602 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module provides the loaders of the `loggingpython` package that read
+the log files of the handlers back into pandas DataFrames for analysis. There
+is one loader per file format:
+
+ - `load_log` for the text log files of the `FileHandler`,
+ - `load_csv` for the log files of the `CSVHandler`,
+ - `load_json` for the log files of the `JSONHandler` in all three formats,
+ - `load_sql` for the log databases of the `SQLHandler`,
+
+and `load`, which picks the loader by the handler or the file extension.
+
+The loaders parse the log files in chunks of rows with vectorized pandas
+operations instead of one Python object per log message. Text log files are
+split into their fields with a single regular expression pass per chunk,
+and the lines that do not match the log format string, such as the further
+lines of a multi-line message, are appended to the last field of the
+preceding log message. In every DataFrame, `iso_8601_time` and `asctime`
+are datetime64 columns, `loglevel` is an ordered categorical of the log
+levels, so that `frame[frame["loglevel"] >= "ERROR"]` works, and
+`loggername` is a categorical.
+
+With `chunksize`, a loader returns an iterator over DataFrames of at most
+that many rows, like `pandas.read_csv`, so log files larger than the memory
+can be processed. With `start_date` and `end_date`, a loader reads all log
+files of the handler whose date stamp lies in the range, including the
+numbered backups and the compressed archives, in chronological order.
+
+pandas is an optional dependency of the `analysis` extra and is imported by
+this module only.
+
+Example usage:
+
+    from loggingpython.analysis import load, load_log
+
+    # Load the log files of the last week of a file handler
+    frame = load_log(file_handler, start_date="2024-01-01",
+                     end_date="2024-01-07")
+    errors = frame[frame["loglevel"] >= "ERROR"]
+
+    # Count the log messages per logger in chunks of 100000 rows
+    for chunk in load("logs/app_2024-01-01.ndjson", chunksize=100_000):
+        print(chunk["loggername"].value_counts())
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import gzip
+import json
+import lzma
+import math
+import os
+import re
+import sqlite3
+from datetime import date, datetime
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TextIO
+from urllib.request import pathname2url
+
+try:
+    import pandas as pd
+except ImportError as e:
+    raise ImportError("loggingpython.analysis requires pandas, install it \
+with `pip install loggingpython[analysis]`") from e
+
+from .handler.csvhandler import CSVHandler
+from .handler.filehandler import FileHandler
+from .handler.handler import Handler
+from .handler.jsonhandler import JSONHandler
+from .handler.segmenthandler import SegmentHandler
+from .handler.sharedhandler import SharedHandler
+from .handler.sqlhandler import SQLHandler
+from .log_format import LogFormat
+from .log_levels import LogLevel
+from .log_reader import DEFAULT_LOGFORMAT
+from .log_record import LogRecord
+from .rotation import STAMP_PATTERN, name_of
+
+
+DEFAULT_CHUNKSIZE: int = 100_000
+LOGLEVELS: pd.CategoricalDtype = pd.CategoricalDtype(
+    [loglevel.value for loglevel in LogLevel], ordered=True)
+
+_SQL_COLUMNS: str = ", ".join(LogRecord.FIELDS)
+
+DateLike = date | datetime | str | None
+Source = str | Handler
+
+
+def load(source: Source,
+         start_date: DateLike = None,
+         end_date: DateLike = None,
+         chunksize: int | None = None,
+         **options) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """
+    Loads log files with the loader of their format, chosen by the handler
+    or by the file extension. The files of a `SegmentHandler` are loaded
+    with `segment_reader.read_dataframe`, which takes the keyword arguments
+    `columns`, `start`, `end` and `min_level` instead of the date range and
+    the chunk size.
+
+    Args:
+        source (str | Handler): The path of a log file, or the handler whose
+            log files are loaded.
+        start_date (date | datetime | str, optional): The first day whose
+            log files are loaded. Defaults to None.
+        end_date (date | datetime | str, optional): The last day whose log
+            files are loaded. Defaults to None.
+        chunksize (int, optional): The maximum number of rows per DataFrame.
+            Defaults to None, which returns a single DataFrame.
+        **options: Further keyword arguments for the loader.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The log messages, or an
+            iterator over chunks of them.
+
+    Raises:
+        ValueError: If the format of the log files is unknown.
+    """
+    handler = source.handler if isinstance(source, SharedHandler) else \
+        source
+    if isinstance(handler, (SegmentHandler, str)) and \
+            _extension(_current_file(handler)) in ("lpseg", "parquet"):
+        from .segment_reader import read_dataframe
+        return read_dataframe(source, **options)
+    loaders: dict[type | str, Callable] = {
+        FileHandler: load_log, "log": load_log,
+        CSVHandler: load_csv, "csv": load_csv,
+        JSONHandler: load_json, "json": load_json, "ndjson": load_json,
+        SQLHandler: load_sql, "db": load_sql,
+    }
+    loader = loaders.get(type(handler)) or \
+        loaders.get(_extension(_current_file(handler)))
+    if loader is None:
+        raise ValueError(f"Unknown log file format: {source!r}")
+    return loader(source, start_date=start_date, end_date=end_date,
+                  chunksize=chunksize, **options)
+
+
+def load_log(source: str | FileHandler | SharedHandler,
+             logformat_string: str | None = None,
+             time_format: str | None = None,
+             start_date: DateLike = None,
+             end_date: DateLike = None,
+             chunksize: int | None = None
+             ) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """
+    Loads the text log files of a `FileHandler`.
+
+    Args:
+        source (str | FileHandler | SharedHandler): The path of a log file,
+            or the handler whose log files are loaded.
+        logformat_string (str, optional): The format string the log files
+            were written with. Defaults to the format string of the
+            handler, or to the default format string of the FileHandler for
+            a path.
+        time_format (str, optional): The time format of `asctime`. Defaults
+            to None, which parses `asctime` as an ISO 8601 time.
+        start_date (date | datetime | str, optional): The first day whose
+            log files are loaded. Defaults to None.
+        end_date (date | datetime | str, optional): The last day whose log
+            files are loaded. Defaults to None.
+        chunksize (int, optional): The maximum number of rows per DataFrame.
+            Defaults to None, which returns a single DataFrame.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The log messages with one
+            column per field of the log format string, or an iterator over
+            chunks of them.
+
+    Raises:
+        InvalidLogFormatError: If the log format string references an
+            unknown field or contains an invalid placeholder.
+    """
+    handler = source.handler if isinstance(source, SharedHandler) else \
+        source
+    if isinstance(handler, FileHandler):
+        logformat_string = logformat_string or handler.logformat_string
+    logformat = LogFormat(logformat_string or DEFAULT_LOGFORMAT)
+    files = _files(source, start_date, end_date)
+    chunks = (_typed(chunk, time_format) for file in files
+              for chunk in _log_chunks(file, logformat,
+                                       chunksize or DEFAULT_CHUNKSIZE))
+    return _result(chunks, chunksize, list(dict.fromkeys(logformat.fields)))
+
+
+def load_csv(source: str | CSVHandler | SharedHandler,
+             time_format: str | None = None,
+             start_date: DateLike = None,
+             end_date: DateLike = None,
+             chunksize: int | None = None
+             ) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """
+    Loads the log files of a `CSVHandler`, with or without header rows.
+
+    Args:
+        source (str | CSVHandler | SharedHandler): The path of a log file,
+            or the handler whose log files are loaded.
+        time_format (str, optional): The time format of `asctime`. Defaults
+            to None, which parses `asctime` as an ISO 8601 time.
+        start_date (date | datetime | str, optional): The first day whose
+            log files are loaded. Defaults to None.
+        end_date (date | datetime | str, optional): The last day whose log
+            files are loaded. Defaults to None.
+        chunksize (int, optional): The maximum number of rows per DataFrame.
+            Defaults to None, which returns a single DataFrame.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The log messages, or an
+            iterator over chunks of them.
+    """
+    def chunks(file: str) -> Iterator[pd.DataFrame]:
+        with _open_text(file) as csv_file:
+            first = csv_file.readline()
+        if not first:
+            return
+        header = first.rstrip("\n") == ";".join(CSVHandler.COLUMNS)
+        reader = pd.read_csv(file, sep=";", quotechar='"',
+                             names=list(CSVHandler.COLUMNS),
+                             header=0 if header else None, dtype=str,
+                             keep_default_na=False, na_filter=False,
+                             chunksize=chunksize or DEFAULT_CHUNKSIZE)
+        with reader:
+            yield from reader
+
+    files = _files(source, start_date, end_date)
+    return _result((_typed(chunk, time_format) for file in files
+                    for chunk in chunks(file)),
+                   chunksize, list(CSVHandler.COLUMNS))
+
+
+def load_json(source: str | JSONHandler | SharedHandler,
+              time_format: str | None = None,
+              start_date: DateLike = None,
+              end_date: DateLike = None,
+              chunksize: int | None = None
+              ) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """
+    Loads the log files of a `JSONHandler` as a document, as NDJSON or as a
+    streamed array. NDJSON files and streamed arrays are read line by line,
+    so a line torn by a crash is skipped. A document is loaded as a whole
+    and then split into chunks.
+
+    Args:
+        source (str | JSONHandler | SharedHandler): The path of a log file,
+            or the handler whose log files are loaded.
+        time_format (str, optional): The time format of `asctime`. Defaults
+            to None, which parses `asctime` as an ISO 8601 time.
+        start_date (date | datetime | str, optional): The first day whose
+            log files are loaded. Defaults to None.
+        end_date (date | datetime | str, optional): The last day whose log
+            files are loaded. Defaults to None.
+        chunksize (int, optional): The maximum number of rows per DataFrame.
+            Defaults to None, which returns a single DataFrame.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The log messages with one
+            column per key of the JSON objects, or an iterator over chunks
+            of them.
+    """
+    size = chunksize or DEFAULT_CHUNKSIZE
+    files = _files(source, start_date, end_date)
+    records = (record for file in files for record in _json_records(file))
+    chunks = (pd.DataFrame.from_records(batch)
+              for batch in iter(lambda: list(islice(records, size)), []))
+    return _result((_typed(chunk, time_format) for chunk in chunks),
+                   chunksize, list(LogRecord.FIELDS))
+
+
+def load_sql(source: str | SQLHandler | SharedHandler,
+             time_format: str | None = None,
+             start_date: DateLike = None,
+             end_date: DateLike = None,
+             chunksize: int | None = None
+             ) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """
+    Loads the log databases of a `SQLHandler`. The databases are opened read
+    only, so they can be loaded while the handler writes to them.
+
+    Args:
+        source (str | SQLHandler | SharedHandler): The path of a log
+            database, or the handler whose log databases are loaded.
+        time_format (str, optional): The time format of `asctime`. Defaults
+            to None, which parses `asctime` as an ISO 8601 time.
+        start_date (date | datetime | str, optional): The first day whose
+            log databases are loaded. Defaults to None.
+        end_date (date | datetime | str, optional): The last day whose log
+            databases are loaded. Defaults to None.
+        chunksize (int, optional): The maximum number of rows per DataFrame.
+            Defaults to None, which returns a single DataFrame.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The log messages in the order
+            they were inserted, or an iterator over chunks of them.
+    """
+    def chunks(file: str) -> Iterator[pd.DataFrame]:
+        connection = sqlite3.connect(
+            f"file:{pathname2url(os.path.abspath(file))}?mode=ro", uri=True)
+        try:
+            yield from pd.read_sql_query(
+                f"SELECT {_SQL_COLUMNS} FROM logs ORDER BY rowid",
+                connection, chunksize=chunksize or DEFAULT_CHUNKSIZE)
+        finally:
+            connection.close()
+
+    files = [file for file in _files(source, start_date, end_date)
+             if not file.endswith((".gz", ".xz"))]
+    return _result((_typed(chunk, time_format) for file in files
+                    for chunk in chunks(file)),
+                   chunksize, list(LogRecord.FIELDS))
+
+
+def _log_chunks(file: str, logformat: LogFormat,
+                chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Parses a text log file in chunks of lines.
+
+    The lines of the last log message of a chunk are carried over to the
+    next chunk, so that a multi-line message is never split.
+
+    Args:
+        file (str): The path of the log file.
+        logformat (LogFormat): The log format the file was written with.
+        chunksize (int): The number of lines parsed at once.
+
+    Yields:
+        pd.DataFrame: The parsed log messages.
+    """
+    if not logformat.fields:
+        return
+    last = logformat.fields[-1]
+    pending: list[str] = []
+    # Only "\n" ends a log message; a "\r" belongs to the message.
+    with _open_text(file, newline="\n") as log_file:
+        while True:
+            lines = list(islice(log_file, chunksize))
+            at_end = len(lines) < chunksize
+            lines = pending + lines
+            pending = []
+            if not lines:
+                return
+            series = pd.Series(lines, dtype=object).str.removesuffix("\n")
+            fields = logformat.parse_lines(series)
+            matched = fields[logformat.fields[0]].notna().to_numpy()
+            starts = matched.nonzero()[0]
+            if not at_end and len(starts) and starts[-1] > 0:
+                cut = starts[-1]
+                pending = lines[cut:]
+                series = series.iloc[:cut]
+                fields = fields.iloc[:cut]
+                matched = matched[:cut]
+            if len(starts):
+                yield _join_continuations(series, fields, matched, last)
+            if at_end and not pending:
+                return
+
+
+def _join_continuations(series: pd.Series, fields: pd.DataFrame,
+                        matched, last: str) -> pd.DataFrame:
+    """
+    Appends the lines that do not match the log format string to the last
+    field of the preceding log message. Lines before the first log message
+    are dropped.
+
+    Args:
+        series (pd.Series): The lines.
+        fields (pd.DataFrame): The parsed fields of the lines.
+        matched (numpy.ndarray): Whether each line matched the log format
+            string.
+        last (str): The field the continuation lines are appended to.
+
+    Returns:
+        pd.DataFrame: One row per log message.
+    """
+    records = fields[matched].reset_index(drop=True)
+    if matched.all():
+        return records
+    group = matched.cumsum()
+    inside = group > 0
+    text = fields[last].where(matched, series)[inside]
+    records[last] = text.groupby(group[inside]).agg("\n".join).to_numpy()
+    return records
+
+
+def _json_records(file: str) -> Iterator[dict]:
+    """
+    Reads the log messages of a log file of a `JSONHandler`.
+
+    Args:
+        file (str): The path of the log file.
+
+    Yields:
+        dict: The log messages.
+    """
+    with _open_text(file) as json_file:
+        first = json_file.readline()
+        if first.startswith("{") and not first.rstrip().endswith("}"):
+            # A document: the object of all log messages, keyed by hashes.
+            json_file.seek(0)
+            for entry in json.load(json_file).values():
+                yield from entry.values()
+            return
+        for line in _chain_first(first, json_file):
+            line = line.strip().rstrip(",")
+            if not line.startswith("{"):
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def _chain_first(first: str, lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yields the already read first line and then the remaining lines.
+    """
+    yield first
+    yield from lines
+
+
+def _typed(frame: pd.DataFrame, time_format: str | None) -> pd.DataFrame:
+    """
+    Converts the timestamps into datetime64 columns, the log levels into an
+    ordered categorical and the logger names into a categorical.
+
+    Args:
+        frame (pd.DataFrame): The log messages as strings.
+        time_format (str | None): The time format of `asctime`, or None for
+            an ISO 8601 time.
+
+    Returns:
+        pd.DataFrame: The log messages with typed columns.
+    """
+    if "iso_8601_time" in frame:
+        frame["iso_8601_time"] = pd.to_datetime(
+            frame["iso_8601_time"], format="ISO8601", utc=True,
+            errors="coerce")
+    if "asctime" in frame:
+        frame["asctime"] = pd.to_datetime(
+            frame["asctime"], format=time_format or "ISO8601",
+            utc=time_format is None, errors="coerce")
+    if "loglevel" in frame:
+        frame["loglevel"] = frame["loglevel"].astype(LOGLEVELS)
+    if "loggername" in frame:
+        frame["loggername"] = frame["loggername"].astype("category")
+    return frame
+
+
+def _result(chunks: Iterator[pd.DataFrame], chunksize: int | None,
+            columns: list[str]) -> "pd.DataFrame | Iterator[pd.DataFrame]":
+    """
+    Returns the chunks themselves with a chunk size, and otherwise a single
+    DataFrame of all chunks.
+
+    Args:
+        chunks (Iterator[pd.DataFrame]): The chunks of the log messages.
+        chunksize (int | None): The chunk size requested by the caller.
+        columns (list[str]): The columns of an empty result.
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: The chunks or the DataFrame.
+    """
+    if chunksize is not None:
+        return chunks
+    frames = list(chunks)
+    if not frames:
+        return _typed(pd.DataFrame(columns=columns, dtype=object), None)
+    frame = pd.concat(frames, ignore_index=True)
+    if len(frames) > 1:
+        # Categoricals with different categories are concatenated as
+        # objects.
+        if "loglevel" in frame:
+            frame["loglevel"] = frame["loglevel"].astype(LOGLEVELS)
+        if "loggername" in frame:
+            frame["loggername"] = frame["loggername"].astype("category")
+    return frame
+
+
+def _files(source: Source, start_date: DateLike,
+           end_date: DateLike) -> list[str]:
+    """
+    Returns the log files to be loaded in chronological order.
+
+    Without a date range, this is the log file given by its path or the
+    current log file of the handler. With a date range, it is every log file
+    of the same name in the same directory whose date stamp lies in the
+    range, with the numbered backups of a day before its current log file.
+    The backups are ordered from the highest number down, as numbered by a
+    handler without an archiver, and from the lowest number up for a
+    handler with an archiver, which never renumbers its backups.
+
+    Args:
+        source (str | Handler): The path of a log file or a handler.
+        start_date (date | datetime | str | None): The first day.
+        end_date (date | datetime | str | None): The last day.
+
+    Returns:
+        list[str]: The paths of the log files.
+    """
+    if isinstance(source, SharedHandler):
+        source = source.handler
+    current = _current_file(source)
+    if start_date is None and end_date is None:
+        return [current]
+    if isinstance(source, str):
+        directory, name = os.path.dirname(source), name_of(source)
+    else:
+        directory, name = source.path, source.name
+    rotation = getattr(source, "_rotation", None)
+    ascending = rotation is not None and rotation.archiver is not None
+    first = _to_date(start_date) or date.min
+    last = _to_date(end_date) or date.max
+    pattern = re.compile(rf"{re.escape(name)}_{STAMP_PATTERN}\."
+                         rf"{re.escape(_extension(current))}"
+                         rf"(?:\.(?P<number>\d+))?(?:\.gz|\.xz)?")
+    files = []
+    for filename in os.listdir(directory or "."):
+        match = pattern.fullmatch(filename)
+        if match is None:
+            continue
+        day = date.fromisoformat(match["date"])
+        if first <= day <= last:
+            number = int(match["number"] or 0)
+            if ascending:
+                order = number or math.inf
+            else:
+                order = -number
+            files.append(((filename[:match.end("date")],
+                           filename[match.end("date"):].split(".")[0],
+                           order),
+                          os.path.join(directory, filename)))
+    return [file for _, file in sorted(files)]
+
+
+def _current_file(source: Source) -> str:
+    """
+    Returns the path of a log file, or of the current log file of a handler.
+    """
+    if isinstance(source, SharedHandler):
+        source = source.handler
+    if isinstance(source, str):
+        return source
+    return getattr(source.file, "name", source.file)
+
+
+def _extension(file: str) -> str:
+    """
+    Returns the extension of a log file without numbered backup and
+    compression suffixes.
+    """
+    parts = os.path.basename(file).split(".")
+    while len(parts) > 2 and (parts[-1].isdigit() or
+                              parts[-1] in ("gz", "xz")):
+        parts.pop()
+    return parts[-1] if len(parts) > 1 else ""
+
+
+def _to_date(value: DateLike) -> date | None:
+    """
+    Converts a date, a datetime or an ISO date string into a date.
+    """
+    if value is None or type(value) is date:
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    return date.fromisoformat(value)
+
+
+def _open_text(file: str, newline: str | None = None) -> TextIO:
+    """
+    Opens a log file for reading as text, decompressing archived log files.
+    """
+    if file.endswith(".gz"):
+        return gzip.open(file, "rt", encoding="utf-8", newline=newline)
+    if file.endswith(".xz"):
+        return lzma.open(file, "rt", encoding="utf-8", newline=newline)
+    return open(file, "r", encoding="utf-8", newline=newline)
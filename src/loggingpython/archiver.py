@@ -0,0 +1,280 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `Archiver` class, the post-rotation pipeline of the
+`loggingpython` package. File-based handlers that are given an `Archiver`
+hand every log file they have rotated to it, and the archiver compresses the
+file and enforces the retention rules on a background thread, so that the
+logging thread never waits for compression or for deleting old files.
+
+Rotated log files are compressed with gzip or lzma from the standard
+library. Retention can limit the age of the rotated log files, their number
+and their total size in bytes; the oldest files are deleted first and the
+log file a handler is currently writing to is never touched. The archiver
+counts the compressed, deleted and failed files and exposes the depth of its
+queue and the file it is working on, so its progress can be monitored. One
+archiver can be shared by several handlers.
+
+Example usage:
+
+    from datetime import timedelta
+
+    from loggingpython import Archiver, Compression, FileHandler
+
+    archiver = Archiver(Compression.GZIP, max_age=timedelta(days=30),
+                        max_files=20, max_bytes=1_000_000_000)
+    file_handler = FileHandler("app", archiver=archiver)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import gzip
+import lzma
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from .compression import Compression
+from .lifecycle import register_for_shutdown, unregister_for_shutdown
+
+if TYPE_CHECKING:
+    from .rotation import Rotation
+
+
+_STOP: object = object()
+_OPENERS: dict = {
+    Compression.GZIP: gzip.open,
+    Compression.LZMA: lzma.open,
+}
+
+
+class Archiver:
+    """
+    `loggingpython`
+
+    A class for compressing rotated log files and deleting old ones on a
+    background thread.
+
+    This class takes rotated log files from an unbounded queue, so handing a
+    file over never blocks the logging thread. The worker thread compresses
+    each file to a temporary file next to it, renames that to the final name
+    and deletes the uncompressed file. Afterwards it applies the retention
+    rules to all rotated log files of the handler the file came from.
+    Failures are counted in `failed` and printed to stderr.
+    """
+
+    def __init__(self,
+                 compression: Compression | None = Compression.GZIP,
+                 max_age: timedelta | None = None,
+                 max_files: int | None = None,
+                 max_bytes: int | None = None,
+                 shutdown_timeout: float = 30.0) -> None:
+        """
+        Initializes the Archiver and starts its worker thread.
+
+        Args:
+            compression (Compression | None, optional): The compression format
+                of the rotated log files. Defaults to Compression.GZIP. None
+                only applies the retention rules.
+            max_age (timedelta, optional): The maximum age of a rotated log
+                file, measured from its last modification. Defaults to None,
+                which keeps files of any age.
+            max_files (int, optional): The maximum number of rotated log
+                files per handler. Defaults to None, which means no limit.
+            max_bytes (int, optional): The maximum total size in bytes of the
+                rotated log files per handler. Defaults to None, which means
+                no limit.
+            shutdown_timeout (float, optional): The maximum number of seconds
+                `close()` waits for the queued files. Defaults to 30.0.
+        """
+        self.compression: Compression | None = compression
+        self.max_age: timedelta | None = max_age
+        self.max_files: int | None = max_files
+        self.max_bytes: int | None = max_bytes
+        self.shutdown_timeout: float = shutdown_timeout
+
+        self.compressed: int = 0
+        self.deleted: int = 0
+        self.failed: int = 0
+        self.current: str | None = None
+        self.closed: bool = False
+
+        self.queue: queue.Queue = queue.Queue()
+        self._worker: threading.Thread = threading.Thread(
+            target=self._work, name="loggingpython-Archiver", daemon=True)
+        self._worker.start()
+        register_for_shutdown(self)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of rotated log files that wait for the worker thread.
+        """
+        return self.queue.qsize()
+
+    def submit(self, file: str, rotation: "Rotation") -> None:
+        """
+        Hands a rotated log file over to the worker thread without blocking.
+
+        Args:
+            file (str): The path of the rotated log file.
+            rotation (Rotation): The rotation engine of the handler, which
+                knows the other log files of the handler.
+        """
+        if not self.closed:
+            self.queue.put_nowait((file, rotation))
+
+    def _work(self) -> None:
+        """
+        Compresses the queued log files and applies the retention rules
+        until the archiver is closed.
+        """
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                file, rotation = item
+                self.current = file
+                if self.compression is not None:
+                    self._compress(file)
+                self._apply_retention(rotation)
+            except Exception as e:
+                self.failed += 1
+                print(f"{self!r} failed to archive {item[0]}: {e}",
+                      file=sys.stderr)
+            finally:
+                self.current = None
+                self.queue.task_done()
+
+    def _compress(self, file: str) -> None:
+        """
+        Compresses a log file and deletes the uncompressed file.
+
+        Args:
+            file (str): The path of the log file.
+        """
+        target = f"{file}.{self.compression.value}"
+        temporary = f"{target}.tmp"
+        with open(file, "rb") as source, \
+                _OPENERS[self.compression](temporary, "wb") as destination:
+            shutil.copyfileobj(source, destination, 1024 * 1024)
+        os.replace(temporary, target)
+        os.remove(file)
+        self.compressed += 1
+
+    def _apply_retention(self, rotation: "Rotation") -> None:
+        """
+        Deletes the oldest rotated log files of a handler until all
+        retention rules are met.
+
+        Args:
+            rotation (Rotation): The rotation engine of the handler.
+        """
+        if self.max_age is None and self.max_files is None and \
+                self.max_bytes is None:
+            return
+        files = []
+        for file in rotation.rotated_files():
+            try:
+                stat = os.stat(file)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file))
+        files.sort()
+
+        oldest_allowed = -1.0 if self.max_age is None else \
+            time.time() - self.max_age.total_seconds()
+        total_bytes = sum(size for _, size, _ in files)
+        for index, (mtime, size, file) in enumerate(files):
+            remaining = len(files) - index
+            if mtime >= oldest_allowed and \
+                    (self.max_files is None or remaining <= self.max_files) \
+                    and (self.max_bytes is None or
+                         total_bytes <= self.max_bytes):
+                break
+            os.remove(file)
+            self.deleted += 1
+            total_bytes -= size
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all queued log files have been archived.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+                Defaults to None, which waits until the queue is drained.
+
+        Returns:
+            bool: True if the queue was drained in time, False otherwise.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                if deadline is None:
+                    self.queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Archives the queued log files and stops the worker thread.
+
+        Log files handed over after the archiver has been closed are left
+        uncompressed.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+                Defaults to `shutdown_timeout`.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if timeout is None:
+            timeout = self.shutdown_timeout
+        self.queue.put(_STOP)
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            print(f"{self!r} could not archive {self.queue_depth} queued log \
+files within {timeout} seconds", file=sys.stderr)
+        unregister_for_shutdown(self)
+
+    def __repr__(self) -> str:
+        return f"Archiver({self.compression}, {self.max_age}, \
+{self.max_files}, {self.max_bytes})"
+
+    def __str__(self) -> str:
+        return f"Archiver with: {self.compression}, {self.max_age}, \
+{self.max_files} and {self.max_bytes}"
@@ -0,0 +1,343 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `AsyncLogger` class, a variant of the `Logger` class
+of the `loggingpython` package for applications that run on an asyncio event
+loop. The level methods of the `AsyncLogger` never block the event loop: they
+create the log record, put it into a bounded in-memory queue and return. A
+background task on the event loop takes the records from the queue and hands
+them to the handlers.
+
+Handlers derived from `AsyncHandler` are awaited directly, so network
+delivery can use asyncio streams. Plain handlers, such as the `FileHandler`
+or the `SQLHandler`, are run in a thread pool executor, which keeps disk
+writes and database connections away from the event loop. Wrapping them in
+an `ExecutorHandler` gives each of them a dedicated thread.
+
+Example usage:
+
+    import asyncio
+
+    from loggingpython import AsyncLogger
+    from loggingpython.handler import (
+        AsyncSysHandler, ExecutorHandler, FileHandler)
+
+    async def main():
+        logger = AsyncLogger('my_service')
+        logger.addHandler(ExecutorHandler(FileHandler('my_service')))
+        logger.addHandler(AsyncSysHandler(port=8080))
+
+        # Returns immediately, the record is written in the background
+        logger.info('This is an informational message.')
+
+        # Wait until everything is written and release the handlers
+        await logger.aclose()
+
+    asyncio.run(main())
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import asyncio
+import sys
+import threading
+from typing import Sequence
+
+from .logger import Logger
+from .log_levels import LogLevel
+from .log_record import LogRecord
+from .overflow_policy import OverflowPolicy
+from .handler import Handler
+from .handler.asynchandler import AsyncHandler
+
+
+class AsyncLogger(Logger):
+    """
+    `loggingpython`
+
+    A logger whose level methods do not block the asyncio event loop.
+
+    This class inherits from the Logger class. Instead of calling the
+    handlers, the level methods put the log records into a bounded queue.
+    A worker task on the event loop takes the records from the queue in
+    batches and passes every batch to all handlers concurrently: async
+    handlers are awaited, plain handlers are run in an executor. Log calls
+    from other threads are handed to the event loop thread-safely. Records
+    logged before an event loop is running are kept in the queue until the
+    worker is started by the first log call on a running loop or by
+    `aflush()`. The number of records lost to the overflow policy is counted
+    in `dropped`.
+    """
+
+    def __init__(self, name: str,
+                 time_format: str | None = None,
+                 min_loglevel: LogLevel = LogLevel.INFO,
+                 max_loglevel: LogLevel = LogLevel.CRITICAL,
+                 maxsize: int = 10000,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+                 batch_size: int = 100) -> None:
+        """
+        Initializes the AsyncLogger.
+
+        Args:
+            name (str): The name of the logger.
+            time_format (str, optional): The format string for the log
+                timestamps. Defaults to None, which uses the ISO 8601 format.
+            min_loglevel (LogLevel, optional): The minimum log level. Defaults
+                to LogLevel.INFO.
+            max_loglevel (LogLevel, optional): The maximum log level. Defaults
+                to LogLevel.CRITICAL.
+            maxsize (int, optional): The maximum number of queued log
+                records. Defaults to 10000.
+            overflow_policy (OverflowPolicy, optional): Which log record to
+                drop when the queue is full. Defaults to
+                OverflowPolicy.DROP_OLDEST.
+            batch_size (int, optional): The maximum number of queued log
+                records passed to the handlers at once. Defaults to 100.
+
+        Raises:
+            ValueError: If the overflow policy is OverflowPolicy.BLOCK, which
+                would stall the event loop the logger must not block.
+        """
+        if overflow_policy is OverflowPolicy.BLOCK:
+            raise ValueError("AsyncLogger cannot block the event loop, use \
+OverflowPolicy.DROP_NEWEST or OverflowPolicy.DROP_OLDEST")
+        super().__init__(name, time_format, min_loglevel, max_loglevel)
+        self.maxsize: int = maxsize
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self.batch_size: int = batch_size
+        self.dropped: int = 0
+        self.closed: bool = False
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of log records that are currently queued.
+        """
+        return self._queue.qsize()
+
+    def _handle(self, record: LogRecord) -> None:
+        """
+        Queues a log record for the handlers.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        self._submit((record,))
+
+    def _handle_batch(self, records: list[LogRecord]) -> None:
+        """
+        Queues a batch of log records for the handlers.
+
+        Args:
+            records (list[LogRecord]): The log records to be processed.
+        """
+        self._submit(records)
+
+    def _submit(self, records: Sequence[LogRecord]) -> None:
+        """
+        Puts log records into the queue from the event loop thread.
+
+        Log calls on the thread of the running worker are queued directly.
+        Otherwise the worker is started on the running event loop of the
+        calling thread, or the records are handed to the event loop of the
+        worker if it runs in another thread.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be queued.
+        """
+        if threading.get_ident() == self._loop_thread and \
+                not self._worker.done():
+            self._enqueue(records)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._start(loop)
+            self._enqueue(records)
+        elif self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._enqueue, records)
+        else:
+            self._enqueue(records)
+
+    def _enqueue(self, records: Sequence[LogRecord]) -> None:
+        """
+        Puts log records into the queue according to the overflow policy.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be queued.
+        """
+        queue = self._queue
+        for record in records:
+            if self.closed:
+                self.dropped += 1
+                continue
+            try:
+                queue.put_nowait(record)
+                continue
+            except asyncio.QueueFull:
+                self.dropped += 1
+            if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                queue.get_nowait()
+                queue.task_done()
+                queue.put_nowait(record)
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Starts the worker task on the given event loop unless it is already
+        running.
+
+        A queue that was used on an event loop that has finished since is
+        replaced by a new one, which takes over the queued log records.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+        """
+        if self._worker is not None and not self._worker.done():
+            return
+        if self._loop is not None and self._loop is not loop:
+            queue = asyncio.Queue(self.maxsize)
+            while not self._queue.empty():
+                queue.put_nowait(self._queue.get_nowait())
+            self._queue = queue
+        self._loop = loop
+        self._loop_thread = threading.get_ident()
+        self._worker = loop.create_task(self._work())
+
+    async def _work(self) -> None:
+        """
+        Takes the log records from the queue and passes them to the handlers
+        in batches until the worker is cancelled.
+        """
+        queue = self._queue
+        while True:
+            records = [await queue.get()]
+            while len(records) < self.batch_size:
+                try:
+                    records.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._emit_batch(records)
+            finally:
+                for _ in records:
+                    queue.task_done()
+
+    async def _emit_batch(self, records: list[LogRecord]) -> None:
+        """
+        Passes a batch of log records to all handlers concurrently.
+
+        Args:
+            records (list[LogRecord]): The log records to be emitted.
+        """
+        handlers = list(self.handlers)
+        calls = []
+        for handler in handlers:
+            if isinstance(handler, AsyncHandler):
+                if len(records) == 1:
+                    calls.append(handler.aemit(records[0]))
+                else:
+                    calls.append(handler.aemit_batch(records))
+            elif len(records) == 1:
+                calls.append(self._run_in_executor(handler.emit, records[0]))
+            else:
+                calls.append(self._run_in_executor(handler.emit_batch,
+                                                   records))
+        await self._gather(handlers, calls)
+
+    async def _run_in_executor(self, method, *args) -> None:
+        """
+        Runs a method of a plain handler in the default executor.
+
+        Args:
+            method (callable): The bound method of the handler.
+            *args: The arguments for the method.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    async def _gather(self, handlers: list[Handler], calls: list) -> None:
+        """
+        Awaits handler calls concurrently and reports their errors without
+        stopping the worker.
+
+        Args:
+            handlers (list[Handler]): The handlers in the order of the calls.
+            calls (list): The awaitables of the handler calls.
+        """
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                print(f"{handler!r} failed: {result}", file=sys.stderr)
+
+    async def aflush(self) -> None:
+        """
+        Waits until all queued log records have been passed to the handlers
+        and flushes the handlers.
+        """
+        self._start(asyncio.get_running_loop())
+        await self._queue.join()
+        handlers = list(self.handlers)
+        await self._gather(handlers, [
+            handler.aflush() if isinstance(handler, AsyncHandler)
+            else self._run_in_executor(handler.flush)
+            for handler in handlers])
+
+    async def aclose(self) -> None:
+        """
+        Flushes the queued log records, stops the worker and closes the
+        handlers.
+
+        Log records logged after the logger has been closed are dropped.
+        """
+        if self.closed:
+            return
+        await self.aflush()
+        self.closed = True
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        handlers = list(self.handlers)
+        await self._gather(handlers, [
+            handler.aclose() if isinstance(handler, AsyncHandler)
+            else self._run_in_executor(handler.close)
+            for handler in handlers])
+
+    def __repr__(self) -> str:
+        return f"AsyncLogger({self.name}, {self.min_loglevel}, \
+{self.max_loglevel}, {self.maxsize}, {self.overflow_policy})"
+
+    def __str__(self) -> str:
+        return f"AsyncLogger with: {self.name}, {self.min_loglevel}, \
+{self.max_loglevel}, {self.maxsize} and {self.overflow_policy}"
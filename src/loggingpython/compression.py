@@ -0,0 +1,61 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `Compression` class, an enumeration of the
+compression formats the `Archiver` of the `loggingpython` package can apply
+to rotated log files. Both formats are provided by the standard library.
+
+The `Compression` class includes two members: GZIP and LZMA. The value of
+each member is the file extension that is appended to the name of a
+compressed log file.
+
+Example usage:
+
+    from loggingpython import Archiver, Compression, FileHandler
+
+    # Compress rotated log files with lzma
+    file_handler = FileHandler("app",
+                               archiver=Archiver(Compression.LZMA))
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from enum import Enum
+
+
+class Compression(Enum):
+    """
+    `loggingpython`
+
+    Enum class that represents the compression formats of rotated log files.
+
+    This class defines two enum members: GZIP and LZMA. GZIP compresses fast
+    and produces `.gz` files, LZMA compresses slower but smaller and produces
+    `.xz` files.
+    """
+
+    GZIP = "gz"
+    LZMA = "xz"
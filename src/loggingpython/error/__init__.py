@@ -53,6 +53,7 @@ from .server_unreachable_error import ServerUnreachableError
 from .server_method_call_error import ServerMethodCallError
 from .client_method_call_error import ClientMethodCallError
 from .invalid_log_level_error import InvalidLogLevelError
+from .invalid_log_format_error import InvalidLogFormatError
 from .invalid_handler_method_error import InvalidHandlerMethodError
 from .handler_not_found_error import HandlerNotFoundError
 
@@ -61,6 +62,7 @@ __all__ = [
     "ServerMethodCallError",
     "ClientMethodCallError",
     "InvalidLogLevelError",
+    "InvalidLogFormatError",
     "InvalidHandlerMethodError",
     "HandlerNotFoundError"
     ]
@@ -46,7 +46,10 @@ comprehensive logging solution for Python applications, including error
 handling and logging mechanisms for both client and server-side operations.
 """
 
-from ..handler.handler import Handler
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..handler.handler import Handler
 
 
 class InvalidHandlerMethodError(TypeError):
@@ -58,7 +61,7 @@ class InvalidHandlerMethodError(TypeError):
     implement the 'emit' method, which is necessary for processing log
     messages.
     """
-    def __init__(self, handler: Handler):
+    def __init__(self, handler: "Handler"):
         message: str = f"Handler '{handler.__class__.__name__}' must have an \
 'emit' method"
         super().__init__(message)
@@ -62,6 +62,15 @@ from .jsonhandler import JSONHandler
 from .sqlhandler import SQLHandler
 from .csvhandler import CSVHandler
 from .syshandler import SysHandler
+from .queuehandler import QueueHandler
+from .asynchandler import AsyncHandler
+from .executorhandler import ExecutorHandler
+from .asyncsyshandler import AsyncSysHandler
+from .processhandler import ProcessHandler
+from .ringbufferhandler import RingBufferHandler
+from .sharedhandler import SharedHandler
+from .deduphandler import DedupHandler
+from .segmenthandler import SegmentHandler
 
 
 __all__ = ["Handler",
@@ -70,4 +79,13 @@ __all__ = ["Handler",
            "JSONHandler",
            "SQLHandler",
            "CSVHandler",
-           "SysHandler"]
+           "SysHandler",
+           "QueueHandler",
+           "AsyncHandler",
+           "ExecutorHandler",
+           "AsyncSysHandler",
+           "ProcessHandler",
+           "RingBufferHandler",
+           "SharedHandler",
+           "DedupHandler",
+           "SegmentHandler"]
@@ -0,0 +1,109 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `AsyncHandler` class, the base class for handlers of
+the `loggingpython` package that deliver log messages without blocking an
+asyncio event loop. Async handlers are used together with the `AsyncLogger`,
+which hands its log records to them from a background task.
+
+The `AsyncHandler` class provides awaitable counterparts of the handler
+interface: `aemit`, `aemit_batch`, `aflush` and `aclose`. Subclasses must
+implement `aemit` and can override the other methods if they can deliver a
+batch of log records more efficiently or hold resources that need to be
+released.
+
+Example usage:
+
+    from loggingpython.handler import AsyncHandler
+
+    class CustomAsyncHandler(AsyncHandler):
+        async def aemit(self, record):
+            # Custom non-blocking handling logic here
+            await some_client.send(record["message"])
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from typing import Sequence
+
+from .handler import Handler
+from ..log_record import LogRecord
+
+
+class AsyncHandler(Handler):
+    """
+    `loggingpython`
+
+    Base class for all async handlers.
+
+    This class defines the awaitable interface for handlers that are used by
+    an `AsyncLogger`. Subclasses must implement the aemit method to provide
+    specific handling behavior.
+    """
+
+    async def aemit(self, record: LogRecord) -> None:
+        """
+        Emits a log message without blocking the event loop.
+
+        This method is intended to be overridden by subclasses. The base
+        class raises a NotImplementedError to indicate that subclasses must
+        implement this method.
+
+        Parameters:
+        - record (LogRecord): The log record to be processed.
+
+        Raises:
+        - NotImplementedError: If the method is not implemented by a subclass.
+        """
+        raise NotImplementedError("Subclasses must implement this!")
+
+    async def aemit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Emits several log messages without blocking the event loop.
+
+        The base class awaits `aemit` for one record after another.
+
+        Parameters:
+        - records (Sequence[LogRecord]): The log records to be processed.
+        """
+        for record in records:
+            await self.aemit(record)
+
+    async def aflush(self) -> None:
+        """
+        Writes out any log messages the handler has buffered.
+        """
+
+    async def aclose(self) -> None:
+        """
+        Releases the resources held by the handler.
+        """
+
+    def __repr__(self) -> str:
+        return "AsyncHandler()"
+
+    def __str__(self) -> str:
+        return "AsyncHandler Base class"
@@ -0,0 +1,185 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `AsyncSysHandler` class, a component of the
+`loggingpython` package that sends log messages to a `SysHandler` server
+without blocking an asyncio event loop. The `AsyncSysHandler` class is a
+concrete implementation of the `AsyncHandler` class that uses asyncio
+streams for TCP and an asyncio datagram transport for UDP.
+
+The messages are sent in the same JSON format as by a `SysHandler` client,
+so an `AsyncSysHandler` can log to an existing `SysHandler` server. Over TCP
+the handler waits for the acknowledgement of the server after every message,
+just like the `SysHandler` client, but only the sending coroutine waits while
+the event loop keeps running. The connection is established on the first
+message or by awaiting `connect()`.
+
+Example usage:
+
+    from loggingpython import AsyncLogger, SysProtocolls
+    from loggingpython.handler import AsyncSysHandler
+
+    # Send the log messages to a SysHandler server over TCP
+    logger = AsyncLogger('my_service')
+    logger.addHandler(AsyncSysHandler(name="client",
+                                      protocoll=SysProtocolls.TCP))
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import asyncio
+
+from .asynchandler import AsyncHandler
+from ..json_encoder import JSONEncoder
+from ..log_record import LogRecord
+from ..sys_protocolls import SysProtocolls
+from ..error.server_unreachable_error import ServerUnreachableError
+
+
+class AsyncSysHandler(AsyncHandler):
+    """
+    `loggingpython`
+
+    A class for sending log messages to a log server with asyncio.
+
+    This class inherits from the AsyncHandler class and is the asyncio
+    counterpart of a `SysHandler` in client mode. It encodes every log record
+    as JSON together with the name of the client and sends it to the server
+    over TCP or UDP.
+    """
+
+    def __init__(self,
+                 name: str = "client",
+                 protocoll: SysProtocolls = SysProtocolls.TCP,
+                 server_name: str = "localhost",
+                 port: int = 8080) -> None:
+        """
+        Initializes an AsyncSysHandler instance.
+
+        Args:
+            name (str): The name of the client. Default is "client".
+            protocoll (SysProtocolls): The protocol to use (TCP or UDP).
+                Default is TCP.
+            server_name (str): The name of the server. Default is "localhost".
+            port (int): The port number. Default is 8080.
+        """
+        self.name = name
+        self._encoder: JSONEncoder = JSONEncoder({"client_name": name})
+        self.protocoll = protocoll
+        self.server_name = server_name
+        self.port = port
+        self.server_addr = (self.server_name, self.port)
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+
+    @property
+    def connected(self) -> bool:
+        """
+        Whether the handler has established its connection to the server.
+        """
+        return self._writer is not None or self._transport is not None
+
+    async def connect(self) -> None:
+        """
+        Establishes the connection to the server.
+
+        Raises:
+            ServerUnreachableError: If the TCP connection to the server cannot
+                be established.
+        """
+        if self.connected:
+            return
+        loop = asyncio.get_running_loop()
+        if self.protocoll == SysProtocolls.TCP:
+            try:
+                self._reader, self._writer = await asyncio.open_connection(
+                    self.server_name, self.port)
+            except OSError:
+                raise ServerUnreachableError(servername=self.server_name,
+                                             port=self.port)
+        else:
+            self._transport, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=self.server_addr)
+
+    def _encode(self, record: LogRecord) -> bytes:
+        """
+        Encodes a log record the way a `SysHandler` client does.
+
+        Args:
+            record (LogRecord): The log record to be encoded.
+
+        Returns:
+            bytes: The JSON encoded log record.
+        """
+        return self._encoder.encode(record)
+
+    async def aemit(self, record: LogRecord) -> None:
+        """
+        Sends a log message to the server.
+
+        Over TCP the method returns after the server has acknowledged the
+        message.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+
+        Raises:
+            ServerUnreachableError: If the TCP connection to the server cannot
+                be established.
+        """
+        await self.connect()
+        message_bytes = self._encode(record)
+        if self._writer is not None:
+            self._writer.write(message_bytes)
+            await self._writer.drain()
+            await self._reader.read(1024)
+        else:
+            self._transport.sendto(message_bytes)
+
+    async def aclose(self) -> None:
+        """
+        Closes the connection to the server.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+            self._reader = self._writer = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def __repr__(self) -> str:
+        return f"AsyncSysHandler({self.name}, {self.protocoll}, \
+{self.server_name}, {self.port})"
+
+    def __str__(self) -> str:
+        return f"AsyncSysHandler with: {self.name}, {self.protocoll}, \
+{self.server_name} and {self.port}"
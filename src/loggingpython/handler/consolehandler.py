@@ -85,6 +85,10 @@ class ConsoleHandler(Handler):
             logformat_string (str, optional): The formatting string for the
                 log messages. By default, it contains the timestamp,
                 logger name, log level and the message itself.
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
         """
         self.stream: TextIO = stream
         self.logformat_string: str = logformat_string
@@ -107,13 +111,18 @@ class ConsoleHandler(Handler):
                 including timestamp, logger name, log level and message.
         """
 
-        formatted_message_values = self._format_message(record)
-        formatted_message = self.logformat_string % formatted_message_values
+        formatted_message = self._logformat.render(record)
 
         color = self._get_color_for_level(record["loglevel"])
         self.stream.write(color + formatted_message + Style.RESET_ALL + '\n')
         self.stream.flush()
 
+    def flush(self) -> None:
+        """
+        Flushes the stream.
+        """
+        self.stream.flush()
+
     def set_colors_for_levels(self, color_map: dict) -> None:
         """
         Sets colors for the different log levels.
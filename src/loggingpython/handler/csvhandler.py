@@ -32,6 +32,12 @@ current date and allows customization of the log format string. It ensures
 that log messages are stored in a structured and easily accessible format,
 making it suitable for further analysis or review.
 
+The rows are written with the `csv` module of the standard library, with `;`
+as the delimiter and quotes around fields that contain a delimiter, a quote
+or a line break. Every file can start with a header row that names the
+columns. pandas is not needed for writing log files; it is an optional extra
+that only the analysis features import.
+
 Example usage:
 
     from loggingpython.handler import CSVHandler
@@ -50,11 +56,19 @@ comprehensive logging solution for Python applications, including error
 handling and logging mechanisms for both client and server-side operations.
 """
 
+import csv
+import io
 import os
-from datetime import datetime
-import pandas as pd
+import threading
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import Sequence
 
 from .handler import Handler
+from ..log_record import LogRecord
+from ..archiver import Archiver
+from ..rotation import Rotation
+from ..rotation_interval import RotationInterval
 
 
 class CSVHandler(Handler):
@@ -65,17 +79,29 @@ class CSVHandler(Handler):
 
     This class inherits from the Handler class and implements specific
     methods for formatting and outputting log messages in CSV files. It
-    supports the creation of new log files based on the current date and
+    supports the rotation of the log files by time interval and file size and
     allows customization of the log format string. The CSVHandler ensures
     that log messages are stored in a structured and easily accessible format,
     making it suitable for further analysis or review.
+
+    Every log record becomes one row with the columns of `COLUMNS`. The rows
+    of a batch are rendered together and written with a single write, under
+    the lock of the handler together with the rotation check.
     """
 
+    COLUMNS: tuple[str, ...] = LogRecord.FIELDS
+
     def __init__(self,
                  name: str,
                  path: str = "logs",
                  logformat_string: str = "%(asctime)s: [%(loggername)s]: \
-[%(loglevel)s]: %(message)s") -> None:
+[%(loglevel)s]: %(message)s",
+                 rotation_interval: RotationInterval | timedelta | None =
+                 RotationInterval.DAILY,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 archiver: Archiver | None = None,
+                 header: bool = False) -> None:
         """
         Initializes the CSVHandler with the given name, log path, and log
             format string.
@@ -87,16 +113,40 @@ class CSVHandler(Handler):
             logformat_string (str, optional): The format string for the log
                 messages. Defaults to "%(asctime)s: [%(loggername)s]:
                 [%(loglevel)s]: %(message)s".
+            rotation_interval (RotationInterval | timedelta | None,
+                optional): The interval after which a new log file is
+                started. Defaults to RotationInterval.DAILY. None disables
+                rotation by time.
+            max_bytes (int, optional): The size after which the log file is
+                rotated to a numbered backup, counted in characters of the
+                written text. Defaults to 0, which disables rotation by size.
+            backup_count (int, optional): The number of numbered backups that
+                are kept. Defaults to 5.
+            archiver (Archiver, optional): The archiver that compresses the
+                rotated log files on a background thread and enforces the
+                retention rules. Defaults to None.
+            header (bool, optional): Whether every new log file starts with
+                a header row that names the columns. Defaults to False.
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
         """
+        self.logformat_string: str = logformat_string
+        self._lock: threading.Lock = threading.Lock()
+
         self._mk_logdir(path)
         self.name: str = name
         self.path: str = path
-        self._current_date: str = datetime.now().strftime("%Y-%m-%d")
-        self.file: str = f"{self.path}/{self.name}_{self._current_date}.csv"
+        self._rotation: Rotation = Rotation(path, name, "csv",
+                                            rotation_interval, max_bytes,
+                                            backup_count, archiver)
+        self.file: str = self._rotation.file
+        self.header: bool = header
         self._mk_logfile(self.file)
-        self.file = open(self.file, "a")
-
-        self.logformat_string: str = logformat_string
+        self.file = open(self.file, "a", newline="")
+        if header and self._rotation.size == 0:
+            self._write_header()
 
     def emit(self, record: dict) -> None:
         """
@@ -105,27 +155,88 @@ class CSVHandler(Handler):
         Args:
             record (dict): A dictionary containing the log record details.
         """
-        formatted_message_values = self._format_message(record)
+        self._write(self._render((record,)))
+
+    def emit_batch(self, records: Sequence[dict]) -> None:
+        """
+        Writes several log records to the file with a single write and a
+        single flush.
+
+        Args:
+            records (Sequence[dict]): The log records to be written.
+        """
+        self._write(self._render(records))
+
+    def _render(self, records: Sequence[dict]) -> str:
+        """
+        Renders log records as CSV rows.
+
+        Args:
+            records (Sequence[dict]): The log records to be rendered.
+
+        Returns:
+            str: The rows, each terminated by a line break.
+        """
+        buffer = io.StringIO()
+        row = _ROW
+        format_message = self._format_message
+        csv.writer(buffer, _CSVDialect).writerows(
+            row(format_message(record)) for record in records)
+        return buffer.getvalue()
+
+    def _write(self, rows: str) -> None:
+        """
+        Writes rendered rows to the file and flushes it.
 
-        df = pd.DataFrame([formatted_message_values])
+        Args:
+            rows (str): The rendered rows.
+        """
+        with self._lock:
+            self._update_file(len(rows))
+            self.file.write(rows)
+            self.file.flush()
+
+    def _write_header(self) -> None:
+        """
+        Writes the header row to the empty current log file.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer, _CSVDialect).writerow(self.COLUMNS)
+        self.file.write(buffer.getvalue())
+        self._rotation.size += len(buffer.getvalue())
 
-        formatted_message = df.to_csv(index=False, header=False, sep=";",
-                                      lineterminator="\n")
+    def _update_file(self, size: int = 0) -> None:
+        """
+        Rotates the log file if the rotation interval has ended or writing
+        `size` more characters would exceed the maximum file size. The
+        caller must hold the lock of the handler.
+
+        Args:
+            size (int, optional): The number of characters about to be
+                written. Defaults to 0.
+        """
+        rotation = self._rotation
+        if rotation.due(size):
+            self._close_file()
+            self.file = open(rotation.rollover(), "a", newline="")
+            if self.header and rotation.size == 0:
+                self._write_header()
+        rotation.size += size
 
-        self._update_file()
-        self.file.write(formatted_message)
-        self.file.flush()
+    def flush(self) -> None:
+        """
+        Flushes the current log file.
+        """
+        with self._lock:
+            if not self.file.closed:
+                self.file.flush()
 
-    def _update_file(self):
+    def close(self) -> None:
         """
-        Updates the log file if the current date has changed.
+        Closes the current log file.
         """
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if current_date != self._current_date:
-            self.current_date = current_date
+        with self._lock:
             self._close_file()
-            filename = f"{self.logpath}/{self.name}_{self._current_date}.csv"
-            self.file = open(filename, "a")
 
     def _close_file(self):
         """
@@ -169,3 +280,20 @@ class CSVHandler(Handler):
     def __str__(self) -> str:
         return f"CSVHandler with: {self.name}, {self.path} and \
 {self.logformat_string}"
+
+
+class _CSVDialect(csv.Dialect):
+    """
+    The CSV dialect of the log files: `;` as the delimiter, `"` as the quote
+    character and quotes only around fields that need them.
+    """
+
+    delimiter = ";"
+    quotechar = '"'
+    doublequote = True
+    skipinitialspace = False
+    lineterminator = "\n"
+    quoting = csv.QUOTE_MINIMAL
+
+
+_ROW = itemgetter(*CSVHandler.COLUMNS)
@@ -0,0 +1,323 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `DedupHandler` class, a component of the
+`loggingpython` package that protects log destinations from log storms. The
+`DedupHandler` class is a concrete implementation of the abstract `Handler`
+class that wraps other handlers and collapses repeated log records before
+they reach them.
+
+When a dependency fails, the same log message is often logged thousands of
+times per minute, which fills disks and saturates network links without
+adding any information. The `DedupHandler` passes the first log record of a
+kind on and suppresses the identical ones that follow within a time window.
+When the window ends, a single summary record reports how often the log
+record was repeated. Log records are of the same kind if they come from the
+same logger, have the same log level and were logged with the same message
+template, so `logger.error("Timeout after %d ms", elapsed)` collapses even
+though the elapsed time differs.
+
+The windows are kept in a table of bounded size, so that a flood of
+distinct messages cannot exhaust the memory: when the table is full, the
+oldest window is closed early and its summary is emitted.
+
+Example usage:
+
+    from loggingpython.handler import DedupHandler, FileHandler
+
+    # Collapse repeated log records within one minute
+    dedup_handler = DedupHandler(FileHandler("app"), window=60.0)
+
+    # Add the dedup handler to the logger
+    logger.addHandler(dedup_handler)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Sequence
+
+from .handler import Handler
+from ..log_record import LogRecord
+from ..lifecycle import register_for_shutdown, unregister_for_shutdown
+
+
+class DedupHandler(Handler):
+    """
+    `loggingpython`
+
+    A class for collapsing repeated log records into summaries.
+
+    This class inherits from the Handler class. For every kind of log
+    record, it keeps a window with its start time, the number of suppressed
+    log records and the last of them. The windows are ordered by their start
+    time, so the expired ones are closed from the front of the table on
+    every log record, and by a timer thread while no log records arrive. The
+    handler owns the wrapped handlers: flushing it emits the pending
+    summaries and flushes them, and closing it closes them. The number of
+    suppressed log records is counted in `suppressed`.
+    """
+
+    def __init__(self,
+                 *handlers: Handler,
+                 window: float = 60.0,
+                 max_keys: int = 10000) -> None:
+        """
+        Initializes the DedupHandler and starts its timer thread.
+
+        Args:
+            *handlers (Handler): The handlers that receive the first log
+                record of every window and the summaries.
+            window (float, optional): The number of seconds in which
+                repeated log records are collapsed. Defaults to 60.0.
+            max_keys (int, optional): The maximum number of open windows.
+                Defaults to 10000.
+
+        Raises:
+            ValueError: If the window is not positive or max_keys is less
+                than one.
+        """
+        if window <= 0:
+            raise ValueError(f"The window must be positive, got {window}")
+        if max_keys < 1:
+            raise ValueError(f"max_keys must be at least 1, got {max_keys}")
+        self.handlers: list[Handler] = list(handlers)
+        self.window: float = window
+        self.max_keys: int = max_keys
+        self.suppressed: int = 0
+
+        # key -> [window start, suppressed count, last suppressed record]
+        self._windows: OrderedDict[tuple, list] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._stop_timer: threading.Event = threading.Event()
+        threading.Thread(
+            target=_close_windows_periodically,
+            args=(weakref.ref(self), self._stop_timer, window),
+            name="loggingpython-DedupHandler", daemon=True).start()
+        register_for_shutdown(self)
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Passes a log record on unless it repeats a log record of the current
+        window, and emits the summaries of the windows that have ended.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        self._emit_batch(self._filter((record,)))
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Passes the log records on that do not repeat a log record of the
+        current window, together with the summaries of the windows that have
+        ended, as one batch.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        self._emit_batch(self._filter(records))
+
+    def _filter(self, records: Sequence[LogRecord]) -> list:
+        """
+        Updates the windows with the log records.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+
+        Returns:
+            list: The log records and summaries to be emitted.
+        """
+        now = time.time()
+        output: list = []
+        windows = self._windows
+        with self._lock:
+            self._close_windows(now, output)
+            for record in records:
+                key = _key(record)
+                entry = windows.get(key)
+                if entry is not None:
+                    entry[1] += 1
+                    entry[2] = record
+                    self.suppressed += 1
+                    continue
+                if len(windows) >= self.max_keys:
+                    self._close_window(*windows.popitem(last=False), output)
+                windows[key] = [now, 0, None]
+                output.append(record)
+        return output
+
+    def _close_windows(self, now: float, output: list) -> None:
+        """
+        Closes the windows that have ended. The caller must hold the lock of
+        the handler.
+
+        Args:
+            now (float): The current time in seconds since the epoch.
+            output (list): The list the summaries are appended to.
+        """
+        windows = self._windows
+        expired = now - self.window
+        while windows:
+            key, entry = next(iter(windows.items()))
+            if entry[0] > expired:
+                break
+            del windows[key]
+            self._close_window(key, entry, output)
+
+    def _close_window(self, key: tuple, entry: list, output: list) -> None:
+        """
+        Appends the summary of a window to the output if log records were
+        suppressed in it.
+
+        Args:
+            key (tuple): The kind of the log records of the window.
+            entry (list): The start, the suppressed count and the last
+                suppressed log record of the window.
+            output (list): The list the summary is appended to.
+        """
+        start, count, last = entry
+        if not count:
+            return
+        now = time.time()
+        message = f"{last['message']} (repeated {count} more \
+{'time' if count == 1 else 'times'} in {now - start:.1f} s)"
+        if isinstance(last, LogRecord):
+            output.append(last.derive(message, now))
+        else:
+            output.append(dict(last, message=message))
+
+    def _emit_batch(self, records: list) -> None:
+        """
+        Emits log records to every wrapped handler.
+
+        Args:
+            records (list): The log records to be emitted.
+        """
+        if not records:
+            return
+        for handler in self.handlers:
+            try:
+                if len(records) == 1:
+                    handler.emit(records[0])
+                else:
+                    handler.emit_batch(records)
+            except Exception as e:
+                print(f"{handler!r} failed in emit: {e}", file=sys.stderr)
+
+    def _flush_windows(self, close_all: bool = False) -> None:
+        """
+        Emits the summaries of the windows that have ended, or of all
+        windows.
+
+        Args:
+            close_all (bool, optional): Whether to close all windows.
+                Defaults to False.
+        """
+        output: list = []
+        with self._lock:
+            if close_all:
+                while self._windows:
+                    self._close_window(*self._windows.popitem(last=False),
+                                       output)
+            else:
+                self._close_windows(time.time(), output)
+        self._emit_batch(output)
+
+    def flush(self) -> None:
+        """
+        Emits the summaries of all windows and flushes the wrapped handlers.
+        """
+        self._flush_windows(close_all=True)
+        for handler in self.handlers:
+            handler.flush()
+
+    def close(self) -> None:
+        """
+        Emits the summaries of all windows, stops the timer thread and
+        closes the wrapped handlers.
+        """
+        self._stop_timer.set()
+        self._flush_windows(close_all=True)
+        for handler in self.handlers:
+            handler.close()
+        unregister_for_shutdown(self)
+
+    def __repr__(self) -> str:
+        return f"DedupHandler({self.handlers}, {self.window}, \
+{self.max_keys})"
+
+    def __str__(self) -> str:
+        return f"DedupHandler with: {self.handlers}, {self.window} and \
+{self.max_keys}"
+
+
+def _key(record: LogRecord | Mapping) -> tuple:
+    """
+    Returns the kind of a log record: its logger, its log level and its
+    message template.
+
+    Args:
+        record (LogRecord | Mapping): The log record or a mapping with the
+            details of the log message.
+
+    Returns:
+        tuple: The key of the window of the log record.
+    """
+    if type(record) is LogRecord:
+        return record.loggername, record.levelno, record.template
+    return (record.get("loggername", ""), record.get("loglevel", ""),
+            record.get("message", ""))
+
+
+def _close_windows_periodically(handler_ref: weakref.ref,
+                                stop: threading.Event,
+                                interval: float) -> None:
+    """
+    Emits the summaries of the windows of a dedup handler that have ended,
+    every `interval` seconds until the handler is closed or garbage
+    collected.
+
+    Args:
+        handler_ref (weakref.ref): A weak reference to the dedup handler.
+        stop (threading.Event): The event that is set when the handler is
+            closed.
+        interval (float): The length of a window.
+    """
+    while not stop.wait(interval):
+        handler = handler_ref()
+        if handler is None:
+            return
+        try:
+            handler._flush_windows()
+        except Exception as e:
+            print(f"{handler!r} failed to close windows: {e}",
+                  file=sys.stderr)
+        del handler
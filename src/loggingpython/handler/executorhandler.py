@@ -0,0 +1,165 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `ExecutorHandler` class, a component of the
+`loggingpython` package that makes a blocking handler usable from an asyncio
+event loop. The `ExecutorHandler` class is a concrete implementation of the
+`AsyncHandler` class that wraps another handler, such as a `FileHandler` or
+an `SQLHandler`, and runs its methods on a dedicated worker thread.
+
+Awaiting the handler suspends only the calling coroutine while the file is
+written or the database is updated, so a slow disk no longer stalls the
+event loop. Because the wrapped handler always runs on the same thread, the
+log records are written in order and the handler can keep resources that
+must not be shared between threads.
+
+Example usage:
+
+    from loggingpython import AsyncLogger
+    from loggingpython.handler import ExecutorHandler, SQLHandler
+
+    # Write to the database from a worker thread
+    logger = AsyncLogger('my_service')
+    logger.addHandler(ExecutorHandler(SQLHandler('my_service')))
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
+
+from .handler import Handler
+from .asynchandler import AsyncHandler
+from ..log_record import LogRecord
+
+
+class ExecutorHandler(AsyncHandler):
+    """
+    `loggingpython`
+
+    A class for running a blocking handler on a worker thread.
+
+    This class inherits from the AsyncHandler class. Its awaitable methods
+    run the corresponding method of the wrapped handler on a single worker
+    thread of its own, while the synchronous methods call the wrapped
+    handler directly. The handler owns the wrapped handler: closing it
+    closes the wrapped handler and stops the worker thread.
+    """
+
+    def __init__(self, handler: Handler) -> None:
+        """
+        Initializes the ExecutorHandler.
+
+        Args:
+            handler (Handler): The blocking handler that receives the log
+                records on the worker thread.
+        """
+        self.handler: Handler = handler
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="loggingpython-ExecutorHandler")
+
+    async def _run(self, method, *args) -> None:
+        """
+        Runs a method of the wrapped handler on the worker thread.
+
+        Args:
+            method (callable): The bound method of the wrapped handler.
+            *args: The arguments for the method.
+        """
+        await asyncio.get_running_loop().run_in_executor(self._executor,
+                                                         method, *args)
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Passes a log message to the wrapped handler on the calling thread.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        self.handler.emit(record)
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Passes several log messages to the wrapped handler on the calling
+        thread.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        self.handler.emit_batch(records)
+
+    async def aemit(self, record: LogRecord) -> None:
+        """
+        Passes a log message to the wrapped handler on the worker thread.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        await self._run(self.handler.emit, record)
+
+    async def aemit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Passes several log messages to the wrapped handler on the worker
+        thread.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        await self._run(self.handler.emit_batch, records)
+
+    def flush(self) -> None:
+        """
+        Flushes the wrapped handler on the calling thread.
+        """
+        self.handler.flush()
+
+    async def aflush(self) -> None:
+        """
+        Flushes the wrapped handler on the worker thread.
+        """
+        await self._run(self.handler.flush)
+
+    def close(self) -> None:
+        """
+        Closes the wrapped handler and stops the worker thread.
+        """
+        self._executor.shutdown(wait=True)
+        self.handler.close()
+
+    async def aclose(self) -> None:
+        """
+        Closes the wrapped handler on the worker thread and stops the worker
+        thread.
+        """
+        await self._run(self.handler.close)
+        self._executor.shutdown(wait=False)
+
+    def __repr__(self) -> str:
+        return f"ExecutorHandler({self.handler!r})"
+
+    def __str__(self) -> str:
+        return f"ExecutorHandler with: {self.handler}"
@@ -30,6 +30,26 @@ The `FileHandler` class supports various file handling modes, such as
 appending to an existing file or overwriting it, and can be configured with a
 custom log format string to control the appearance of the log messages.
 
+By default every log message is flushed to the file right away. In buffered
+mode the log messages are collected in the write buffer of the file and
+written out once the buffer holds a given number of bytes or log messages,
+once the oldest buffered message reaches a maximum age, or immediately when
+a message of a given log level or above, such as ERROR, is logged. Buffered
+file handlers are flushed and closed automatically when the interpreter
+exits.
+
+In atomic append mode every log message is encoded once to bytes and written
+with a single `os.write` call on a file descriptor opened with `O_APPEND`, so
+several processes, such as the workers of a web server, can append to the
+same log file without tearing each other's lines. POSIX only guarantees that
+writes of at most `PIPE_BUF` bytes (4096 on Linux) are atomic, and that only
+for pipes. For regular files, `O_APPEND` makes the seek to the end and the
+write a single step, and local Linux file systems do not interleave
+concurrent writes to the same file in practice, but there is no formal
+guarantee for large writes, a write can be cut short by a full disk, and
+network file systems such as NFS do not support `O_APPEND` atomically. Log
+messages of up to `PIPE_BUF` bytes are therefore the portable limit.
+
 Example usage:
 
     from loggingpython.handler import FileHandler
@@ -49,10 +69,26 @@ handling and logging mechanisms for both client and server-side operations.
 """
 
 import os
-from datetime import datetime
+import sys
+import threading
+import weakref
+from datetime import datetime, timedelta
+from typing import Sequence
 
 
 from .handler import Handler
+from ..log_levels import LogLevel
+from ..log_record import LogRecord
+from ..lifecycle import register_for_shutdown, unregister_for_shutdown
+from ..archiver import Archiver
+from ..rotation import Rotation
+from ..rotation_interval import RotationInterval
+
+
+try:
+    _IOV_MAX: int = max(os.sysconf("SC_IOV_MAX"), 1)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
 
 
 class FileHandler(Handler):
@@ -64,9 +100,13 @@ class FileHandler(Handler):
     This class inherits from the Handler class and implements specific
     methods for formatting and outputting log messages to files. It supports
     the creation of log files in a specified directory, automatic file rotation
-    based on the current date, and allows customization of the formatting
+    by time interval and file size, and allows customization of the formatting
     string. The FileHandler ensures that log messages are stored persistently
     and can be reviewed later for debugging or auditing purposes.
+    In buffered mode, the log messages are only flushed when one of the
+    flush triggers fires: the size of the write buffer, the number of
+    buffered log messages, the age of the buffered log messages, checked by
+    a timer thread, or the log level of a log message.
     """
 
     def __init__(self,
@@ -74,6 +114,17 @@ class FileHandler(Handler):
                  path: str = "logs",
                  logformat_string: str = "%(asctime)s: [%(loggername)s]: \
 [%(loglevel)s]: %(message)s",
+                 buffered: bool = False,
+                 buffer_bytes: int = 65536,
+                 buffer_records: int = 0,
+                 max_buffer_age: float | None = 1.0,
+                 flush_level: LogLevel = LogLevel.ERROR,
+                 rotation_interval: RotationInterval | timedelta | None =
+                 RotationInterval.DAILY,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 archiver: Archiver | None = None,
+                 atomic_append: bool = False,
                  ) -> None:
         """
         Initializes the FileHandler with the given name, log path, and log
@@ -86,16 +137,101 @@ class FileHandler(Handler):
             logformat_string (str, optional): The format string for the log
                 messages. Defaults to "%(asctime)s: [%(loggername)s]:
                 [%(loglevel)s]: %(message)s".
+            buffered (bool, optional): Whether the log messages are buffered
+                instead of being flushed one by one. Defaults to False. The
+                following arguments only apply in buffered mode.
+            buffer_bytes (int, optional): The size of the write buffer in
+                bytes. A full buffer is written to the file. Defaults to
+                65536.
+            buffer_records (int, optional): The number of buffered log
+                messages after which the buffer is flushed. Defaults to 0,
+                which disables this trigger.
+            max_buffer_age (float, optional): The maximum number of seconds a
+                log message stays in the buffer. Defaults to 1.0. None
+                disables the timer thread.
+            flush_level (LogLevel, optional): The log level from which on
+                every log message is flushed immediately. Defaults to
+                LogLevel.ERROR.
+            rotation_interval (RotationInterval | timedelta | None,
+                optional): The interval after which a new log file is
+                started. Defaults to RotationInterval.DAILY. None disables
+                rotation by time.
+            max_bytes (int, optional): The size after which the log file is
+                rotated to a numbered backup, counted in characters of the
+                written text. Defaults to 0, which disables rotation by size.
+            backup_count (int, optional): The number of numbered backups that
+                are kept. Defaults to 5.
+            archiver (Archiver, optional): The archiver that compresses the
+                rotated log files on a background thread and enforces the
+                retention rules. Defaults to None.
+            atomic_append (bool, optional): Whether every log message is
+                written with a single `os.write` call on an `O_APPEND` file
+                descriptor, so that several processes can append to the same
+                log file. Defaults to False. Cannot be combined with buffered
+                mode or rotation by size, as every process would rotate the
+                shared log file on its own.
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
+            ValueError: If atomic append mode is combined with buffered mode
+                or with rotation by size.
         """
+        if atomic_append and buffered:
+            raise ValueError("Atomic append mode cannot be combined with \
+buffered mode")
+        if atomic_append and max_bytes:
+            raise ValueError("Atomic append mode cannot be combined with \
+rotation by size")
+        self.logformat_string: str = logformat_string
+        self.atomic_append: bool = atomic_append
+
+        self.buffered: bool = buffered
+        self.buffer_bytes: int = buffer_bytes
+        self.buffer_records: int = buffer_records
+        self.max_buffer_age: float | None = max_buffer_age
+        self.flush_level: LogLevel = flush_level
+        self._flush_records: int = buffer_records or sys.maxsize
+        self._unflushed: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._stop_timer: threading.Event = threading.Event()
+
         self._mk_logdir(path)
         self.name: str = name
         self.path: str = path
-        self._current_date: str = datetime.now().strftime("%Y-%m-%d")
-        self.file: str = f"{self.path}/{self.name}_{self._current_date}.log"
+        self._rotation: Rotation = Rotation(path, name, "log",
+                                            rotation_interval, max_bytes,
+                                            backup_count, archiver)
+        self.file: str = self._rotation.file
         self._mk_logfile(self.file)
-        self.file = open(self.file, "a")
+        self.file = self._open_file(self.file)
 
-        self.logformat_string: str = logformat_string
+        if self.buffered:
+            if self.max_buffer_age is not None:
+                threading.Thread(
+                    target=_flush_periodically,
+                    args=(weakref.ref(self), self._stop_timer,
+                          self.max_buffer_age),
+                    name="loggingpython-FileHandler", daemon=True).start()
+            register_for_shutdown(self)
+
+    def _open_file(self, file: str):
+        """
+        Opens a log file for appending, with a write buffer of
+        `buffer_bytes` in buffered mode and as an unbuffered binary file in
+        atomic append mode.
+
+        Args:
+            file (str): The path of the log file.
+
+        Returns:
+            TextIOWrapper | FileIO: The opened log file.
+        """
+        if self.atomic_append:
+            return open(file, "ab", buffering=0)
+        if self.buffered:
+            return open(file, "a", buffering=self.buffer_bytes)
+        return open(file, "a")
 
     def emit(self, record: dict) -> None:
         """
@@ -104,23 +240,112 @@ class FileHandler(Handler):
         Args:
             record (dict): A dictionary containing the log record details.
         """
-        formatted_message_values = self._format_message(record)
-        formatted_message = self.logformat_string % formatted_message_values
+        formatted_message = self._logformat.render(record) + "\n"
+
+        if self.atomic_append:
+            data = formatted_message.encode("utf-8")
+            with self._lock:
+                self._update_file(len(data))
+                _write_all(self.file.fileno(), data)
+            return
+        if not self.buffered:
+            with self._lock:
+                self._update_file(len(formatted_message))
+                self.file.write(formatted_message)
+                self.file.flush()
+            return
+        with self._lock:
+            self._update_file(len(formatted_message))
+            self.file.write(formatted_message)
+            self._unflushed += 1
+            if self._unflushed >= self._flush_records or \
+                    _severity(record) >= self.flush_level.severity:
+                self._flush_buffer()
+
+    def emit_batch(self, records: Sequence[dict]) -> None:
+        """
+        Writes several log records to the file with a single write and a
+        single flush.
+
+        In buffered mode, the log records are flushed only if one of the
+        flush triggers fires. In atomic append mode, the encoded log
+        messages are written with a single `os.writev` call, so every log
+        message stays intact.
+
+        Args:
+            records (Sequence[dict]): The log records to be written.
+        """
+        render = self._logformat.render
+        if self.atomic_append:
+            messages = [(render(record) + "\n").encode("utf-8")
+                        for record in records]
+            with self._lock:
+                self._update_file(sum(map(len, messages)))
+                _writev_all(self.file.fileno(), messages)
+            return
+        formatted_messages = "".join([render(record) + "\n"
+                                      for record in records])
 
-        self._update_file()
-        self.file.write(formatted_message + "\n")
-        self.file.flush()
+        if not self.buffered:
+            with self._lock:
+                self._update_file(len(formatted_messages))
+                self.file.write(formatted_messages)
+                self.file.flush()
+            return
+        flush_severity = self.flush_level.severity
+        with self._lock:
+            self._update_file(len(formatted_messages))
+            self.file.write(formatted_messages)
+            self._unflushed += len(records)
+            if self._unflushed >= self._flush_records or \
+                    any(_severity(record) >= flush_severity
+                        for record in records):
+                self._flush_buffer()
 
-    def _update_file(self) -> None:
+    def _flush_buffer(self) -> None:
         """
-        Updates the log file if the current date has changed.
+        Writes the buffered log messages to the file. The caller must hold
+        the lock of the handler.
+        """
+        if self._unflushed and not self.file.closed:
+            self.file.flush()
+        self._unflushed = 0
+
+    def _update_file(self, size: int = 0) -> None:
+        """
+        Rotates the log file if the rotation interval has ended or writing
+        `size` more characters would exceed the maximum file size. The
+        caller must hold the lock of the handler.
+
+        Args:
+            size (int, optional): The number of characters about to be
+                written. Defaults to 0.
         """
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if current_date != self._current_date:
-            self.current_date = current_date
+        rotation = self._rotation
+        if rotation.due(size):
             self._close_file()
-            filename = f"{self.logpath}/{self.name}_{self._current_date}.log"
-            self.file = open(filename, "a")
+            self.file = self._open_file(rotation.rollover())
+            self._unflushed = 0
+        rotation.size += size
+
+    def flush(self) -> None:
+        """
+        Flushes the current log file.
+        """
+        with self._lock:
+            if not self.file.closed:
+                self.file.flush()
+            self._unflushed = 0
+
+    def close(self) -> None:
+        """
+        Flushes and closes the current log file and stops the timer thread.
+        """
+        self._stop_timer.set()
+        with self._lock:
+            self._close_file()
+            self._unflushed = 0
+        unregister_for_shutdown(self)
 
     def _close_file(self) -> None:
         """
@@ -160,8 +385,83 @@ class FileHandler(Handler):
 
     def __repr__(self) -> str:
         return f"FileHandler({self.name}, {self.path}, \
-{self.logformat_string})"
+{self.logformat_string}, {self.buffered}, {self.atomic_append})"
 
     def __str__(self) -> str:
         return f"FileHandler with: {self.name}, {self.path} and \
 {self.logformat_string}"
+
+
+def _severity(record: dict) -> int:
+    """
+    Returns the integer severity of a log record.
+
+    Args:
+        record (dict): A log record or a dictionary with a `loglevel` entry.
+
+    Returns:
+        int: The severity of the log level, or 0 if it is unknown.
+    """
+    if type(record) is LogRecord:
+        return record.levelno
+    loglevel = LogLevel.__members__.get(record.get("loglevel", ""))
+    return 0 if loglevel is None else loglevel.severity
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Writes bytes to a file descriptor with a single `os.write` call and
+    writes the rest with further calls if the write was cut short.
+
+    Args:
+        fd (int): The file descriptor.
+        data (bytes): The bytes to be written.
+    """
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def _writev_all(fd: int, messages: list[bytes]) -> None:
+    """
+    Writes several log messages to a file descriptor with as few
+    `os.writev` calls as the limit on the number of buffers per call allows.
+
+    Args:
+        fd (int): The file descriptor.
+        messages (list[bytes]): The encoded log messages.
+    """
+    if not hasattr(os, "writev"):
+        _write_all(fd, b"".join(messages))
+        return
+    for start in range(0, len(messages), _IOV_MAX):
+        chunk = messages[start:start + _IOV_MAX]
+        written = os.writev(fd, chunk)
+        total = sum(map(len, chunk))
+        if written < total:
+            _write_all(fd, b"".join(chunk)[written:])
+
+
+def _flush_periodically(handler_ref: weakref.ref,
+                        stop: threading.Event,
+                        interval: float) -> None:
+    """
+    Flushes the buffer of a file handler every `interval` seconds until the
+    handler is closed or garbage collected.
+
+    Args:
+        handler_ref (weakref.ref): A weak reference to the file handler.
+        stop (threading.Event): The event that is set when the handler is
+            closed.
+        interval (float): The maximum age of a buffered log message.
+    """
+    while not stop.wait(interval):
+        handler = handler_ref()
+        if handler is None:
+            return
+        try:
+            with handler._lock:
+                handler._flush_buffer()
+        except Exception as e:
+            print(f"{handler!r} failed in flush: {e}", file=sys.stderr)
+        del handler
@@ -57,6 +57,11 @@ comprehensive logging solution for Python applications, including error
 handling and logging mechanisms for both client and server-side operations.
 """
 
+from typing import Sequence
+
+from ..log_format import LogFormat
+from ..log_record import LogRecord
+
 
 class Handler:
     """
@@ -67,9 +72,31 @@ class Handler:
     This class defines the interface for all handler classes. Handlers are
     responsible for processing log messages. Subclasses must implement the
     emit method to provide specific handling behavior.
+
+    Handlers that render text assign their `logformat_string`, which is
+    compiled into a `LogFormat` right away. Invalid format strings therefore
+    raise an `InvalidLogFormatError` when the handler is set up.
     """
 
-    def emit(self, record: dict) -> None:
+    _LOGFORMAT_FIELDS: tuple[str, ...] = LogRecord.FIELDS
+
+    @property
+    def logformat_string(self) -> str:
+        """
+        The `%`-style format string for the log messages of the handler.
+
+        Raises:
+            InvalidLogFormatError: If a new format string references an
+                unknown field or contains an invalid placeholder.
+        """
+        return self._logformat.logformat_string
+
+    @logformat_string.setter
+    def logformat_string(self, logformat_string: str) -> None:
+        self._logformat: LogFormat = LogFormat(logformat_string,
+                                               self._LOGFORMAT_FIELDS)
+
+    def emit(self, record: LogRecord) -> None:
         """
         Emits a log message.
 
@@ -79,23 +106,60 @@ class Handler:
         method.
 
         Parameters:
-        - message (str): The log message to be processed.
+        - record (LogRecord): The log record to be processed.
 
         Raises:
         - NotImplementedError: If the method is not implemented by a subclass.
         """
         raise NotImplementedError("Subclasses must implement this!")
 
-    def _format_message(self, record: dict) -> str:
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Emits several log messages at once.
+
+        The base class emits the records one after another. Subclasses that
+        can write a whole batch with a single operation override this method.
+
+        Parameters:
+        - records (Sequence[LogRecord]): The log records to be processed.
+        """
+        for record in records:
+            self.emit(record)
+
+    def flush(self) -> None:
+        """
+        Writes out any log messages the handler has buffered.
+
+        The base class does not buffer anything. Subclasses that buffer log
+        messages override this method.
+        """
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the handler, such as open files or
+        connections.
+
+        The base class holds no resources. Subclasses that do override this
+        method.
+        """
+
+    def _format_message(self, record: LogRecord | dict) -> LogRecord | dict:
         """
         Formats a log message based on the transferred log data set.
 
+        A `LogRecord` already provides every field as a read-only mapping and
+        is returned unchanged, so all handlers share the one record instead of
+        copying it. Plain dictionaries are completed with empty defaults.
+
         Args:
-            record (dict): A dictionary with the details of the log message.
+            record (LogRecord | dict): The log record or a dictionary with the
+                details of the log message.
 
         Returns:
-            str: The formatted log message.
+            LogRecord | dict: A mapping with the details of the log message.
         """
+        if isinstance(record, LogRecord):
+            return record
         values = {
             "loggername": record.get("loggername", ""),
             "iso_8601_time": record.get("iso_8601_time", ""),
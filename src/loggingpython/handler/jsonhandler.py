@@ -32,6 +32,17 @@ current date and allows customization of the log format string. It ensures
 that log messages are stored in a structured and easily accessible format,
 making it suitable for further analysis or review.
 
+By default all log messages of a log file are kept in one JSON object, which
+is rewritten for every log message, so the cost of a log message grows with
+the size of the file. In NDJSON mode every log message is appended as a
+compact JSON object on a line of its own and no log messages are kept in
+memory. Such files can be streamed back with
+`loggingpython.log_reader.read_ndjson`. In ARRAY mode the log file is a
+single JSON array that stays valid after every write: the log messages are
+appended as elements in front of the closing bracket, which the handler
+writes again behind every new element, so memory use stays constant as
+well.
+
 Example usage:
 
     from loggingpython.handler import JSONHandler
@@ -39,6 +50,9 @@ Example usage:
     # Set up a JSON handler
     json_handler = JSONHandler('logfile', path='logs')
 
+    # Or append one JSON object per line
+    json_handler = JSONHandler('logfile', json_format=JSONFormat.NDJSON)
+
     # Add the JSON handler to the logger
     logger.addHandler(json_handler)
 
@@ -52,9 +66,16 @@ handling and logging mechanisms for both client and server-side operations.
 
 import os
 import json
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
+from typing import Sequence
 
 from .handler import Handler
+from ..archiver import Archiver
+from ..json_encoder import JSONEncoder
+from ..json_format import JSONFormat
+from ..rotation import Rotation
+from ..rotation_interval import RotationInterval
 
 
 class JSONHandler(Handler):
@@ -65,17 +86,36 @@ class JSONHandler(Handler):
 
     This class inherits from the Handler class and implements specific
     methods for formatting and outputting log messages in JSON files. It
-    supports the creation of new log files based on the current date and
+    supports the rotation of the log files by time interval and file size and
     allows customization of the log format string. The JSONHandler ensures
     that log messages are stored in a structured and easily accessible format,
     making it suitable for further analysis or review. It also includes
-    features for hashing log messages for unique identification and updating
-    the log file if the current date has changed.
+    features for hashing log messages for unique identification and starting
+    a new log file when the log file is rotated.
+    In NDJSON and ARRAY mode, the log file stays open and every log message
+    is appended to it as one line, or every batch with a single write.
     """
 
+    _EXTENSIONS: dict[JSONFormat, str] = {
+        JSONFormat.DOCUMENT: "json",
+        JSONFormat.NDJSON: "ndjson",
+        JSONFormat.ARRAY: "json",
+    }
+    _ARRAY_START: bytes = b"["
+    _ARRAY_END: bytes = b"\n]\n"
+    # The beginning of a streamed array, with or without a first element.
+    _ARRAY_HEADS: tuple[bytes, ...] = (b"[\n{", b"[\n]")
+
     def __init__(self,
                  name: str,
-                 path: str = "logs") -> None:
+                 path: str = "logs",
+                 rotation_interval: RotationInterval | timedelta | None =
+                 RotationInterval.DAILY,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 archiver: Archiver | None = None,
+                 json_format: JSONFormat = JSONFormat.DOCUMENT,
+                 encoder: JSONEncoder | None = None) -> None:
         """
         Initializes the JSONHandler with the given name, log path, and log
             format string.
@@ -87,14 +127,48 @@ class JSONHandler(Handler):
             logformat_string (str, optional): The format string for the log
                 messages. Defaults to "%(asctime)s: [%(loggername)s]:
                 [%(loglevel)s]: %(message)s".
+            rotation_interval (RotationInterval | timedelta | None,
+                optional): The interval after which a new log file is
+                started. Defaults to RotationInterval.DAILY. None disables
+                rotation by time.
+            max_bytes (int, optional): The size after which the log file is
+                rotated to a numbered backup, counted in characters of the
+                written JSON document and in bytes in NDJSON and ARRAY mode.
+                As the whole document is rewritten for every log message, a
+                JSON document is rotated once it has exceeded this size.
+                Defaults to 0, which disables rotation by size.
+            backup_count (int, optional): The number of numbered backups that
+                are kept. Defaults to 5.
+            archiver (Archiver, optional): The archiver that compresses the
+                rotated log files on a background thread and enforces the
+                retention rules. Defaults to None.
+            json_format (JSONFormat, optional): The layout of the log files.
+                Defaults to JSONFormat.DOCUMENT.
+            encoder (JSONEncoder, optional): The encoder for the log
+                messages in NDJSON and ARRAY mode, for example with static
+                fields or a specific backend. Defaults to a JSONEncoder that
+                uses orjson if it is installed.
+
+        Raises:
+            ValueError: If the current log file in ARRAY mode exists but is
+                not a streamed array.
         """
+        self._lock: threading.Lock = threading.Lock()
         self._mk_logdir(path)
         self.name: str = name
         self.path: str = path
-        self._current_date: str = datetime.now().strftime("%Y-%m-%d")
-        self.file: str = f"{self.path}/{self.name}_{self._current_date}.json"
+        self.json_format: JSONFormat = json_format
+        self.encoder: JSONEncoder = encoder or JSONEncoder()
+        self._rotation: Rotation = Rotation(path, name,
+                                            self._EXTENSIONS[json_format],
+                                            rotation_interval, max_bytes,
+                                            backup_count, archiver)
+        self.file: str = self._rotation.file
         self._mk_logfile(self.file)
         self.log_data: dict[str, str] = {}
+        self._stream = None
+        self._array_empty: bool = True
+        self._open_stream()
 
     def emit(self, record: dict) -> None:
         """
@@ -104,39 +178,199 @@ class JSONHandler(Handler):
             record (dict): A dictionary containing the details of the log
                 entry. contains the details of the log entry.
         """
-        formatted_message_values = self._format_message(record)
+        if self._stream is not None:
+            element = self.encoder.encode(record)
+            with self._lock:
+                self._append([element])
+            return
+        formatted_message_values = dict(self._format_message(record))
         formatted_message = self._format_in_json(formatted_message_values)
         message_hash = hash(str(formatted_message))
 
-        self.log_data[str(message_hash)] = formatted_message
-        self._update_file()
-        self._write_log_data_to_file()
+        with self._lock:
+            self._update_file()
+            self.log_data[str(message_hash)] = formatted_message
+            self._write_log_data_to_file()
+
+    def emit_batch(self, records: Sequence[dict]) -> None:
+        """
+        Adds several log messages to the JSON object and writes the file
+            only once.
+
+        Args:
+            records (Sequence[dict]): The log records to be written.
+        """
+        if self._stream is not None:
+            encode = self.encoder.encode
+            elements = [encode(record) for record in records]
+            with self._lock:
+                self._append(elements)
+            return
+        with self._lock:
+            self._update_file()
+            for record in records:
+                formatted_message_values = dict(self._format_message(record))
+                formatted_message = self._format_in_json(
+                    formatted_message_values)
+                message_hash = hash(str(formatted_message))
+                self.log_data[str(message_hash)] = formatted_message
+            self._write_log_data_to_file()
 
     def _write_log_data_to_file(self) -> None:
         """
         Writes the JSON object to the file.
         """
+        log_data = json.dumps(self.log_data, indent=4)
         with open(self.file, 'w') as file:
-            file.write(json.dumps(self.log_data, indent=4))
+            file.write(log_data)
+        self._rotation.size = len(log_data)
 
-    def _update_file(self) -> None:
+    def _open_stream(self) -> None:
         """
-        Updates the log file if the current date has changed.
+        Opens the current log file in NDJSON and ARRAY mode. In ARRAY mode,
+        a new log file is started as an empty array and an existing one is
+        prepared for appending.
+        """
+        if self.json_format is JSONFormat.NDJSON:
+            self._stream = open(self.file, "ab")
+        elif self.json_format is JSONFormat.ARRAY:
+            self._stream = open(os.open(self.file, os.O_RDWR | os.O_CREAT,
+                                        0o644), "r+b")
+            try:
+                self._prepare_array()
+            except ValueError:
+                self._stream.close()
+                raise
+
+    def _prepare_array(self) -> None:
+        """
+        Positions the open log file in front of the closing bracket of its
+        array. A log file whose last write was cut short, for example by a
+        crash, is truncated behind its last complete element and closed
+        again; a log file without a complete element is started anew.
+
+        Raises:
+            ValueError: If the log file is not a streamed array, for example
+                a JSON document of DOCUMENT mode with the same name.
+        """
+        stream = self._stream
+        head = stream.read(len(self._ARRAY_HEADS[0]))
+        if not any(layout.startswith(head) for layout in self._ARRAY_HEADS):
+            raise ValueError(f"{self.file} is not a streamed JSON array")
+        size = stream.seek(0, os.SEEK_END)
+        start, end = self._ARRAY_START, self._ARRAY_END
+        empty_size = len(start) + len(end)
+        stream.seek(max(size - len(end), 0))
+        if size >= empty_size and stream.read() == end:
+            self._array_empty = size == empty_size
+            self._rotation.size = size
+            return
+        last_element = self._find_last_element(size)
+        if last_element == -1 or size <= empty_size:
+            stream.seek(0)
+            stream.truncate()
+            stream.write(start + end)
+            self._array_empty = True
+        else:
+            stream.seek(last_element + 1)
+            stream.truncate()
+            stream.write(end)
+            self._array_empty = False
+        stream.flush()
+        self._rotation.size = stream.tell()
+
+    def _find_last_element(self, size: int) -> int:
+        """
+        Scans the open log file backwards in chunks for the end of its last
+        complete element, down to the head of the array if necessary.
+
+        Args:
+            size (int): The size of the log file.
+
+        Returns:
+            int: The offset of the closing brace of the last complete
+                element, or -1 if there is none.
         """
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if current_date != self._current_date:
-            self._current_date = current_date
+        stream = self._stream
+        end = size
+        overlap = b""
+        while end > 0:
+            start = max(end - 65536, 0)
+            stream.seek(start)
+            chunk = stream.read(end - start) + overlap
+            position = max(chunk.rfind(b"}\n"), chunk.rfind(b"},\n"))
+            if position != -1:
+                return start + position
+            overlap = chunk[:2]
+            end = start
+        return -1
+
+    def _append(self, elements: list[bytes]) -> None:
+        """
+        Appends encoded log messages to the open log file with a single
+        write, as lines in NDJSON mode and as array elements in front of the
+        rewritten closing bracket in ARRAY mode.
+
+        Args:
+            elements (list[bytes]): The log messages as compact JSON objects.
+        """
+        if self.json_format is JSONFormat.NDJSON:
+            lines = b"".join([element + b"\n" for element in elements])
+            self._update_file(len(lines))
+            self._stream.write(lines)
+            self._stream.flush()
+            self._rotation.size += len(lines)
+            return
+        separator = b"\n" if self._array_empty else b",\n"
+        data = b",\n".join(elements)
+        self._update_file(len(separator) + len(data))
+        if self._array_empty:
+            separator = b"\n"
+        stream = self._stream
+        stream.seek(-len(self._ARRAY_END), os.SEEK_END)
+        stream.write(separator + data + self._ARRAY_END)
+        stream.flush()
+        self._array_empty = False
+        self._rotation.size += len(separator) + len(data)
+
+    def _update_file(self, size: int = 0) -> None:
+        """
+        Starts a new log file if the rotation interval has ended or the log
+        file has exceeded the maximum file size, or would exceed it by
+        appending `size` more bytes in NDJSON and ARRAY mode.
+
+        Args:
+            size (int, optional): The number of bytes about to be appended.
+                Defaults to 0.
+        """
+        if self._rotation.due(size):
             self._close_file()
-            file: str = f"{self.path}/{self.name}_{self._current_date}.json"
-            self.file = open(file, "a")
+            self.file = self._rotation.rollover()
             self.log_data: dict[str, str] = {}
+            self._array_empty = True
+            self._open_stream()
+
+    def flush(self) -> None:
+        """
+        Flushes the open log file in NDJSON and ARRAY mode.
+        """
+        with self._lock:
+            if self._stream is not None and not self._stream.closed:
+                self._stream.flush()
+
+    def close(self) -> None:
+        """
+        Closes the open log file in NDJSON and ARRAY mode.
+        """
+        with self._lock:
+            self._close_file()
 
     def _close_file(self) -> None:
         """
         Closes the current log file.
         """
-        if self.file:
-            self.file.close()
+        if self._stream is not None:
+            self._stream.close()
 
     def _mk_logdir(self, logpath: str) -> None:
         """
@@ -188,8 +422,8 @@ class JSONHandler(Handler):
 
     def __repr__(self) -> str:
         return f"JSONHandler({self.name}, {self.path}, \
-{self.logformat_string})"
+{self.json_format})"
 
     def __str__(self) -> str:
         return f"JSONHandler with: {self.name}, {self.path} and \
-{self.logformat_string}"
+{self.json_format}"
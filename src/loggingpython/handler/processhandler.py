@@ -0,0 +1,156 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `ProcessHandler` class, the worker side of the
+multiprocess logging funnel of the `loggingpython` package. The
+`ProcessHandler` class is a concrete implementation of the abstract `Handler`
+class that sends every log record over a `multiprocessing` connection to
+the writer process of a `LogFunnel`, which owns the handlers that actually
+write the log files.
+
+Every process that logs through a `ProcessHandler` opens a connection of its
+own to the writer process on its first log message, so any number of
+processes can log to the same files without opening them independently and
+without overwriting each other's log messages. As no lock is shared between
+the processes, a worker process that crashes in the middle of a log message
+only breaks its own connection. A `ProcessHandler` is created by
+`LogFunnel.handler()` in the parent process and passed to the worker
+processes, for example as an initializer argument of a process pool.
+
+Example usage:
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    from loggingpython import LogFunnel, getLogger
+    from loggingpython.handler import FileHandler
+
+    logger = getLogger("worker")
+
+    def init_worker(handler):
+        logger.addHandler(handler)
+
+    with LogFunnel(partial(FileHandler, "batch")) as funnel:
+        with ProcessPoolExecutor(initializer=init_worker,
+                                 initargs=(funnel.handler(),)) as pool:
+            ...
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import os
+import threading
+from multiprocessing.connection import Client, Connection
+from typing import Sequence
+
+from .handler import Handler
+from ..log_record import LogRecord
+
+
+class ProcessHandler(Handler):
+    """
+    `loggingpython`
+
+    A class for sending log messages to the writer process of a `LogFunnel`.
+
+    This class inherits from the Handler class. Its `emit` method pickles
+    the log record and sends it over the connection of the current process
+    to the writer process, so a log record is handed over completely once
+    `emit` returns. The connection is opened on the first log message of
+    every process and shared by its threads. Log records are pickled with
+    their rendered timestamps, so the writer process writes the time at
+    which the worker logged them.
+    """
+
+    def __init__(self, address, authkey: bytes) -> None:
+        """
+        Initializes the ProcessHandler.
+
+        Args:
+            address: The address of the listener of the writer process.
+            authkey (bytes): The key that authenticates the connections to
+                the writer process.
+        """
+        self.address = address
+        self.authkey: bytes = authkey
+        self._connection: Connection | None = None
+        self._pid: int | None = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        return {"address": self.address, "authkey": self.authkey}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["address"], state["authkey"])
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Sends a log record to the writer process.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        self._send(record)
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Sends several log records to the writer process as one message.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        self._send(list(records))
+
+    def _send(self, message: LogRecord | list[LogRecord]) -> None:
+        """
+        Sends a message over the connection of the current process, which is
+        opened first if the process has none yet.
+
+        Args:
+            message (LogRecord | list[LogRecord]): The message to be sent.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._connection = Client(self.address, authkey=self.authkey)
+                self._pid = os.getpid()
+            self._connection.send(message)
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current process to the writer process.
+        A log message emitted afterwards opens a new one.
+        """
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+            self._pid = None
+
+    def __repr__(self) -> str:
+        return f"ProcessHandler({self.address})"
+
+    def __str__(self) -> str:
+        return f"ProcessHandler with: {self.address}"
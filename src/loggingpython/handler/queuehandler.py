@@ -0,0 +1,349 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `QueueHandler` class, a component of the
+`loggingpython` package designed to decouple the logging thread from slow
+log destinations. The `QueueHandler` class is a concrete implementation of
+the abstract `Handler` class that puts every log record into a bounded queue
+and returns immediately. A listener thread drains the queue and passes the
+records on to the wrapped handlers.
+
+With a `QueueHandler` in front of them, handlers that write to files,
+databases or network connections no longer add their latency to the thread
+that logs. The size of the queue is bounded, and an `OverflowPolicy` decides
+what happens when it is full: the logging thread can wait for free space, or
+the newest or oldest log record can be dropped. Closing the handler drains
+the queue within a configurable time limit, and all open queue handlers are
+closed automatically when the interpreter exits.
+
+Example usage:
+
+    from loggingpython.handler import QueueHandler, FileHandler, SQLHandler
+
+    # Write to the file and the database from a background thread
+    queue_handler = QueueHandler(FileHandler("app"), SQLHandler("app"))
+
+    # Add the queue handler to the logger
+    logger.addHandler(queue_handler)
+
+    # Log a message
+    logger.info('This is an informational message.')
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import queue
+import sys
+import threading
+import time
+from typing import Sequence
+
+from .handler import Handler
+from ..log_record import LogRecord
+from ..overflow_policy import OverflowPolicy
+from ..lifecycle import register_for_shutdown, unregister_for_shutdown
+
+
+# A flush request is queued as a threading.Event of its own, which the
+# listener thread sets once the wrapped handlers have been flushed.
+_STOP: object = object()
+
+
+class QueueHandler(Handler):
+    """
+    `loggingpython`
+
+    A class for handing log messages to other handlers on a background thread.
+
+    This class inherits from the Handler class. Its `emit` method only puts
+    the log record into a bounded queue, while a listener thread takes the
+    records from the queue and emits them to the wrapped handlers in order,
+    in batches of the records that have piled up in the meantime.
+    The handler owns the wrapped handlers: flushing it flushes them and
+    closing it closes them after the queue has been drained. The number of
+    records lost to the overflow policy is counted in `dropped`.
+    """
+
+    def __init__(self,
+                 *handlers: Handler,
+                 maxsize: int = 10000,
+                 overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+                 shutdown_timeout: float = 5.0,
+                 batch_size: int = 100) -> None:
+        """
+        Initializes the QueueHandler and starts its listener thread.
+
+        Args:
+            *handlers (Handler): The handlers that receive the log records
+                from the listener thread.
+            maxsize (int, optional): The maximum number of queued log
+                records. Defaults to 10000.
+            overflow_policy (OverflowPolicy, optional): What to do with a log
+                record when the queue is full. Defaults to
+                OverflowPolicy.BLOCK.
+            shutdown_timeout (float, optional): The maximum number of seconds
+                `close()` waits for the queue to be drained. Defaults to 5.0.
+            batch_size (int, optional): The maximum number of queued log
+                records the listener thread passes to `emit_batch` of the
+                wrapped handlers at once. Defaults to 100.
+        """
+        self.handlers: list[Handler] = list(handlers)
+        self.maxsize: int = maxsize
+        self.overflow_policy: OverflowPolicy = overflow_policy
+        self.shutdown_timeout: float = shutdown_timeout
+        self.batch_size: int = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.dropped: int = 0
+        self.closed: bool = False
+
+        self._lock: threading.Lock = threading.Lock()
+        self._listener: threading.Thread = threading.Thread(
+            target=self._listen, name="loggingpython-QueueHandler",
+            daemon=True)
+        self._listener.start()
+        register_for_shutdown(self)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of log records that are currently queued.
+        """
+        return self.queue.qsize()
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Puts a log record into the queue according to the overflow policy.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        if self.closed:
+            self._count_dropped()
+        elif self.overflow_policy is OverflowPolicy.BLOCK:
+            self.queue.put(record)
+        elif self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._count_dropped()
+        else:
+            self._put_dropping_oldest(record)
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Puts several log records into the queue according to the overflow
+        policy.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        for record in records:
+            self.emit(record)
+
+    def _put_dropping_oldest(self, record: LogRecord) -> None:
+        """
+        Puts a log record into the queue, removing the oldest queued log
+        records while the queue is full.
+
+        Queued flush and stop requests are not dropped, but put back at the
+        end of the queue in front of the log record, without blocking.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        held: list = []
+        while True:
+            while held:
+                try:
+                    self.queue.put_nowait(held[0])
+                except queue.Full:
+                    break
+                held.pop(0)
+                self.queue.task_done()
+            if not held:
+                try:
+                    self.queue.put_nowait(record)
+                    return
+                except queue.Full:
+                    pass
+            try:
+                oldest = self.queue.get_nowait()
+            except queue.Empty:
+                continue
+            if oldest is _STOP or type(oldest) is threading.Event:
+                held.append(oldest)
+                continue
+            self.queue.task_done()
+            self._count_dropped()
+
+    def _count_dropped(self) -> None:
+        """
+        Counts a dropped log record.
+        """
+        with self._lock:
+            self.dropped += 1
+
+    def _listen(self) -> None:
+        """
+        Takes the log records from the queue and emits them to the wrapped
+        handlers until the handler is closed.
+        """
+        stop = False
+        while not stop:
+            items = [self.queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                stop = self._process(items)
+            finally:
+                for _ in items:
+                    self.queue.task_done()
+
+    def _process(self, items: list) -> bool:
+        """
+        Emits the queued log records to the wrapped handlers in batches and
+        carries out the queued flush and stop requests in order.
+
+        Args:
+            items (list): The items taken from the queue.
+
+        Returns:
+            bool: True if the listener thread has to stop, False otherwise.
+        """
+        stop = False
+        records: list[LogRecord] = []
+        for item in items:
+            if item is _STOP:
+                stop = True
+            elif type(item) is threading.Event:
+                self._emit_batch(records)
+                records = []
+                for handler in self.handlers:
+                    self._call_handler(handler.flush)
+                item.set()
+            else:
+                records.append(item)
+        self._emit_batch(records)
+        return stop
+
+    def _emit_batch(self, records: list[LogRecord]) -> None:
+        """
+        Emits a batch of log records to every wrapped handler.
+
+        Args:
+            records (list[LogRecord]): The log records to be emitted.
+        """
+        if not records:
+            return
+        for handler in self.handlers:
+            if len(records) == 1:
+                self._call_handler(handler.emit, records[0])
+            else:
+                self._call_handler(handler.emit_batch, records)
+
+    def _call_handler(self, method, *args) -> None:
+        """
+        Calls a method of a wrapped handler and reports its errors without
+        stopping the listener thread.
+
+        Args:
+            method (callable): The bound method of the wrapped handler.
+            *args: The arguments for the method.
+        """
+        try:
+            method(*args)
+        except Exception as e:
+            print(f"{method.__self__!r} failed in {method.__name__}: {e}",
+                  file=sys.stderr)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits until all log records queued before the call have been
+        emitted and the wrapped handlers have been flushed. Log records
+        queued afterwards by other threads are not waited for.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+                Defaults to None, which waits without a limit.
+
+        Returns:
+            bool: True if the flush was completed in time, False otherwise.
+        """
+        if self.closed:
+            return not self._listener.is_alive()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        flushed = threading.Event()
+        try:
+            self.queue.put(flushed, timeout=timeout)
+        except queue.Full:
+            return False
+        if deadline is None:
+            return flushed.wait()
+        return flushed.wait(max(deadline - time.monotonic(), 0))
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Drains the queue, stops the listener thread and closes the wrapped
+        handlers.
+
+        Log records emitted after the handler has been closed are dropped.
+        If the queue cannot be drained within the timeout, the listener
+        thread is left running and the wrapped handlers are not closed.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+                Defaults to `shutdown_timeout`.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+        if timeout is None:
+            timeout = self.shutdown_timeout
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._listener.join(max(deadline - time.monotonic(), 0))
+        if self._listener.is_alive():
+            print(f"{self!r} could not drain {self.queue_depth} queued log \
+records within {timeout} seconds", file=sys.stderr)
+            return
+        for handler in self.handlers:
+            self._call_handler(handler.close)
+        unregister_for_shutdown(self)
+
+    def __repr__(self) -> str:
+        return f"QueueHandler({self.handlers}, {self.maxsize}, \
+{self.overflow_policy})"
+
+    def __str__(self) -> str:
+        return f"QueueHandler with: {self.handlers}, {self.maxsize} and \
+{self.overflow_policy}"
@@ -0,0 +1,222 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `RingBufferHandler` class, a component of the
+`loggingpython` package designed to keep the most recent log messages of a
+process in a memory-mapped file. The `RingBufferHandler` class is a concrete
+implementation of the abstract `Handler` class that writes every log message
+into a preallocated file of fixed size, which is used as a circular buffer.
+
+Because the file is mapped into memory, writing a log message is a memory
+copy without a system call, which makes the handler suitable for the
+tightest loops. The operating system writes the mapped pages back to the
+file on its own, so the latest log messages survive a crash of the process.
+When the buffer is full, the oldest log messages are overwritten. The log
+messages can be read back in order with `loggingpython.ring_buffer`.
+
+Example usage:
+
+    from loggingpython.handler import RingBufferHandler
+
+    # Keep the latest 16 MiB of log messages in logs/app.ring
+    ring_buffer_handler = RingBufferHandler("app", size=16 * 1024 * 1024)
+
+    # Add the ring buffer handler to the logger
+    logger.addHandler(ring_buffer_handler)
+
+    # After a crash:
+    #     python -m loggingpython.ring_buffer logs/app.ring
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import mmap
+import os
+import threading
+from typing import Sequence
+
+from .handler import Handler
+from ..log_record import LogRecord
+from ..ring_buffer import (MAGIC, HEADER, HEADER_SIZE, HEAD, HEAD_OFFSET,
+                           LENGTH, FRAME_SIZE)
+
+
+class RingBufferHandler(Handler):
+    """
+    `loggingpython`
+
+    A class for writing log messages into a memory-mapped ring buffer file.
+
+    This class inherits from the Handler class. It renders every log message
+    with its log format string, encodes it as UTF-8 and copies it, framed by
+    its length, to the head of the circular data area of the mapped file.
+    The head in the file header is advanced after the copy, so a log message
+    that is interrupted by a crash is never read back. An existing ring
+    buffer file of the same size is continued, so the history of earlier
+    runs is kept. Log messages longer than the data area are truncated.
+    """
+
+    def __init__(self,
+                 name: str,
+                 path: str = "logs",
+                 size: int = 16 * 1024 * 1024,
+                 logformat_string: str = "%(asctime)s: [%(loggername)s]: \
+[%(loglevel)s]: %(message)s") -> None:
+        """
+        Initializes the RingBufferHandler and maps its file into memory.
+
+        Args:
+            name (str): The name of the ring buffer file.
+            path (str, optional): The path where the ring buffer file will be
+                stored. Defaults to "logs".
+            size (int, optional): The size of the data area in bytes.
+                Defaults to 16 MiB.
+            logformat_string (str, optional): The format string for the log
+                messages. Defaults to "%(asctime)s: [%(loggername)s]:
+                [%(loglevel)s]: %(message)s".
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
+            ValueError: If the size is too small to hold a log message.
+        """
+        if size <= FRAME_SIZE:
+            raise ValueError(f"The ring buffer size must be larger than \
+{FRAME_SIZE} bytes, got {size}")
+        self.logformat_string: str = logformat_string
+
+        self.name: str = name
+        self.path: str = path
+        self.size: int = size
+        self.file: str = os.path.join(path, f"{name}.ring")
+        self._max_length: int = size - FRAME_SIZE
+        self._lock: threading.Lock = threading.Lock()
+
+        os.makedirs(path, exist_ok=True)
+        self._fd: int = os.open(self.file, os.O_RDWR | os.O_CREAT, 0o644)
+        self._map: mmap.mmap = self._map_file()
+        self._head: int = HEADER.unpack_from(self._map)[2]
+
+    def _map_file(self) -> mmap.mmap:
+        """
+        Preallocates the ring buffer file if needed and maps it into memory.
+
+        A file with a different size or without a valid header is
+        reinitialized as an empty ring buffer.
+
+        Returns:
+            mmap.mmap: The memory map of the whole file.
+        """
+        file_size = HEADER_SIZE + self.size
+        if os.fstat(self._fd).st_size >= HEADER_SIZE:
+            header = os.pread(self._fd, HEADER.size, 0)
+            magic, capacity, _ = HEADER.unpack(header)
+            if magic == MAGIC and capacity == self.size and \
+                    os.fstat(self._fd).st_size == file_size:
+                return mmap.mmap(self._fd, file_size)
+        os.ftruncate(self._fd, 0)
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(self._fd, 0, file_size)
+        else:
+            os.ftruncate(self._fd, file_size)
+        ring_buffer = mmap.mmap(self._fd, file_size)
+        HEADER.pack_into(ring_buffer, 0, MAGIC, self.size, 0)
+        return ring_buffer
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Copies a log message into the ring buffer.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        message = self._logformat.render(record).encode("utf-8")
+        with self._lock:
+            self._write(message)
+            HEAD.pack_into(self._map, HEAD_OFFSET, self._head)
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Copies several log messages into the ring buffer and advances the
+        head once.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        render = self._logformat.render
+        messages = [render(record).encode("utf-8") for record in records]
+        with self._lock:
+            for message in messages:
+                self._write(message)
+            HEAD.pack_into(self._map, HEAD_OFFSET, self._head)
+
+    def _write(self, message: bytes) -> None:
+        """
+        Copies a framed log message to the head of the data area. The caller
+        must hold the lock and store the head in the header afterwards.
+
+        Args:
+            message (bytes): The encoded log message.
+        """
+        message = message[:self._max_length]
+        length = LENGTH.pack(len(message))
+        frame = length + message + length
+        start = HEADER_SIZE + self._head % self.size
+        end = start + len(frame)
+        if end <= HEADER_SIZE + self.size:
+            self._map[start:end] = frame
+        else:
+            split = HEADER_SIZE + self.size - start
+            self._map[start:] = frame[:split]
+            self._map[HEADER_SIZE:HEADER_SIZE + len(frame) - split] = \
+                frame[split:]
+        self._head += len(frame)
+
+    def flush(self) -> None:
+        """
+        Writes the mapped pages back to the file.
+        """
+        with self._lock:
+            if not self._map.closed:
+                self._map.flush()
+
+    def close(self) -> None:
+        """
+        Writes the mapped pages back to the file and unmaps it.
+        """
+        with self._lock:
+            if not self._map.closed:
+                self._map.flush()
+                self._map.close()
+                os.close(self._fd)
+
+    def __repr__(self) -> str:
+        return f"RingBufferHandler({self.name}, {self.path}, {self.size}, \
+{self.logformat_string})"
+
+    def __str__(self) -> str:
+        return f"RingBufferHandler with: {self.name}, {self.path}, \
+{self.size} and {self.logformat_string}"
@@ -0,0 +1,503 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `SegmentHandler` class, a component of the
+`loggingpython` package designed to archive large volumes of log messages in
+a compact, columnar binary format. The `SegmentHandler` class is a concrete
+implementation of the abstract `Handler` class.
+
+Row-oriented text files store the timestamp, the log level and the logger
+name again in every line and have to be parsed line by line before they can
+be analysed. The `SegmentHandler` instead collects the log messages in one
+array per column and writes them as compressed segments:
+
+ - `created`: the timestamps as int64 microseconds since the epoch.
+ - `levelno`: the severities of the log levels as uint8 (10 for DEBUG up to
+   50 for CRITICAL).
+ - `loggername` and `message`: int32 codes into a dictionary of the distinct
+   values of the segment, so repeated values are stored once.
+
+Every segment starts with a small index with the number of log messages, the
+first and the last timestamp, the number of log messages per log level and
+the location of the compressed columns. Readers can therefore skip segments
+by time range or log level without decompressing them and load the selected
+columns straight into NumPy arrays or a pandas DataFrame, see
+`loggingpython.segment_reader`. With `backend="parquet"`, the segments are
+written as row groups of a Parquet file instead, which requires `pyarrow`.
+
+The log messages are buffered until a segment is full, the oldest buffered
+log message is older than `max_segment_age` seconds, or the handler is
+flushed or closed. The handler registers itself for the shutdown of the
+package, so buffered log messages are written when the interpreter exits.
+
+Example usage:
+
+    from loggingpython.handler import SegmentHandler
+
+    # Set up a segment handler
+    segment_handler = SegmentHandler('archive', path='logs')
+
+    # Add the segment handler to the logger
+    logger.addHandler(segment_handler)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import json
+import os
+import struct
+import sys
+import threading
+import time
+import weakref
+import zlib
+from array import array
+from datetime import timedelta
+from typing import Sequence
+
+from .handler import Handler
+from ..archiver import Archiver
+from ..lifecycle import register_for_shutdown, unregister_for_shutdown
+from ..log_levels import LogLevel
+from ..log_record import LogRecord
+from ..rotation import Rotation
+from ..rotation_interval import RotationInterval
+
+
+SEGMENT_MAGIC: bytes = b"LPSG"
+# magic, length of the index, length of the compressed columns
+SEGMENT_HEADER: struct.Struct = struct.Struct("<4sIQ")
+
+_BACKENDS: dict[str, str] = {"native": "lpseg", "parquet": "parquet"}
+_SEVERITIES: dict[str, int] = {loglevel.value: loglevel.severity
+                               for loglevel in LogLevel}
+_LEVEL_NAMES: dict[int, str] = {loglevel.severity: loglevel.value
+                                for loglevel in LogLevel}
+
+
+class SegmentHandler(Handler):
+    """
+    `loggingpython`
+
+    A class for archiving log messages in compressed column segments.
+
+    This class inherits from the Handler class. It appends every log message
+    to the column arrays of the current segment and writes the segment to the
+    log file when it holds `segment_records` log messages. The logger names
+    and the messages are dictionary encoded per segment. The log files are
+    rotated like the log files of the other file handlers, where `max_bytes`
+    is counted in compressed bytes.
+    """
+
+    COLUMNS: tuple[str, ...] = ("created", "levelno", "loggername",
+                                "message")
+
+    def __init__(self,
+                 name: str,
+                 path: str = "logs",
+                 segment_records: int = 65536,
+                 max_segment_age: float | None = 60.0,
+                 compression_level: int = 6,
+                 backend: str = "native",
+                 rotation_interval: RotationInterval | timedelta | None =
+                 RotationInterval.DAILY,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 archiver: Archiver | None = None) -> None:
+        """
+        Initializes the SegmentHandler with the given name and log path.
+
+        Args:
+            name (str): The name of the log file.
+            path (str, optional): The path where the log files will be
+                stored. Defaults to "logs".
+            segment_records (int, optional): The number of log messages after
+                which a segment is written. Defaults to 65536.
+            max_segment_age (float | None, optional): The number of seconds
+                after which a segment is written even if it is not full,
+                counted from its oldest log message. Defaults to 60.0. None
+                disables the timer thread.
+            compression_level (int, optional): The zlib compression level of
+                the columns, from 0 to 9. Defaults to 6.
+            backend (str, optional): "native" for the segment format of this
+                module or "parquet" for Parquet files written with pyarrow.
+                Defaults to "native".
+            rotation_interval (RotationInterval | timedelta | None,
+                optional): The interval after which a new log file is
+                started. Defaults to RotationInterval.DAILY. None disables
+                rotation by time.
+            max_bytes (int, optional): The size in bytes after which the log
+                file is rotated to a numbered backup. Defaults to 0, which
+                disables rotation by size.
+            backup_count (int, optional): The number of numbered backups that
+                are kept. Defaults to 5.
+            archiver (Archiver, optional): The archiver that compresses the
+                rotated log files on a background thread and enforces the
+                retention rules. Defaults to None.
+
+        Raises:
+            ValueError: If the backend is unknown, segment_records is less
+                than one or the current log file is not a segment file.
+            ImportError: If the Parquet backend is requested but pyarrow is
+                not installed.
+        """
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown segment backend: {backend!r}")
+        if segment_records < 1:
+            raise ValueError(f"segment_records must be at least 1, got \
+{segment_records}")
+        self.segment_records: int = segment_records
+        self.max_segment_age: float | None = max_segment_age
+        self.compression_level: int = compression_level
+        self.backend: str = backend
+        self._parquet_writer = None
+        if backend == "parquet":
+            import pyarrow  # noqa: F401
+        self._lock: threading.Lock = threading.Lock()
+        self._stop_timer: threading.Event = threading.Event()
+        self._reset()
+
+        self._mk_logdir(path)
+        self.name: str = name
+        self.path: str = path
+        self._rotation: Rotation = Rotation(path, name, _BACKENDS[backend],
+                                            rotation_interval, max_bytes,
+                                            backup_count, archiver)
+        if backend == "parquet" and self._rotation.size:
+            # A Parquet file cannot be appended to.
+            self._rotation.rollover()
+        self.file: str = self._rotation.file
+        if backend == "native":
+            self._repair(self.file)
+
+        if max_segment_age is not None:
+            threading.Thread(
+                target=_flush_when_due,
+                args=(weakref.ref(self), self._stop_timer, max_segment_age),
+                name="loggingpython-SegmentHandler", daemon=True).start()
+        register_for_shutdown(self)
+
+    def emit(self, record: LogRecord | dict) -> None:
+        """
+        Appends a log record to the current segment.
+
+        Args:
+            record (LogRecord | dict): The log record or a dictionary with
+                the details of the log message. Dictionaries are stamped with
+                the time at which they are emitted.
+        """
+        with self._lock:
+            self._append(record)
+            if len(self._created) >= self.segment_records:
+                self._flush_buffer()
+
+    def emit_batch(self, records: Sequence[LogRecord | dict]) -> None:
+        """
+        Appends several log records to the current segment.
+
+        Args:
+            records (Sequence[LogRecord | dict]): The log records to be
+                written.
+        """
+        with self._lock:
+            for record in records:
+                self._append(record)
+                if len(self._created) >= self.segment_records:
+                    self._flush_buffer()
+
+    def _append(self, record: LogRecord | dict) -> None:
+        """
+        Appends a log record to the column arrays. The caller must hold the
+        lock of the handler.
+
+        Args:
+            record (LogRecord | dict): The log record to be appended.
+        """
+        if type(record) is LogRecord:
+            created = record.created
+            levelno = record.levelno
+            loggername = record.loggername
+            message = record.message
+        else:
+            created = time.time()
+            levelno = _SEVERITIES.get(record.get("loglevel", ""), 0)
+            loggername = str(record.get("loggername", ""))
+            message = str(record.get("message", ""))
+        if not self._created:
+            self._started = time.monotonic()
+        self._created.append(int(created * 1_000_000))
+        self._levelno.append(levelno)
+        loggernames = self._loggernames
+        self._loggername_codes.append(
+            loggernames.setdefault(loggername, len(loggernames)))
+        messages = self._messages
+        self._message_codes.append(
+            messages.setdefault(message, len(messages)))
+
+    def _reset(self) -> None:
+        """
+        Starts an empty segment.
+        """
+        self._created: array = array("q")
+        self._levelno: array = array("B")
+        self._loggernames: dict[str, int] = {}
+        self._loggername_codes: array = array("i")
+        self._messages: dict[str, int] = {}
+        self._message_codes: array = array("i")
+        self._started: float = 0.0
+
+    def _flush_buffer(self) -> None:
+        """
+        Writes the current segment to the log file unless it is empty. The
+        caller must hold the lock of the handler.
+        """
+        if not self._created:
+            return
+        if self.backend == "parquet":
+            self._write_parquet()
+        else:
+            segment = self._encode()
+            self._update_file(len(segment))
+            with open(self.file, "ab") as file:
+                file.write(segment)
+        self._reset()
+
+    def _flush_if_due(self) -> float:
+        """
+        Writes the current segment if its oldest log message is older than
+        `max_segment_age` seconds. The caller must hold the lock of the
+        handler.
+
+        Returns:
+            float: The number of seconds until the current segment is due.
+        """
+        if not self._created:
+            return self.max_segment_age
+        age = time.monotonic() - self._started
+        if age < self.max_segment_age:
+            return self.max_segment_age - age
+        self._flush_buffer()
+        return self.max_segment_age
+
+    def _encode(self) -> bytes:
+        """
+        Encodes the current segment.
+
+        Returns:
+            bytes: The header, the index and the compressed columns.
+        """
+        columns = {}
+        blocks = []
+        offset = 0
+
+        def add(data: bytes) -> dict:
+            nonlocal offset
+            block = zlib.compress(data, self.compression_level)
+            blocks.append(block)
+            location = {"offset": offset, "length": len(block)}
+            offset += len(block)
+            return location
+
+        for name, values, dtype in (
+                ("created", self._created, "<i8"),
+                ("levelno", self._levelno, "|u1"),
+                ("loggername", self._loggername_codes, "<i4"),
+                ("message", self._message_codes, "<i4")):
+            if sys.byteorder == "big" and values.itemsize > 1:
+                values = array(values.typecode, values)
+                values.byteswap()
+            columns[name] = add(values.tobytes())
+            columns[name]["dtype"] = dtype
+        for name, dictionary in (("loggername", self._loggernames),
+                                 ("message", self._messages)):
+            columns[name]["dictionary"] = add(json.dumps(
+                list(dictionary), ensure_ascii=False).encode("utf-8"))
+
+        levels: dict[str, int] = {}
+        for levelno in self._levelno:
+            levels[levelno] = levels.get(levelno, 0) + 1
+        index = json.dumps({
+            "records": len(self._created),
+            "min_created": min(self._created),
+            "max_created": max(self._created),
+            "levels": {_LEVEL_NAMES.get(levelno, str(levelno)): count
+                       for levelno, count in sorted(levels.items())},
+            "compression": "zlib",
+            "columns": columns,
+        }, separators=(",", ":")).encode("utf-8")
+        return b"".join((SEGMENT_HEADER.pack(SEGMENT_MAGIC, len(index),
+                                             offset),
+                         index, *blocks))
+
+    def _write_parquet(self) -> None:
+        """
+        Writes the current segment as a row group of the Parquet file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        def dictionary_column(codes: array, dictionary: dict) -> pa.Array:
+            return pa.DictionaryArray.from_arrays(
+                pa.Array.from_buffers(pa.int32(), len(codes),
+                                      [None, pa.py_buffer(codes)]),
+                pa.array(list(dictionary), pa.string()))
+
+        length = len(self._created)
+        table = pa.Table.from_arrays([
+            pa.Array.from_buffers(pa.timestamp("us", tz="UTC"), length,
+                                  [None, pa.py_buffer(self._created)]),
+            pa.Array.from_buffers(pa.uint8(), length,
+                                  [None, pa.py_buffer(self._levelno)]),
+            dictionary_column(self._loggername_codes, self._loggernames),
+            dictionary_column(self._message_codes, self._messages),
+        ], names=list(self.COLUMNS))
+        if self._rotation.due():
+            self._close_parquet_writer()
+            self.file = self._rotation.rollover()
+        if self._parquet_writer is None:
+            self._parquet_writer = pq.ParquetWriter(
+                self.file, table.schema, compression="zstd")
+        self._parquet_writer.write_table(table)
+        self._rotation.size = os.path.getsize(self.file)
+
+    def _close_parquet_writer(self) -> None:
+        """
+        Finishes the current Parquet file.
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def _update_file(self, size: int = 0) -> None:
+        """
+        Rotates the log file if the rotation interval has ended or writing
+        `size` more bytes would exceed the maximum file size.
+
+        Args:
+            size (int, optional): The number of bytes about to be written.
+                Defaults to 0.
+        """
+        rotation = self._rotation
+        if rotation.due(size):
+            self.file = rotation.rollover()
+        rotation.size += size
+
+    def _repair(self, file: str) -> None:
+        """
+        Truncates a log file after its last complete segment, so that a
+        segment torn by a crash does not hide the segments appended later.
+
+        Args:
+            file (str): The path of the log file.
+
+        Raises:
+            ValueError: If the log file does not start with a segment.
+        """
+        try:
+            size = os.path.getsize(file)
+        except OSError:
+            return
+        end = 0
+        with open(file, "rb") as segments:
+            magic = segments.read(len(SEGMENT_MAGIC))
+            if not SEGMENT_MAGIC.startswith(magic):
+                raise ValueError(f"{file} is not a segment file")
+            while end + SEGMENT_HEADER.size <= size:
+                segments.seek(end)
+                magic, index_length, body_length = SEGMENT_HEADER.unpack(
+                    segments.read(SEGMENT_HEADER.size))
+                following = end + SEGMENT_HEADER.size + index_length + \
+                    body_length
+                if magic != SEGMENT_MAGIC or following > size:
+                    break
+                end = following
+        if end < size:
+            os.truncate(file, end)
+            self._rotation.size = end
+
+    def flush(self) -> None:
+        """
+        Writes the current segment to the log file, even if it is not full.
+        """
+        with self._lock:
+            self._flush_buffer()
+
+    def close(self) -> None:
+        """
+        Writes the current segment, stops the timer thread and finishes the
+        log file.
+        """
+        self._stop_timer.set()
+        with self._lock:
+            self._flush_buffer()
+            self._close_parquet_writer()
+        unregister_for_shutdown(self)
+
+    def _mk_logdir(self, logpath: str) -> None:
+        """
+        Creates the log directory if it does not exist.
+
+        Args:
+            logpath (str): The path of the log directory.
+        """
+        if not os.path.exists(logpath):
+            os.makedirs(logpath)
+
+    def __repr__(self) -> str:
+        return f"SegmentHandler({self.name}, {self.path}, \
+{self.segment_records}, {self.backend})"
+
+    def __str__(self) -> str:
+        return f"SegmentHandler with: {self.name}, {self.path}, \
+{self.segment_records} and {self.backend}"
+
+
+def _flush_when_due(handler_ref: weakref.ref,
+                    stop: threading.Event,
+                    max_age: float) -> None:
+    """
+    Writes the current segment of a segment handler once its oldest log
+    message is older than `max_age` seconds, until the handler is closed or
+    garbage collected.
+
+    Args:
+        handler_ref (weakref.ref): A weak reference to the segment handler.
+        stop (threading.Event): The event that is set when the handler is
+            closed.
+        max_age (float): The maximum age of a buffered log message.
+    """
+    delay = max_age
+    while not stop.wait(delay):
+        handler = handler_ref()
+        if handler is None:
+            return
+        try:
+            with handler._lock:
+                delay = handler._flush_if_due()
+        except Exception as e:
+            delay = max_age
+            print(f"{handler!r} failed in flush: {e}", file=sys.stderr)
+        del handler
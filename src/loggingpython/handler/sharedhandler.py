@@ -0,0 +1,177 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `SharedHandler` class, a component of the
+`loggingpython` package that lets any number of loggers write to the same
+log file through a single open file. The `SharedHandler` class is a concrete
+implementation of the abstract `Handler` class that refers to a file-backed
+handler, such as a `FileHandler`, a `CSVHandler`, a `JSONHandler` or an
+`SQLHandler`, from a process-wide registry.
+
+The registry is keyed by the handler class and the resolved path of its log
+file. The first `SharedHandler` for a target creates the handler, and every
+further `SharedHandler` for the same target refers to that handler instead
+of opening the file again. All loggers therefore share one file descriptor
+and one write buffer. The `SharedHandler` does not lock itself: their log
+messages do not interleave because the shared handler serializes its
+writes, the file, CSV and JSON handlers under their lock and the SQL
+handler through its writer thread. The handler is closed when the last
+`SharedHandler` that refers to it is closed.
+
+Example usage:
+
+    from loggingpython.handler import FileHandler, SharedHandler
+
+    # Both plugins write through the same open file logs/app_<date>.log
+    plugin_a_logger.addHandler(SharedHandler(FileHandler, "app"))
+    plugin_b_logger.addHandler(SharedHandler(FileHandler, "app"))
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import os
+import threading
+from typing import Sequence
+
+from .handler import Handler
+from ..log_record import LogRecord
+
+
+_registry_lock: threading.Lock = threading.Lock()
+_shared_handlers: dict[tuple[type, str], Handler] = {}
+_reference_counts: dict[tuple[type, str], int] = {}
+
+
+class SharedHandler(Handler):
+    """
+    `loggingpython`
+
+    A class for sharing one file-backed handler between several loggers.
+
+    This class inherits from the Handler class. It looks up the handler for
+    its target in the process-wide registry, creating it on first use, and
+    passes every log message on to it. Each `SharedHandler` holds one
+    reference to the shared handler; closing it releases the reference, and
+    the shared handler is closed together with the last reference. The
+    options of the first `SharedHandler` for a target create the shared
+    handler, later options for the same target are ignored.
+    """
+
+    def __init__(self,
+                 handler_class: type[Handler],
+                 name: str,
+                 path: str = "logs",
+                 **options) -> None:
+        """
+        Initializes the SharedHandler and acquires a reference to the shared
+        handler for the target.
+
+        Args:
+            handler_class (type[Handler]): The class of the file-backed
+                handler, for example FileHandler.
+            name (str): The name of the log file.
+            path (str, optional): The path where the log files will be
+                stored. Defaults to "logs".
+            **options: Further keyword arguments for the handler class, used
+                only if the shared handler is created.
+        """
+        self.handler_class: type[Handler] = handler_class
+        self.name: str = name
+        self.path: str = path
+        self.key: tuple[type, str] = (
+            handler_class, os.path.realpath(os.path.join(path, name)))
+        self._closed: bool = False
+
+        with _registry_lock:
+            handler = _shared_handlers.get(self.key)
+            if handler is None:
+                handler = handler_class(name, path, **options)
+                _shared_handlers[self.key] = handler
+                _reference_counts[self.key] = 0
+            _reference_counts[self.key] += 1
+        self.handler: Handler = handler
+
+    @property
+    def references(self) -> int:
+        """
+        The number of open `SharedHandler` objects that refer to the shared
+        handler.
+        """
+        with _registry_lock:
+            if _shared_handlers.get(self.key) is not self.handler:
+                return 0
+            return _reference_counts[self.key]
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        Passes a log message to the shared handler.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        self.handler.emit(record)
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Passes several log messages to the shared handler.
+
+        Args:
+            records (Sequence[LogRecord]): The log records to be processed.
+        """
+        self.handler.emit_batch(records)
+
+    def flush(self) -> None:
+        """
+        Flushes the shared handler.
+        """
+        self.handler.flush()
+
+    def close(self) -> None:
+        """
+        Releases the reference to the shared handler and closes the shared
+        handler if this was the last reference. Closing a SharedHandler
+        twice releases its reference only once.
+        """
+        with _registry_lock:
+            if self._closed:
+                return
+            self._closed = True
+            if _shared_handlers.get(self.key) is not self.handler:
+                return
+            _reference_counts[self.key] -= 1
+            if _reference_counts[self.key]:
+                return
+            del _shared_handlers[self.key]
+            del _reference_counts[self.key]
+        self.handler.close()
+
+    def __repr__(self) -> str:
+        return f"SharedHandler({self.handler_class.__name__}, {self.name}, \
+{self.path})"
+
+    def __str__(self) -> str:
+        return f"SharedHandler with: {self.handler_class.__name__}, \
+{self.name} and {self.path}"
@@ -33,12 +33,23 @@ where a full-fledged database system might be overkill. It ensures that
 log messages are stored in a structured and easily accessible format, making
 it suitable for further analysis or review.
 
+The log messages are written by a writer thread of the handler, which owns
+a single connection to the current log database for the lifetime of the
+handler, since SQLite connections are bound to the thread that opened them.
+`emit()` only converts the log message into a row and puts it into a queue.
+The writer thread inserts all rows that are queued at once with one
+`executemany` of the same prepared INSERT statement and commits them
+together. The database uses write-ahead logging (WAL), and the `synchronous`
+pragma is configurable, so that a commit does not have to wait for the disk.
+`flush()` waits until every queued row is committed, and `close()` commits
+the remaining rows and closes the connection.
+
 Example usage:
 
     from loggingpython.handler import SQLHandler
 
     # Set up a SQL handler
-    sql_handler = SQLHandler('logfile', path='logs', db_type='sqlite')
+    sql_handler = SQLHandler('logfile', path='logs', synchronous='NORMAL')
 
     # Add the SQL handler to the logger
     logger.addHandler(sql_handler)
@@ -52,10 +63,23 @@ handling and logging mechanisms for both client and server-side operations.
 """
 
 import os
-from datetime import datetime
+import queue
 import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Sequence
 
 from .handler import Handler
+from ..archiver import Archiver
+from ..lifecycle import register_for_shutdown, unregister_for_shutdown
+from ..rotation import Rotation
+from ..rotation_interval import RotationInterval
+
+
+_COLUMNS: str = "hash_message, message, loglevel, asctime, iso_8601_time, \
+loggername"
 
 
 class SQLHandler(Handler):
@@ -66,17 +90,37 @@ class SQLHandler(Handler):
 
     This class inherits from the Handler class and implements specific
     methods for formatting and outputting log messages into SQL databases. It
-    supports the creation of new log databases based on the current date and
-    allows customization of the log format string. The SQLHandler ensures
+    supports the rotation of the log databases by time interval and file size
+    and allows customization of the log format string. The SQLHandler ensures
     that log messages are stored in a structured and easily accessible format,
     making it suitable for further analysis or review. It also includes
     features for updating the log database if the current date has changed and
     for creating the necessary database structure.
+
+    The rows are written by a writer thread that keeps one connection to the
+    current log database open. Rows emitted after the handler has been
+    closed, and rows that could not be written, are dropped and counted in
+    `dropped`.
     """
 
+    SYNCHRONOUS_MODES: tuple[str, ...] = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+    _INSERT: str = f"""
+                INSERT INTO logs ({_COLUMNS})
+                VALUES (?, ?, ?, ?, ?, ?)
+                """
+
     def __init__(self,
                  name: str,
-                 path: str = "logs") -> None:
+                 path: str = "logs",
+                 rotation_interval: RotationInterval | timedelta | None =
+                 RotationInterval.DAILY,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 archiver: Archiver | None = None,
+                 synchronous: str = "NORMAL",
+                 maxsize: int = 100000,
+                 batch_size: int = 10000) -> None:
         """
         Initializes the SQLHandler with the given name, log path, and log
             format string.
@@ -88,49 +132,256 @@ class SQLHandler(Handler):
             logformat_string (str, optional): The format string for the log
                 messages. Defaults to "%(asctime)s: [%(loggername)s]:
                 [%(loglevel)s]: %(message)s".
+            rotation_interval (RotationInterval | timedelta | None,
+                optional): The interval after which a new log database is
+                started. Defaults to RotationInterval.DAILY. None disables
+                rotation by time.
+            max_bytes (int, optional): The size in bytes after which the log
+                database is rotated to a numbered backup. The database is
+                rotated once it has exceeded this size. Defaults to 0, which
+                disables rotation by size.
+            backup_count (int, optional): The number of numbered backups that
+                are kept. Defaults to 5.
+            archiver (Archiver, optional): The archiver that compresses the
+                rotated log files on a background thread and enforces the
+                retention rules. Defaults to None.
+            synchronous (str, optional): The `synchronous` pragma of the
+                database: "OFF", "NORMAL", "FULL" or "EXTRA". With WAL,
+                "NORMAL" does not lose committed log messages when the
+                application crashes, but may lose the last ones on a power
+                failure. Defaults to "NORMAL".
+            maxsize (int, optional): The maximum number of queued rows.
+                `emit()` blocks while the queue is full. Defaults to 100000.
+            batch_size (int, optional): The maximum number of rows committed
+                in one transaction. Defaults to 10000.
+
+        Raises:
+            ValueError: If the synchronous mode is unknown.
+            sqlite3.Error: If the log database cannot be created.
         """
+        if synchronous.upper() not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"Unknown synchronous mode: {synchronous!r}")
+        self.synchronous: str = synchronous.upper()
+        self.batch_size: int = batch_size
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.dropped: int = 0
+        self.closed: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
         self._mk_logdir(path)
         self.name: str = name
         self.path: str = path
-        self._current_date: str = datetime.now().strftime("%Y-%m-%d")
-        self.file: str = f"{self.path}/{self.name}_{self._current_date}.db"
+        self._rotation: Rotation = Rotation(path, name, "db",
+                                            rotation_interval, max_bytes,
+                                            backup_count, archiver)
+        self.file: str = self._rotation.file
         self._mk_logfile(self.file)
         self._creat_db()
 
+        self._writer: threading.Thread = threading.Thread(
+            target=self._write, name="loggingpython-SQLHandler",
+            daemon=True)
+        self._writer.start()
+        register_for_shutdown(self)
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of rows and batches that are currently queued.
+        """
+        return self.queue.qsize()
+
     def emit(self, record: dict) -> None:
         """
-        Writes a log record to the database.
+        Queues a log record for the writer thread.
+
+        Args:
+            record (dict): A dictionary containing the log record details.
+        """
+        if self.closed:
+            self._count_dropped(1)
+            return
+        self.queue.put(self._to_row(record))
+
+    def emit_batch(self, records: Sequence[dict]) -> None:
+        """
+        Queues several log records for the writer thread, which inserts them
+        in the same transaction.
+
+        Args:
+            records (Sequence[dict]): The log records to be written.
+        """
+        if self.closed:
+            self._count_dropped(len(records))
+            return
+        self.queue.put([self._to_row(record) for record in records])
+
+    def _count_dropped(self, count: int) -> None:
+        """
+        Counts log records that were dropped.
+
+        Args:
+            count (int): The number of dropped log records.
+        """
+        with self._lock:
+            self.dropped += count
+
+    def _write(self) -> None:
+        """
+        Takes the rows from the queue and inserts them into the current log
+        database until the handler is closed.
+        """
+        connection = None
+        stop = False
+        while not stop:
+            items = [self.queue.get()]
+            rows = 0
+            while rows < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                items.append(item)
+                rows += len(item) if type(item) is list else 1
+            try:
+                connection, stop = self._process(connection, items)
+            finally:
+                for _ in items:
+                    self.queue.task_done()
+        if connection is not None:
+            connection.close()
+
+    def _process(self, connection: sqlite3.Connection | None,
+                 items: list) -> tuple[sqlite3.Connection | None, bool]:
+        """
+        Inserts the queued rows with a single `executemany` and a single
+        commit.
+
+        Args:
+            connection (sqlite3.Connection | None): The connection to the
+                current log database, or None if it is not open yet.
+            items (list): The items taken from the queue.
+
+        Returns:
+            tuple[sqlite3.Connection | None, bool]: The connection to the
+                current log database, and whether the writer thread has to
+                stop.
+        """
+        stop = False
+        rows: list[tuple] = []
+        for item in items:
+            if item is _STOP:
+                stop = True
+            elif type(item) is list:
+                rows.extend(item)
+            else:
+                rows.append(item)
+        if not rows:
+            return connection, stop
+        try:
+            if self._rotation.due():
+                if connection is not None:
+                    connection.close()
+                    connection = None
+                self._update_file()
+            if connection is None:
+                connection = self._connect()
+            try:
+                connection.executemany(self._INSERT, rows)
+            except sqlite3.IntegrityError:
+                connection.rollback()
+                self._insert_each(connection, rows)
+            connection.commit()
+            self._update_size()
+        except Exception as e:
+            print(f"{self!r} failed to write {len(rows)} log records: {e}",
+                  file=sys.stderr)
+            self._count_dropped(len(rows))
+            if connection is not None:
+                connection.close()
+            connection = None
+        return connection, stop
+
+    def _insert_each(self, connection: sqlite3.Connection,
+                     rows: list[tuple]) -> None:
+        """
+        Inserts the rows of a batch that violated a constraint one by one,
+        so that only the offending rows are lost. They are counted in
+        `dropped`.
+
+        Args:
+            connection (sqlite3.Connection): The connection to the current
+                log database.
+            rows (list[tuple]): The rows of the batch.
+        """
+        lost = 0
+        error = None
+        for row in rows:
+            try:
+                connection.execute(self._INSERT, row)
+            except sqlite3.IntegrityError as e:
+                lost += 1
+                error = e
+        if lost:
+            print(f"{self!r} failed to write {lost} log records: {error}",
+                  file=sys.stderr)
+            self._count_dropped(lost)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens the connection of the writer thread to the current log
+        database.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.file)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(f"PRAGMA synchronous={self.synchronous}")
+        return connection
+
+    def _to_row(self, record: dict) -> tuple:
+        """
+        Converts a log record into the values of a row of the logs table.
 
         Args:
             record (dict): A dictionary containing the log record details.
+
+        Returns:
+            tuple: The values for the INSERT statement.
         """
-        hash_message = hash(str(record))
+        hash_message = hash(repr(record))
         message = record.get("message", "")
         loglevel = record.get("loglevel", "")
         asctime = record.get("asctime", "")
         iso_8601_time = record.get("iso_8601_time", "")
         loggername = record.get("loggername", "")
-
-        with sqlite3.connect(self.file) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO logs (hash_message, message, loglevel, asctime, \
-iso_8601_time, loggername)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (hash_message, message, loglevel, asctime, iso_8601_time,
-                 loggername)
-            )
-            conn.commit()
+        return (hash_message, message, loglevel, asctime, iso_8601_time,
+                loggername)
 
     def _creat_db(self) -> None:
-        with sqlite3.connect(self.file) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        """
+        Creates the logs table and switches the log database to write-ahead
+        logging, which is stored in the database file. The rows are keyed by
+        an autoincrementing id, so that log messages which are emitted more
+        than once are all stored; `hash_message` is only indexed. A logs
+        table of earlier versions, keyed by `hash_message`, is migrated with
+        its rows.
+        """
+        conn = sqlite3.connect(self.file, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            columns = [row[1] for row in
+                       conn.execute("PRAGMA table_info(logs)")]
+            migrate = bool(columns) and "id" not in columns
+            conn.execute("BEGIN")
+            if migrate:
+                conn.execute("ALTER TABLE logs RENAME TO logs_by_hash")
+            conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS logs (
-                    hash_message TEXT PRIMARY KEY,
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    hash_message TEXT,
                     message TEXT,
                     loglevel TEXT,
                     asctime TEXT,
@@ -138,25 +389,78 @@ iso_8601_time, loggername)
                     loggername TEXT
                 )"""
             )
-            conn.commit()
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS logs_hash_message
+                ON logs (hash_message)"""
+            )
+            if migrate:
+                conn.execute(
+                    f"""
+                    INSERT INTO logs ({_COLUMNS})
+                    SELECT {_COLUMNS} FROM logs_by_hash ORDER BY rowid"""
+                )
+                conn.execute("DROP TABLE logs_by_hash")
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
 
     def _update_file(self) -> None:
         """
-        Updates the log file if the current date has changed.
+        Starts a new log database if the rotation interval has ended or the
+        log database has exceeded the maximum file size. The connection to
+        the current log database must have been closed before.
         """
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        if current_date != self._current_date:
-            self._current_date = current_date
-            self.file = f"{self.path}/{self.name}_{self._current_date}.db"
+        if self._rotation.due():
+            self.file = self._rotation.rollover()
             self._mk_logfile(self.file)
             self._creat_db()
 
-    def _close_file(self) -> None:
+    def _update_size(self) -> None:
+        """
+        Records the current size of the log database, including its
+        write-ahead log, for rotation by size.
+        """
+        if self._rotation.max_bytes:
+            wal = self.file + "-wal"
+            self._rotation.size = os.path.getsize(self.file) + \
+                (os.path.getsize(wal) if os.path.exists(wal) else 0)
+
+    def flush(self, timeout: float | None = None) -> bool:
         """
-        Closes the current log file.
+        Waits until all queued log records have been committed.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait.
+                Defaults to None, which waits until the queue is drained.
+
+        Returns:
+            bool: True if the queue was drained in time, False otherwise.
         """
-        if self.file:
-            self.file.close()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                if deadline is None:
+                    self.queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """
+        Commits the queued log records, stops the writer thread and closes
+        its connection. Log records emitted afterwards are dropped.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+        self.queue.put(_STOP)
+        self._writer.join()
+        unregister_for_shutdown(self)
 
     def _mk_logdir(self, logpath: str) -> None:
         """
@@ -188,7 +492,11 @@ iso_8601_time, loggername)
         return datetime.now().strftime("%Y-%m-%d")
 
     def __repr__(self) -> str:
-        return f"SQLHandler({self.name}, {self.path})"
+        return f"SQLHandler({self.name}, {self.path}, {self.synchronous})"
 
     def __str__(self) -> str:
-        return f"SQLHandler with:{self.name} and {self.path}"
+        return f"SQLHandler with: {self.name}, {self.path} and \
+{self.synchronous}"
+
+
+_STOP: object = object()
@@ -60,6 +60,8 @@ import json
 from functools import partial
 
 from .handler import Handler
+from ..json_encoder import JSONEncoder
+from ..log_record import LogRecord
 from ..sys_protocolls import SysProtocolls
 from ..error.server_unreachable_error import ServerUnreachableError
 from ..error.server_method_call_error import ServerMethodCallError
@@ -82,6 +84,9 @@ class SysHandler(Handler):
     unreachability and incorrect method calls.
     """
 
+    _LOGFORMAT_FIELDS: tuple[str, ...] = LogRecord.FIELDS + ("client_name",
+                                                             "client_addr")
+
     def __init__(self,
                  name: str = "client",
                  client: bool = True,
@@ -111,8 +116,14 @@ class SysHandler(Handler):
 
         This method sets up the socket, binds it to the specified server
         address, and initializes the handler based on the provided parameters.
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
         """
+        self.logformat_string = logformat_string
         self.name = name
+        self._encoder = JSONEncoder({"client_name": name})
         self.client = client
         self.protocoll = protocoll
         self.server_name = server_name
@@ -120,7 +131,6 @@ class SysHandler(Handler):
         self._syssocket = socket.socket(socket.AF_INET,
                                         self.protocoll.value)
         self.server_addr = (self.server_name, self.port)
-        self.logformat_string = logformat_string
 
         if self.protocoll == SysProtocolls.TCP:
             self._connect_client = partial(self._connect_client_tcp)
@@ -261,19 +271,14 @@ class SysHandler(Handler):
         """
         Sends a log message to the server over TCP.
 
-        This method formats the log message, encodes it into bytes, and sends
-        it to the server using TCP. It also listens for a response from the
-        server.
+        This method encodes the log message as JSON with the pre-encoded
+        client name, and sends it to the server using TCP. It also listens
+        for a response from the server.
 
         Args:
             record (dict): A dictionary containing the log message details.
         """
-        formatted_message = self._format_message(record)
-        formatted_message["client_name"] = self.name
-
-        message_str = json.dumps(formatted_message)
-
-        message_bytes = message_str.encode('utf-8')
+        message_bytes = self._encoder.encode(record)
 
         self._syssocket.sendall(message_bytes)
 
@@ -285,19 +290,14 @@ class SysHandler(Handler):
         """
         Sends a log message to the server over UDP.
 
-        This method formats the log message, encodes it into bytes, and sends
-        it to the server using UDP. It also listens for a response from the
-        server.
+        This method encodes the log message as JSON with the pre-encoded
+        client name, and sends it to the server using UDP. It also listens
+        for a response from the server.
 
         Args:
             record (dict): A dictionary containing the log message details.
         """
-        formatted_message = self._format_message(record)
-        formatted_message["client_name"] = self.name
-
-        message_str = json.dumps(formatted_message)
-
-        message_bytes = message_str.encode('utf-8')
+        message_bytes = self._encoder.encode(record)
         self._syssocket.sendto(message_bytes, self.server_addr)
 
     @_server_only
@@ -335,8 +335,7 @@ class SysHandler(Handler):
 
                 print(f"Received message: '{received_dict}' from {addr}")
                 received_dict["client_addr"] = addr
-                logformat_string = self.logformat_string
-                log_message = logformat_string % received_dict
+                log_message = self._logformat.render(received_dict)
 
                 self._logger.info(log_message)
 
@@ -359,8 +358,7 @@ class SysHandler(Handler):
             print(f"Received message: '{received_dict}' from {addr}")
 
             received_dict["client_addr"] = addr
-            logformat_string = self.logformat_string
-            log_message = logformat_string % received_dict
+            log_message = self._logformat.render(received_dict)
 
             self._logger.info(log_message)
 
@@ -0,0 +1,155 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `JSONEncoder` class, which serializes log records to
+JSON for the handlers of the `loggingpython` package that write or send JSON,
+such as the `JSONHandler`, the `SysHandler` and the `AsyncSysHandler`.
+
+The encoder uses `orjson` when it is installed, which serializes a log record
+several times faster than the standard library, and falls back to the `json`
+module of the standard library otherwise. Fields that are the same for every
+log record of a handler, such as the `client_name` of a `SysHandler` or the
+host and service name of an application, are encoded once when the encoder
+is created, and their bytes are spliced into every encoded log record.
+
+Example usage:
+
+    from loggingpython import JSONEncoder, JSONFormat, JSONHandler
+
+    encoder = JSONEncoder(static_fields={"host": "web-17", "service": "api"})
+    json_handler = JSONHandler("app", json_format=JSONFormat.NDJSON,
+                               encoder=encoder)
+
+The fast backend is installed with the `fast` extra:
+
+    pip install loggingpython[fast]
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import json
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+from .log_record import LogRecord
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONEncoder:
+    """
+    `loggingpython`
+
+    A class for encoding log records as compact JSON objects.
+
+    The fields of a log record are read in the order given, collected into a
+    dictionary and serialized with the selected backend. The pre-encoded
+    static fields are then appended in front of the closing brace. The
+    encoded log record is a single line of UTF-8 encoded JSON without any
+    insignificant whitespace, as required for NDJSON.
+    """
+
+    BACKENDS: tuple[str, ...] = ("orjson", "json")
+
+    def __init__(self,
+                 static_fields: Mapping[str, Any] | None = None,
+                 fields: Iterable[str] = LogRecord.FIELDS,
+                 backend: str | None = None) -> None:
+        """
+        Initializes the JSONEncoder and encodes the static fields.
+
+        Args:
+            static_fields (Mapping[str, Any], optional): Fields with the same
+                value for every log record. They replace record fields of
+                the same name. Defaults to None.
+            fields (Iterable[str], optional): The fields read from every log
+                record. Defaults to the fields of a `LogRecord`.
+            backend (str, optional): "orjson" or "json". Defaults to None,
+                which selects orjson if it is installed and json otherwise.
+
+        Raises:
+            ValueError: If the backend is unknown.
+            ImportError: If orjson is selected but not installed.
+        """
+        if backend is None:
+            backend = "json" if orjson is None else "orjson"
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{backend}', expected \
+one of {', '.join(self.BACKENDS)}")
+        if backend == "orjson" and orjson is None:
+            raise ImportError("The orjson backend requires orjson, install \
+it with: pip install loggingpython[fast]")
+        self.backend: str = backend
+        self.static_fields: dict[str, Any] = dict(static_fields or {})
+        self.fields: tuple[str, ...] = tuple(
+            field for field in fields if field not in self.static_fields)
+
+        if backend == "orjson":
+            self._dumps: Callable[[Any], bytes] = orjson.dumps
+        else:
+            encode = json.JSONEncoder(ensure_ascii=False,
+                                      separators=(",", ":")).encode
+            self._dumps = lambda values: encode(values).encode("utf-8")
+
+        self._getter: attrgetter | None = None
+        if len(self.fields) > 1:
+            self._getter = attrgetter(*self.fields)
+        self._static_suffix: bytes = b""
+        if self.static_fields:
+            static = self._dumps(self.static_fields)[1:]
+            self._static_suffix = b"," + static if self.fields else static
+
+    def encode(self, record: LogRecord | Mapping) -> bytes:
+        """
+        Encodes a log record as a compact JSON object.
+
+        Args:
+            record (LogRecord | Mapping): The log record or a mapping with the
+                details of the log message. Missing fields of a mapping are
+                encoded as empty strings.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON object.
+        """
+        if self._getter is not None and isinstance(record, LogRecord):
+            values = dict(zip(self.fields, self._getter(record)))
+        else:
+            values = {field: record.get(field, "") for field in self.fields}
+        if self._static_suffix:
+            return self._dumps(values)[:-1] + self._static_suffix
+        return self._dumps(values)
+
+    def __repr__(self) -> str:
+        return f"JSONEncoder({self.static_fields}, {self.fields}, \
+{self.backend})"
+
+    def __str__(self) -> str:
+        return f"JSONEncoder with: {self.static_fields}, {self.fields} and \
+{self.backend}"
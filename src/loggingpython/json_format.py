@@ -0,0 +1,66 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `JSONFormat` class, an enumeration of the file
+layouts the `JSONHandler` of the `loggingpython` package can write.
+
+The `JSONFormat` class includes three members: DOCUMENT, NDJSON and ARRAY.
+DOCUMENT keeps all log messages of the current log file in a single JSON
+object, which is rewritten for every log message. NDJSON appends every log
+message as a compact JSON object on a line of its own (newline-delimited
+JSON), which costs the same for every log message no matter how large the
+file already is. ARRAY appends every log message as an element of a single
+JSON array at the same cost, for readers that need one valid JSON
+document.
+
+Example usage:
+
+    from loggingpython import JSONFormat, JSONHandler
+
+    # Append one JSON object per line to logs/app_<date>.ndjson
+    json_handler = JSONHandler("app", json_format=JSONFormat.NDJSON)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from enum import Enum
+
+
+class JSONFormat(Enum):
+    """
+    `loggingpython`
+
+    Enum class that represents the file layouts of the JSONHandler.
+
+    This class defines three enum members: DOCUMENT, NDJSON and ARRAY.
+    DOCUMENT writes `.json` files that hold one JSON object, NDJSON writes
+    `.ndjson` files with one JSON object per line, and ARRAY writes `.json`
+    files that hold one JSON array with one element per line.
+    """
+
+    DOCUMENT = "document"
+    NDJSON = "ndjson"
+    ARRAY = "array"
@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module provides the shutdown mechanism of the `loggingpython` package.
+Handlers that buffer log messages or deliver them from a background thread
+register themselves here, and all registered handlers are closed when the
+interpreter exits, so that no queued or buffered log message is lost. The
+`Archiver` registers itself the same way to finish its queued log files.
+
+The handlers are referenced weakly, so registering a handler does not keep it
+alive. `shutdown()` can also be called explicitly, for example at the end of
+a worker process, and closes every registered handler that still exists.
+
+Example usage:
+
+    import loggingpython
+
+    # Close all registered handlers and write out their pending messages
+    loggingpython.shutdown()
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import atexit
+import sys
+import weakref
+
+from .handler.handler import Handler
+
+
+_registered_handlers: weakref.WeakSet = weakref.WeakSet()
+
+
+def register_for_shutdown(handler: Handler) -> None:
+    """
+    Registers a handler to be closed by `shutdown()`.
+
+    Args:
+        handler (Handler): The handler to close when the interpreter exits.
+    """
+    _registered_handlers.add(handler)
+
+
+def unregister_for_shutdown(handler: Handler) -> None:
+    """
+    Removes a handler from the handlers closed by `shutdown()`.
+
+    Args:
+        handler (Handler): The handler that has already been closed.
+    """
+    _registered_handlers.discard(handler)
+
+
+def shutdown() -> None:
+    """
+    Closes all registered handlers.
+
+    Errors of individual handlers are printed to stderr and do not prevent
+    the other handlers from being closed.
+    """
+    for handler in list(_registered_handlers):
+        try:
+            handler.close()
+        except Exception as e:
+            print(f"Failed to close {handler!r}: {e}", file=sys.stderr)
+
+
+atexit.register(shutdown)
@@ -0,0 +1,257 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `LogFormat` class, which compiles the
+`logformat_string` of a handler within the `loggingpython` package. A log
+format string such as `"%(asctime)s: [%(loglevel)s]: %(message)s"` is parsed
+once when the handler is set up, and the resulting `LogFormat` renders log
+records without building an intermediate dictionary for every record.
+
+Compiling the format string also validates it: unknown fields and malformed
+placeholders raise an `InvalidLogFormatError` when the handler is created
+instead of when the first log message is emitted. Fields that the format
+string does not reference are never read from the record, so for example a
+format without `%(asctime)s` never renders a timestamp.
+
+The same compiled format parses the lines a handler has written back into
+their fields, which is what the log file reader in
+`loggingpython.log_reader` uses.
+
+Example usage:
+
+    from loggingpython.log_format import LogFormat
+
+    logformat = LogFormat("[%(loglevel)s] %(message)s")
+    print(logformat.fields)
+    print(logformat.render(record))
+    print(logformat.parse("[INFO] Service started"))
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import re
+from collections.abc import Mapping
+from operator import attrgetter
+from typing import Iterable
+
+from .log_record import LogRecord
+from .error.invalid_log_format_error import InvalidLogFormatError
+
+
+class LogFormat:
+    """
+    `loggingpython`
+
+    A class for rendering log records with a precompiled log format string.
+
+    The named placeholders of the log format string are replaced by
+    positional ones, and the referenced field names are collected in order.
+    Rendering a `LogRecord` then reads exactly these fields as attributes and
+    applies the positional template to them. Other mappings, such as the
+    dictionaries received by a `SysHandler` server, are read with `get()` and
+    missing fields are rendered as empty strings.
+
+    Parsing does the reverse: every placeholder becomes a non-greedy group of
+    a regular expression that must match the whole line, so the literal text
+    between the placeholders separates the fields. Further appearances of a
+    field with the same conversion refer back to its first appearance.
+    """
+
+    _PLACEHOLDER: re.Pattern = re.compile(
+        r"%(?:\((?P<field>[^)]*)\)(?P<spec>[#0 +\-]*\d*(?:\.\d+)?"
+        r"[diouxXeEfFgGcrsa])|(?P<percent>%))")
+
+    def __init__(self,
+                 logformat_string: str,
+                 fields: Iterable[str] = LogRecord.FIELDS) -> None:
+        """
+        Initializes the LogFormat by compiling the given log format string.
+
+        Args:
+            logformat_string (str): The `%`-style log format string.
+            fields (Iterable[str], optional): The field names the format
+                string may reference. Defaults to the fields of a
+                `LogRecord`.
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
+        """
+        self.logformat_string: str = logformat_string
+        self._template, self.fields, self._pattern_source, \
+            self._padded = self._compile(logformat_string, frozenset(fields))
+        self._pattern: re.Pattern | None = None
+        self._search_pattern: re.Pattern | None = None
+        self._attrgetter: attrgetter | None = None
+        if len(self.fields) > 1:
+            self._attrgetter = attrgetter(*self.fields)
+        elif self.fields:
+            field = attrgetter(self.fields[0])
+            self._attrgetter = lambda record: (field(record),)
+
+    def _compile(self, logformat_string: str,
+                 allowed_fields: frozenset[str]) -> tuple[str, tuple, str,
+                                                          frozenset[int]]:
+        """
+        Translates the log format string into a positional template and the
+        source of the regular expression that parses its output.
+
+        Args:
+            logformat_string (str): The `%`-style log format string.
+            allowed_fields (frozenset[str]): The field names the format
+                string may reference.
+
+        Returns:
+            tuple: The positional template, the referenced field names in
+                order of appearance, the source of the parsing pattern and
+                the positions of the fields that are padded to a width.
+
+        Raises:
+            InvalidLogFormatError: If the log format string references an
+                unknown field or contains an invalid placeholder.
+        """
+        template: list[str] = []
+        fields: list[str] = []
+        pattern: list[str] = []
+        specs: list[str] = []
+        padded: set[int] = set()
+        position = 0
+        while True:
+            index = logformat_string.find("%", position)
+            if index == -1:
+                template.append(logformat_string[position:])
+                pattern.append(re.escape(logformat_string[position:]))
+                break
+            template.append(logformat_string[position:index])
+            pattern.append(re.escape(logformat_string[position:index]))
+            match = self._PLACEHOLDER.match(logformat_string, index)
+            if match is None:
+                raise InvalidLogFormatError(
+                    logformat_string,
+                    f"invalid placeholder at position {index}")
+            if match["percent"]:
+                template.append("%%")
+                pattern.append("%")
+            else:
+                field = match["field"]
+                if field not in allowed_fields:
+                    raise InvalidLogFormatError(logformat_string,
+                                                f"unknown field '{field}'")
+                if any(character.isdigit() for character in match["spec"]):
+                    padded.add(len(fields))
+                if field in fields and \
+                        specs[fields.index(field)] == match["spec"]:
+                    pattern.append(f"(?P=_{fields.index(field)})")
+                elif field in fields:
+                    pattern.append(".*?")
+                else:
+                    pattern.append(f"(?P<_{len(fields)}>.*?)")
+                fields.append(field)
+                specs.append(match["spec"])
+                template.append("%" + match["spec"])
+            position = match.end()
+        return "".join(template), tuple(fields), "".join(pattern), \
+            frozenset(padded)
+
+    def render(self, record: LogRecord | Mapping) -> str:
+        """
+        Renders a log record with the compiled log format string.
+
+        Args:
+            record (LogRecord | Mapping): The log record or a mapping with the
+                details of the log message.
+
+        Returns:
+            str: The formatted log message.
+        """
+        if self._attrgetter is None:
+            return self._template % ()
+        if isinstance(record, LogRecord):
+            return self._template % self._attrgetter(record)
+        return self._template % tuple(record.get(field, "")
+                                      for field in self.fields)
+
+    def parse(self, line: str) -> dict[str, str] | None:
+        """
+        Parses a line written with the compiled log format string back into
+        its fields.
+
+        Fields that are padded to a width are stripped. A field that appears
+        more than once takes the value of its first appearance.
+
+        Args:
+            line (str): The formatted log message without the line break.
+
+        Returns:
+            dict[str, str] | None: The fields of the log message, or None if
+                the line does not match the log format string.
+        """
+        if self._pattern is None:
+            self._pattern = re.compile(self._pattern_source, re.DOTALL)
+        match = self._pattern.fullmatch(line)
+        if match is None:
+            return None
+        values: dict[str, str] = {}
+        for group, value in match.groupdict().items():
+            position = int(group[1:])
+            if position in self._padded:
+                value = value.strip()
+            values[self.fields[position]] = value
+        return values
+
+    def parse_lines(self, lines):
+        """
+        Parses a pandas Series of lines written with the compiled log format
+        string back into their fields, with one vectorized regular expression
+        pass instead of one `parse()` call per line.
+
+        Fields that are padded to a width are stripped. A field that appears
+        more than once takes the value of its first appearance.
+
+        Args:
+            lines (pandas.Series): The formatted log messages without their
+                line breaks.
+
+        Returns:
+            pandas.DataFrame: One column per field and one row per line. The
+                rows of the lines that do not match the log format string
+                are NaN.
+        """
+        if self._search_pattern is None:
+            self._search_pattern = re.compile(
+                rf"\A(?:{self._pattern_source})\Z", re.DOTALL)
+        frame = lines.str.extract(self._search_pattern, expand=True)
+        for group in frame.columns:
+            if int(group[1:]) in self._padded:
+                frame[group] = frame[group].str.strip()
+        return frame.rename(columns={group: self.fields[int(group[1:])]
+                                     for group in frame.columns})
+
+    def __repr__(self) -> str:
+        return f"LogFormat({self.logformat_string})"
+
+    def __str__(self) -> str:
+        return f"LogFormat with: {self.logformat_string}"
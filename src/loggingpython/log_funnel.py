@@ -0,0 +1,343 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `LogFunnel` class, the writer side of the
+multiprocess logging funnel of the `loggingpython` package. A `LogFunnel`
+starts a single writer process that owns the handlers which write the log
+files, and hands out `ProcessHandler` instances that send the log records of
+any number of worker processes to it, every process over a connection of
+its own.
+
+Because only the writer process opens the log files, worker processes of a
+`multiprocessing.Pool` or a `concurrent.futures.ProcessPoolExecutor` no
+longer open the same daily file independently or overwrite each other's
+JSON files. The handlers are created inside the writer process from the
+given handler factories, such as a handler class or a `functools.partial`
+of it, which must be picklable if processes are spawned. A worker process
+that crashes, even in the middle of sending a log record, only closes its
+own connection; the writer process keeps writing the records of all other
+workers. Closing the funnel writes all received log records, closes the
+handlers and stops the writer process, and open funnels are closed
+automatically when the interpreter exits.
+
+Example usage:
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    from loggingpython import LogFunnel, getLogger
+    from loggingpython.handler import FileHandler, JSONHandler
+
+    logger = getLogger("worker")
+
+    def init_worker(handler):
+        logger.addHandler(handler)
+
+    funnel = LogFunnel(partial(FileHandler, "batch"),
+                       partial(JSONHandler, "batch"))
+    with ProcessPoolExecutor(initializer=init_worker,
+                             initargs=(funnel.handler(),)) as pool:
+        pool.map(work, items)
+    funnel.close()
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import atexit
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Callable
+
+from .handler.handler import Handler
+from .handler.processhandler import ProcessHandler
+
+
+_STOP: None = None
+_BACKLOG: int = 128
+
+
+class LogFunnel:
+    """
+    `loggingpython`
+
+    A class for funnelling the log records of several processes into one
+    writer process.
+
+    This class starts the writer process on initialization. The writer
+    process creates its handlers by calling the handler factories and
+    accepts a connection from every process that logs through the funnel.
+    A reader thread per connection puts the received log records into a
+    queue, from which the writer process takes them in batches of the
+    records that have piled up and passes them to `emit_batch` of its
+    handlers. Errors of the handlers are printed to stderr and do not stop
+    the writer process. Keyboard interrupts are ignored by the writer
+    process, so that the log records sent before an interrupted pool shuts
+    down are still written.
+    """
+
+    def __init__(self,
+                 *handler_factories: Callable[[], Handler],
+                 maxsize: int = 0,
+                 batch_size: int = 100,
+                 shutdown_timeout: float = 5.0,
+                 start_method: str | None = None) -> None:
+        """
+        Initializes the LogFunnel and starts its writer process.
+
+        Args:
+            *handler_factories (Callable[[], Handler]): Callables that create
+                the handlers of the writer process.
+            maxsize (int, optional): The maximum number of received messages
+                the writer process queues before the senders have to wait.
+                Defaults to 0, which means no limit.
+            batch_size (int, optional): The maximum number of log records the
+                writer process passes to its handlers at once. Defaults to
+                100.
+            shutdown_timeout (float, optional): The maximum number of seconds
+                `close()` waits for the writer process. Defaults to 5.0.
+            start_method (str, optional): The `multiprocessing` start method
+                of the writer process. Defaults to None, which uses the
+                default start method of the platform.
+        """
+        self.handler_factories: tuple[Callable[[], Handler], ...] = \
+            handler_factories
+        self.batch_size: int = batch_size
+        self.shutdown_timeout: float = shutdown_timeout
+        self.closed: bool = False
+        self.authkey: bytes = os.urandom(32)
+
+        context = multiprocessing.get_context(start_method)
+        receiver, sender = context.Pipe(duplex=False)
+        self.process: multiprocessing.process.BaseProcess = context.Process(
+            target=_run_writer,
+            args=(sender, self.authkey, handler_factories, maxsize,
+                  batch_size),
+            name="loggingpython-LogFunnel", daemon=True)
+        self.process.start()
+        sender.close()
+        with receiver:
+            self.address = receiver.recv()
+        # Registered after multiprocessing has registered its own exit
+        # handler, so the funnel is closed before daemon processes are
+        # terminated.
+        atexit.register(self.close)
+
+    def handler(self) -> ProcessHandler:
+        """
+        Returns a handler that sends log records to the writer process.
+
+        The handler can be passed to worker processes, for example as an
+        initializer argument of a process pool, and can also be used in the
+        current process.
+
+        Returns:
+            ProcessHandler: A handler for the writer process of the funnel.
+        """
+        return ProcessHandler(self.address, self.authkey)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Writes all received log records, closes the handlers of the writer
+        process and stops it.
+
+        Args:
+            timeout (float, optional): The maximum number of seconds to wait
+                for the writer process. Defaults to `shutdown_timeout`.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        if timeout is None:
+            timeout = self.shutdown_timeout
+        try:
+            with Client(self.address, authkey=self.authkey) as connection:
+                connection.send(_STOP)
+        except OSError:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            print(f"{self!r} could not write the received log records \
+within {timeout} seconds", file=sys.stderr)
+
+    def __enter__(self) -> "LogFunnel":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"LogFunnel({self.handler_factories}, {self.batch_size})"
+
+    def __str__(self) -> str:
+        return f"LogFunnel with: {self.handler_factories} and \
+{self.batch_size}"
+
+
+def _run_writer(address_sender: Connection,
+                authkey: bytes,
+                handler_factories: tuple[Callable[[], Handler], ...],
+                maxsize: int,
+                batch_size: int) -> None:
+    """
+    Runs the writer process of a `LogFunnel`.
+
+    The stop message is sent over a connection of its own, which is accepted
+    after the connections of all log records sent before it. The writer
+    process therefore reads these connections until they are idle before it
+    closes its handlers.
+
+    Args:
+        address_sender (Connection): The connection over which the address
+            of the listener is sent to the funnel.
+        authkey (bytes): The key that authenticates the connections.
+        handler_factories (tuple[Callable[[], Handler], ...]): Callables that
+            create the handlers.
+        maxsize (int): The maximum number of queued messages.
+        batch_size (int): The maximum number of log records passed to the
+            handlers at once.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    listener = Listener(authkey=authkey, backlog=_BACKLOG)
+    with address_sender:
+        address_sender.send(listener.address)
+    handlers = [factory() for factory in handler_factories]
+    messages: queue.Queue = queue.Queue(maxsize)
+    stopping = threading.Event()
+    readers: list[threading.Thread] = []
+    threading.Thread(target=_accept,
+                     args=(listener, messages, stopping, readers),
+                     name="loggingpython-LogFunnel-accept",
+                     daemon=True).start()
+    draining: list[threading.Thread] | None = None
+    try:
+        while draining is None or not messages.empty() or \
+                any(reader.is_alive() for reader in draining):
+            try:
+                item = messages.get(timeout=None if draining is None
+                                    else 0.1)
+            except queue.Empty:
+                continue
+            records = []
+            while True:
+                if item is _STOP:
+                    if draining is None:
+                        stopping.set()
+                        draining = list(readers)
+                elif isinstance(item, list):
+                    records.extend(item)
+                else:
+                    records.append(item)
+                if len(records) >= batch_size:
+                    break
+                try:
+                    item = messages.get_nowait()
+                except queue.Empty:
+                    break
+            if records:
+                for handler in handlers:
+                    _call_handler(handler.emit_batch, records)
+    finally:
+        for handler in handlers:
+            _call_handler(handler.close)
+        listener.close()
+
+
+def _accept(listener: Listener, messages: queue.Queue,
+            stopping: threading.Event,
+            readers: list[threading.Thread]) -> None:
+    """
+    Accepts the connections of the processes that log through the funnel
+    and starts a reader thread for each of them.
+
+    Args:
+        listener (Listener): The listener of the writer process.
+        messages (queue.Queue): The queue of the received messages.
+        stopping (threading.Event): Set when the funnel is closed.
+        readers (list[threading.Thread]): The started reader threads.
+    """
+    while True:
+        try:
+            connection = listener.accept()
+        except multiprocessing.AuthenticationError:
+            continue
+        except OSError:
+            return
+        reader = threading.Thread(target=_read,
+                                  args=(connection, messages, stopping),
+                                  name="loggingpython-LogFunnel-reader",
+                                  daemon=True)
+        reader.start()
+        readers.append(reader)
+
+
+def _read(connection: Connection, messages: queue.Queue,
+          stopping: threading.Event) -> None:
+    """
+    Puts the messages received over a connection into the queue until the
+    connection is closed, or until it is idle once the funnel is closed.
+
+    A connection whose process exited or crashed, even in the middle of a
+    message, is closed without affecting the other connections.
+
+    Args:
+        connection (Connection): The connection of a process.
+        messages (queue.Queue): The queue of the received messages.
+        stopping (threading.Event): Set when the funnel is closed.
+    """
+    with connection:
+        try:
+            while True:
+                if connection.poll(0.1):
+                    messages.put(connection.recv())
+                elif stopping.is_set():
+                    return
+        except (EOFError, OSError):
+            return
+        except Exception as e:
+            print(f"LogFunnel failed to receive a log record: {e}",
+                  file=sys.stderr)
+
+
+def _call_handler(method, *args) -> None:
+    """
+    Calls a method of a handler and reports its errors without stopping the
+    writer process.
+
+    Args:
+        method (callable): The bound method of the handler.
+        *args: The arguments for the method.
+    """
+    try:
+        method(*args)
+    except Exception as e:
+        print(f"{method.__self__!r} failed in {method.__name__}: {e}",
+              file=sys.stderr)
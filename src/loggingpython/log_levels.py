@@ -66,10 +66,20 @@ class LogLevel(Enum):
     is used for general information messages. WARNING is used for warning
     messages. ERROR is used for error messages. CRITICAL is used for critical
     error messages that may prevent the program from running.
+
+    Every member also carries an integer `severity` (10 for DEBUG up to 50 for
+    CRITICAL), which allows log levels to be compared with a single integer
+    comparison instead of looking them up in a list.
     """
 
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
+    DEBUG = ("DEBUG", 10)
+    INFO = ("INFO", 20)
+    WARNING = ("WARNING", 30)
+    ERROR = ("ERROR", 40)
+    CRITICAL = ("CRITICAL", 50)
+
+    def __new__(cls, value: str, severity: int) -> "LogLevel":
+        loglevel = object.__new__(cls)
+        loglevel._value_ = value
+        loglevel.severity = severity
+        return loglevel
@@ -0,0 +1,467 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module provides the readers for the log files written by the
+`FileHandler` and by the `JSONHandler` in NDJSON mode of the `loggingpython`
+package. The reader parses every line
+with the `logformat_string` of the handler that wrote it and yields the
+fields of the log messages as dictionaries, so log files can be consumed
+from Python without parsing them again with regular expressions of one's
+own.
+
+The reader is a generator and never loads a whole file into memory. A
+finished log file is memory-mapped and split into lines in large chunks.
+With `follow=True` the reader behaves like `tail -F`: it keeps reading the
+log messages that are appended to the file, and when the `FileHandler`
+rotates to a new file, either because a new day has begun or because the
+file reached its maximum size, the reader finishes the old file and
+continues with the new one. Lines that do not match the log format string,
+such as the further lines of a multi-line message, are appended to the last
+field of the preceding log message. `read_ndjson` streams the log messages
+of an NDJSON file back as the decoded JSON objects in the same way.
+
+Example usage:
+
+    from loggingpython.log_reader import read_log
+
+    # Parse a log file of a FileHandler with the default log format
+    for record in read_log("logs/app_2024-01-01.log"):
+        print(record["loglevel"], record["message"])
+
+    # Follow the current log file of a handler across rollovers
+    for record in read_log(file_handler, follow=True):
+        print(record["message"])
+
+    # Stream the log messages of an NDJSON file
+    for record in read_ndjson("logs/app_2024-01-01.ndjson"):
+        print(record["message"])
+
+The readers can also be run from the command line, which prints every log
+message as a JSON object:
+
+    python -m loggingpython.log_reader --follow logs/app_2024-01-01.log
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import argparse
+import json
+import mmap
+import os
+import re
+import time
+from typing import BinaryIO, Iterable, Iterator
+
+from .handler.filehandler import FileHandler
+from .handler.jsonhandler import JSONHandler
+from .handler.sharedhandler import SharedHandler
+from .log_format import LogFormat
+from .rotation import STAMP_PATTERN, name_of
+
+
+DEFAULT_LOGFORMAT: str = \
+    "%(asctime)s: [%(loggername)s]: [%(loglevel)s]: %(message)s"
+CHUNK_SIZE: int = 1024 * 1024
+
+def read_log(source: str | FileHandler | SharedHandler,
+             logformat_string: str | None = None,
+             follow: bool = False,
+             from_end: bool = False,
+             poll_interval: float = 0.25,
+             idle_timeout: float | None = None,
+             chunk_size: int = CHUNK_SIZE,
+             encoding: str = "utf-8") -> Iterator[dict[str, str]]:
+    """
+    Returns a generator over the log messages of a log file as dictionaries
+    of their fields. The log file is opened right away, so in follow mode
+    every log message written after this call is yielded.
+
+    Args:
+        source (str | FileHandler | SharedHandler): The path of the log file,
+            or the handler whose current log file is read.
+        logformat_string (str, optional): The format string the log file
+            was written with. Defaults to the format string of the handler,
+            or to the default format string of the FileHandler for a path.
+        follow (bool, optional): Whether to keep waiting for new log
+            messages and to continue with the next log file after a
+            rollover. Defaults to False.
+        from_end (bool, optional): Whether to start at the current end of
+            the file in follow mode, skipping the existing log messages.
+            Defaults to False.
+        poll_interval (float, optional): The number of seconds to wait for
+            new log messages in follow mode. Defaults to 0.25.
+        idle_timeout (float, optional): The number of seconds without new
+            log messages after which follow mode ends. Defaults to None,
+            which follows until the generator is closed.
+        chunk_size (int, optional): The number of bytes read at once.
+            Defaults to 1 MiB.
+        encoding (str, optional): The encoding of the log file. Defaults to
+            "utf-8".
+
+    Returns:
+        Iterator[dict[str, str]]: The fields of the log messages, keyed by
+            the field names of the log format string.
+
+    Raises:
+        InvalidLogFormatError: If the log format string references an
+            unknown field or contains an invalid placeholder.
+        FileNotFoundError: If the log file does not exist.
+    """
+    if isinstance(source, SharedHandler):
+        source = source.handler
+    if isinstance(source, FileHandler):
+        file = source.file.name
+        name = source.name
+        logformat_string = logformat_string or source.logformat_string
+    else:
+        file, name = source, name_of(source)
+    logformat = LogFormat(logformat_string or DEFAULT_LOGFORMAT)
+    return _parse(_lines(file, name, follow, from_end, poll_interval,
+                         idle_timeout, chunk_size, encoding), logformat)
+
+
+def read_ndjson(source: str | JSONHandler | SharedHandler,
+                follow: bool = False,
+                from_end: bool = False,
+                poll_interval: float = 0.25,
+                idle_timeout: float | None = None,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Returns a generator over the log messages of an NDJSON log file, as
+    written by a `JSONHandler` in NDJSON mode. The log file is opened right
+    away, so in follow mode every log message written after this call is
+    yielded. Lines that are not valid JSON, such as a last line that was
+    cut short by a crash, are skipped.
+
+    Args:
+        source (str | JSONHandler | SharedHandler): The path of the log
+            file, or the handler whose current log file is read.
+        follow (bool, optional): Whether to keep waiting for new log
+            messages and to continue with the next log file after a
+            rollover. Defaults to False.
+        from_end (bool, optional): Whether to start at the current end of
+            the file in follow mode, skipping the existing log messages.
+            Defaults to False.
+        poll_interval (float, optional): The number of seconds to wait for
+            new log messages in follow mode. Defaults to 0.25.
+        idle_timeout (float, optional): The number of seconds without new
+            log messages after which follow mode ends. Defaults to None,
+            which follows until the generator is closed.
+        chunk_size (int, optional): The number of bytes read at once.
+            Defaults to 1 MiB.
+
+    Returns:
+        Iterator[dict]: The log messages as decoded JSON objects.
+
+    Raises:
+        FileNotFoundError: If the log file does not exist.
+    """
+    if isinstance(source, SharedHandler):
+        source = source.handler
+    if isinstance(source, JSONHandler):
+        file, name = source.file, source.name
+    else:
+        file, name = source, name_of(source)
+    return _decode(_lines(file, name, follow, from_end, poll_interval,
+                          idle_timeout, chunk_size, "utf-8"))
+
+
+def _lines(file: str, name: str, follow: bool, from_end: bool,
+           poll_interval: float, idle_timeout: float | None,
+           chunk_size: int, encoding: str) -> Iterator[str | None]:
+    """
+    Opens a log file and returns a generator over its lines.
+
+    Args:
+        file (str): The path of the log file.
+        name (str): The name of the log files, without date stamp and
+            extension.
+        follow (bool): Whether to follow the log file.
+        from_end (bool): Whether to start at the current end of the file in
+            follow mode.
+        poll_interval (float): The number of seconds to wait for new lines.
+        idle_timeout (float | None): The number of seconds without new lines
+            after which following stops.
+        chunk_size (int): The number of bytes read at once.
+        encoding (str): The encoding of the log file.
+
+    Returns:
+        Iterator[str | None]: The lines without their line breaks, and None
+            whenever the reader has caught up with the writer in follow
+            mode.
+    """
+    log_file = open(file, "rb", buffering=0)
+    if not follow:
+        return _read_lines(log_file, chunk_size, encoding)
+    if from_end:
+        log_file.seek(0, os.SEEK_END)
+    return _follow_lines(log_file, file, name, poll_interval, idle_timeout,
+                         chunk_size, encoding)
+
+
+def _decode(lines: Iterable[str | None]) -> Iterator[dict]:
+    """
+    Decodes lines of NDJSON and skips empty and invalid lines.
+
+    Args:
+        lines (Iterable[str | None]): The lines without their line breaks.
+
+    Yields:
+        dict: The decoded JSON objects.
+    """
+    for line in lines:
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def _parse(lines: Iterable[str | None],
+           logformat: LogFormat) -> Iterator[dict[str, str]]:
+    """
+    Parses lines into log messages. A line that does not match the log
+    format string is appended to the last field of the preceding log
+    message, and lines before the first log message are skipped. None
+    marks that no further line is available yet, so the pending log message
+    is yielded instead of waiting for its continuation lines.
+
+    Args:
+        lines (Iterable[str | None]): The lines without their line breaks.
+        logformat (LogFormat): The compiled log format string.
+
+    Yields:
+        dict[str, str]: The fields of the log message.
+    """
+    pending: dict[str, str] | None = None
+    last_field = logformat.fields[-1] if logformat.fields else None
+    for line in lines:
+        if line is None:
+            if pending is not None:
+                yield pending
+                pending = None
+            continue
+        values = logformat.parse(line)
+        if values is not None:
+            if pending is not None:
+                yield pending
+            pending = values
+        elif pending is not None and last_field is not None:
+            pending[last_field] += "\n" + line
+    if pending is not None:
+        yield pending
+
+
+def _read_lines(log_file: BinaryIO, chunk_size: int,
+                encoding: str) -> Iterator[str]:
+    """
+    Yields the lines of a log file from a memory map of the file and closes
+    the file.
+
+    Args:
+        log_file (BinaryIO): The open log file.
+        chunk_size (int): The number of bytes split into lines at once.
+        encoding (str): The encoding of the log file.
+
+    Yields:
+        str: The lines without their line breaks.
+    """
+    with log_file:
+        size = os.fstat(log_file.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(log_file.fileno(), size,
+                       access=mmap.ACCESS_READ) as log_map:
+            chunks = (log_map[start:start + chunk_size]
+                      for start in range(0, size, chunk_size))
+            remainder = yield from _split(chunks, b"", encoding)
+    if remainder:
+        yield remainder.decode(encoding, "replace")
+
+
+def _split(chunks: Iterable[bytes], remainder: bytes,
+           encoding: str) -> Iterator[str]:
+    """
+    Splits chunks of bytes into lines.
+
+    Args:
+        chunks (Iterable[bytes]): The chunks of the log file.
+        remainder (bytes): The incomplete line before the first chunk.
+        encoding (str): The encoding of the log file.
+
+    Yields:
+        str: The complete lines without their line breaks.
+
+    Returns:
+        bytes: The incomplete line after the last chunk.
+    """
+    for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        for line in lines:
+            yield line.decode(encoding, "replace")
+    return remainder
+
+
+def _follow_lines(log_file: BinaryIO, file: str, name: str,
+                  poll_interval: float, idle_timeout: float | None,
+                  chunk_size: int, encoding: str) -> Iterator[str | None]:
+    """
+    Yields the lines of a log file as they are appended and continues with
+    the next log file after a rollover. None is yielded whenever the reader
+    has caught up with the writer.
+
+    Args:
+        log_file (BinaryIO): The open log file, positioned where reading
+            starts.
+        file (str): The path of the log file.
+        name (str): The name of the log files, without date stamp and
+            extension.
+        poll_interval (float): The number of seconds to wait for new lines.
+        idle_timeout (float | None): The number of seconds without new lines
+            after which the reader stops.
+        chunk_size (int): The number of bytes read at once.
+        encoding (str): The encoding of the log file.
+
+    Yields:
+        str | None: The lines without their line breaks, or None.
+    """
+    try:
+        remainder = b""
+        last_read = time.monotonic()
+        while True:
+            chunk = log_file.read(chunk_size)
+            if chunk:
+                remainder = yield from _split((chunk,), remainder, encoding)
+                last_read = time.monotonic()
+                continue
+            next_file = _next_file(log_file, file, name)
+            if next_file is not None:
+                remainder = yield from _split(_drain(log_file, chunk_size),
+                                              remainder, encoding)
+                if remainder:
+                    yield remainder.decode(encoding, "replace")
+                    remainder = b""
+                log_file.close()
+                file = next_file
+                log_file = open(file, "rb", buffering=0)
+                continue
+            yield None
+            if idle_timeout is not None and \
+                    time.monotonic() - last_read >= idle_timeout:
+                if remainder:
+                    yield remainder.decode(encoding, "replace")
+                return
+            time.sleep(poll_interval)
+    finally:
+        log_file.close()
+
+
+def _drain(log_file: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yields the chunks that are left in a log file until its end.
+
+    Args:
+        log_file (BinaryIO): The log file.
+        chunk_size (int): The number of bytes read at once.
+
+    Yields:
+        bytes: The chunks of the log file.
+    """
+    while chunk := log_file.read(chunk_size):
+        yield chunk
+
+
+def _next_file(log_file: BinaryIO, file: str, name: str) -> str | None:
+    """
+    Returns the log file to continue with once the current one has been
+    read completely.
+
+    If the path of the current log file now refers to another file, because
+    the handler renamed it to a numbered backup and started a new one, the
+    new file at the same path is next. Otherwise the first log file of the
+    same name and extension with a later date stamp is next.
+
+    Args:
+        log_file (BinaryIO): The open current log file.
+        file (str): The path of the current log file.
+        name (str): The name of the log files, without date stamp and
+            extension.
+
+    Returns:
+        str | None: The path of the next log file, or None if the current
+            log file is still the latest one.
+    """
+    try:
+        current = os.stat(file)
+    except FileNotFoundError:
+        current = None
+    opened = os.fstat(log_file.fileno())
+    if current is not None and (current.st_ino, current.st_dev) != \
+            (opened.st_ino, opened.st_dev):
+        return file
+
+    directory, base_name = os.path.split(file)
+    extension = os.path.splitext(base_name)[1]
+    series = re.compile(rf"{re.escape(name)}(?:_{STAMP_PATTERN})?"
+                        rf"{re.escape(extension)}")
+    try:
+        names = os.listdir(directory or ".")
+    except FileNotFoundError:
+        return None
+    later = sorted(candidate for candidate in names
+                   if series.fullmatch(candidate) and candidate > base_name)
+    if later:
+        return os.path.join(directory, later[0])
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Prints the log messages of a log file as JSON objects.")
+    parser.add_argument("file", help="the path of the log file")
+    parser.add_argument("--format", dest="logformat_string",
+                        default=DEFAULT_LOGFORMAT,
+                        help="the format string the log file was written "
+                             "with")
+    parser.add_argument("-f", "--follow", action="store_true",
+                        help="keep printing appended log messages")
+    arguments = parser.parse_args()
+    if arguments.file.endswith(".ndjson"):
+        records = read_ndjson(arguments.file, follow=arguments.follow)
+    else:
+        records = read_log(arguments.file, arguments.logformat_string,
+                           follow=arguments.follow)
+    try:
+        for record in records:
+            print(json.dumps(record), flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `LogRecord` class, the object that carries a single
+log message from the `Logger` to its handlers within the `loggingpython`
+package. One `LogRecord` is created per logged message and the very same
+object is passed to every handler of the logger.
+
+The `LogRecord` class uses `__slots__` to keep the per-record memory
+footprint small and renders its timestamps lazily: `iso_8601_time` and
+`asctime` are only formatted the first time a handler accesses them. It also
+implements the read-only mapping protocol, so handlers can keep using
+`record["message"]`, `record.get("loglevel")` and `%`-style format strings
+such as `"%(asctime)s: %(message)s" % record`. Pickling a `LogRecord` renders
+its timestamps in the sending process, so that records can be passed to
+another process without their timestamp formatters. Besides the rendered
+message, a `LogRecord` keeps its `template`, the message before the
+arguments were interpolated, so that records of the same log call can be
+recognized, for example by the `DedupHandler`.
+
+Example usage:
+
+    from loggingpython.handler import Handler
+
+    class CustomHandler(Handler):
+        def emit(self, record):
+            print(record.loglevel, record["message"])
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from collections.abc import Mapping
+from typing import Iterator
+
+from .timestamp import TimestampFormatter
+
+
+class LogRecord(Mapping):
+    """
+    `loggingpython`
+
+    A class that represents a single log message.
+
+    This class stores the logger name, the log level, the message, its
+    template and the epoch timestamp of a log message in slots. The string
+    timestamps `iso_8601_time` and `asctime` are rendered from the epoch
+    timestamp on first access and cached afterwards. As a read-only mapping,
+    it exposes the keys `loggername`, `iso_8601_time`, `asctime`, `loglevel`
+    and `message`.
+    """
+
+    __slots__ = ("loggername", "loglevel", "levelno", "message", "created",
+                 "template", "_iso_8601_formatter", "_time_formatter",
+                 "_iso_8601_time", "_asctime")
+
+    FIELDS: tuple[str, ...] = ("loggername", "iso_8601_time", "asctime",
+                               "loglevel", "message")
+    _FIELD_SET: frozenset[str] = frozenset(FIELDS)
+
+    def __init__(self,
+                 loggername: str,
+                 loglevel: str,
+                 levelno: int,
+                 message: str,
+                 created: float,
+                 iso_8601_formatter: TimestampFormatter,
+                 time_formatter: TimestampFormatter | None = None,
+                 template: str | None = None) -> None:
+        """
+        Initializes the LogRecord with the given log message details.
+
+        Args:
+            loggername (str): The name of the logger.
+            loglevel (str): The name of the log level.
+            levelno (int): The integer severity of the log level.
+            message (str): The log message.
+            created (float): Seconds since the epoch at which the record was
+                created.
+            iso_8601_formatter (TimestampFormatter): The formatter for
+                `iso_8601_time`.
+            time_formatter (TimestampFormatter, optional): The formatter for
+                `asctime`. Defaults to None, which uses the ISO 8601 time.
+            template (str, optional): The message before the arguments were
+                interpolated. Defaults to None, which uses the message.
+        """
+        self.loggername: str = loggername
+        self.loglevel: str = loglevel
+        self.levelno: int = levelno
+        self.message: str = message
+        self.created: float = created
+        self.template: str = message if template is None else template
+        self._iso_8601_formatter: TimestampFormatter = iso_8601_formatter
+        self._time_formatter: TimestampFormatter | None = time_formatter
+
+    @property
+    def iso_8601_time(self) -> str:
+        """
+        The timestamp of the record in ISO 8601 format.
+        """
+        try:
+            return self._iso_8601_time
+        except AttributeError:
+            self._iso_8601_time: str = self._iso_8601_formatter.format(
+                self.created)
+            return self._iso_8601_time
+
+    @property
+    def asctime(self) -> str:
+        """
+        The timestamp of the record in the time format of the logger.
+        """
+        try:
+            return self._asctime
+        except AttributeError:
+            if self._time_formatter is None:
+                self._asctime: str = self.iso_8601_time
+            else:
+                self._asctime: str = self._time_formatter.format(self.created)
+            return self._asctime
+
+    def derive(self, message: str, created: float) -> "LogRecord":
+        """
+        Returns a new log record of the same logger and log level with
+        another message and creation time.
+
+        Args:
+            message (str): The message of the new log record.
+            created (float): Seconds since the epoch at which the new record
+                was created.
+
+        Returns:
+            LogRecord: The new log record.
+        """
+        record = LogRecord(self.loggername, self.loglevel, self.levelno,
+                           message, created, self._iso_8601_formatter,
+                           self._time_formatter)
+        if self._iso_8601_formatter is None:
+            # An unpickled record has no formatters, only its timestamps.
+            record._iso_8601_time = self.iso_8601_time
+            record._asctime = self.asctime
+        return record
+
+    def __getitem__(self, key: str) -> str:
+        if key in self._FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __reduce__(self) -> tuple:
+        return (_unpickle_log_record,
+                (self.loggername, self.loglevel, self.levelno, self.message,
+                 self.created, self.iso_8601_time, self.asctime,
+                 self.template))
+
+    def __repr__(self) -> str:
+        return f"LogRecord({dict(self)})"
+
+    def __str__(self) -> str:
+        return f"LogRecord with: {self.loggername}, {self.loglevel} and \
+{self.message}"
+
+
+def _unpickle_log_record(loggername: str,
+                         loglevel: str,
+                         levelno: int,
+                         message: str,
+                         created: float,
+                         iso_8601_time: str,
+                         asctime: str,
+                         template: str | None = None) -> LogRecord:
+    """
+    Recreates a pickled `LogRecord` with its already rendered timestamps.
+
+    Returns:
+        LogRecord: The unpickled log record.
+    """
+    record = LogRecord(loggername, loglevel, levelno, message, created, None,
+                       template=template)
+    record._iso_8601_time = iso_8601_time
+    record._asctime = asctime
+    return record
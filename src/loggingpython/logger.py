@@ -54,16 +54,28 @@ The focus here is on the `Logger` class, offering a straightforward and
 powerful way to integrate logging into Python applications.
 """
 
-from datetime import datetime, timezone
-from typing import Callable
+import time
+from collections.abc import Mapping
+from typing import Any, Callable, Iterable
 
 from .log_levels import LogLevel
+from .log_record import LogRecord
+from .timestamp import TimestampFormatter
 from .handler import Handler
 from .error.invalid_log_level_error import InvalidLogLevelError
 from .error.invalid_handler_method_error import InvalidHandlerMethodError
 from .error.handler_not_found_error import HandlerNotFoundError
 
 
+# Looking up a member on an Enum class is comparatively slow, so the level
+# methods use these module-level references on their hot path.
+_DEBUG: LogLevel = LogLevel.DEBUG
+_INFO: LogLevel = LogLevel.INFO
+_WARNING: LogLevel = LogLevel.WARNING
+_ERROR: LogLevel = LogLevel.ERROR
+_CRITICAL: LogLevel = LogLevel.CRITICAL
+
+
 class Logger:
     """
     `loggingpython`
@@ -99,7 +111,7 @@ class Logger:
     _ISO_8601_FORMAT: str = "%Y-%m-%dT%H:%M:%S.%f%z"
 
     def __init__(self, name: str,
-                 time_format: str | None,
+                 time_format: str | None = None,
                  min_loglevel: LogLevel = LogLevel.INFO,
                  max_loglevel: LogLevel = LogLevel.CRITICAL) -> None:
         """
@@ -119,20 +131,75 @@ class Logger:
             InvalidLogLevelError: If the provided log levels are not supported.
         """
 
-        self.min_loglevel: LogLevel = min_loglevel
         if min_loglevel is None:
-            self.min_loglevel: LogLevel = LogLevel.INFO
+            min_loglevel = LogLevel.INFO
+        if max_loglevel is None:
+            max_loglevel = LogLevel.CRITICAL
 
+        self.min_loglevel: LogLevel = min_loglevel
         self.max_loglevel: LogLevel = max_loglevel
-        if max_loglevel is None:
-            self.max_loglevel: LogLevel = LogLevel.INFO
 
         self.name: str = name
 
         self.handlers: list[Handler] = []
 
+        self._iso_8601_formatter: TimestampFormatter = TimestampFormatter(
+            self._ISO_8601_FORMAT)
         self.time_format: str = time_format
 
+    @property
+    def time_format(self) -> str | None:
+        """
+        The format string for the `asctime` of the log records, or None to
+        use the ISO 8601 format.
+        """
+        return self._time_format
+
+    @time_format.setter
+    def time_format(self, time_format: str | None) -> None:
+        self._time_format: str | None = time_format
+        self._time_formatter: TimestampFormatter | None = None
+        if time_format is not None:
+            self._time_formatter = TimestampFormatter(time_format)
+
+    @property
+    def min_loglevel(self) -> LogLevel:
+        """
+        The minimum log level to be logged.
+
+        Setting it also updates the precomputed lower bound of the enabled
+        severity window.
+
+        Raises:
+            InvalidLogLevelError: If the log level is not supported.
+        """
+        return self._min_loglevel
+
+    @min_loglevel.setter
+    def min_loglevel(self, loglevel: LogLevel) -> None:
+        self._validate_loglevel(loglevel)
+        self._min_loglevel: LogLevel = loglevel
+        self._min_severity: int = loglevel.severity
+
+    @property
+    def max_loglevel(self) -> LogLevel:
+        """
+        The maximum log level to be logged.
+
+        Setting it also updates the precomputed upper bound of the enabled
+        severity window.
+
+        Raises:
+            InvalidLogLevelError: If the log level is not supported.
+        """
+        return self._max_loglevel
+
+    @max_loglevel.setter
+    def max_loglevel(self, loglevel: LogLevel) -> None:
+        self._validate_loglevel(loglevel)
+        self._max_loglevel: LogLevel = loglevel
+        self._max_severity: int = loglevel.severity
+
     def _validate_loglevel(self, loglevel: LogLevel) -> None:
         """
         Validates the provided log level.
@@ -144,8 +211,33 @@ class Logger:
             InvalidLogLevelError: If the loglevel is not supported.
         """
 
-        if loglevel not in self._SUPPORTED_LEVELS:
+        if not isinstance(loglevel, LogLevel):
+            raise InvalidLogLevelError(loglevel)
+
+    def isEnabledFor(self, loglevel: LogLevel) -> bool:
+        """
+        Checks whether a message with the provided log level would be logged.
+
+        The check only compares the integer severity of the log level with
+        the enabled window precomputed from `min_loglevel` and
+        `max_loglevel`, which makes it cheap enough to guard expensive log
+        calls with it.
+
+        Args:
+            loglevel (LogLevel): The log level to check.
+
+        Returns:
+            bool: True if the log level lies between `min_loglevel` and
+                `max_loglevel`, False otherwise.
+
+        Raises:
+            InvalidLogLevelError: If the level is not supported.
+        """
+        try:
+            severity = loglevel.severity
+        except AttributeError:
             raise InvalidLogLevelError(loglevel)
+        return self._min_severity <= severity <= self._max_severity
 
     def _loglevel_over_min_loglevel(self, loglevel: LogLevel) -> bool:
         """
@@ -157,8 +249,7 @@ class Logger:
         Returns:
             bool: True if the log level is over the minimum, False otherwise.
         """
-        return self._SUPPORTED_LEVELS.index(loglevel) >= \
-            self._SUPPORTED_LEVELS.index(self.min_loglevel)
+        return loglevel.severity >= self._min_severity
 
     def _loglevel_under_max_loglevel(self, loglevel: LogLevel) -> bool:
         """
@@ -170,50 +261,62 @@ class Logger:
         Returns:
             bool: True if the log level is under the maximum, False otherwise.
         """
-        return self._SUPPORTED_LEVELS.index(loglevel) <= \
-            self._SUPPORTED_LEVELS.index(self.max_loglevel)
+        return loglevel.severity <= self._max_severity
 
-    def _get_iso_8601_timestamp(self) -> str:
+    def _get_iso_8601_timestamp(self, created: float | None = None) -> str:
         """
-        Returns the current timestamp in a formatted string in ISO 8601.
+        Returns the timestamp in a formatted string in ISO 8601.
+
+        Args:
+            created (float, optional): Seconds since the epoch. Defaults to
+                the current time.
 
         Returns:
-            str: The current timestamp in ISO 8601 format.
+            str: The timestamp in ISO 8601 format.
         """
+        if created is None:
+            created = time.time()
+        return self._iso_8601_formatter.format(created)
 
-        return datetime.now(timezone.utc).strftime(self._ISO_8601_FORMAT)
-
-    def _get_timestamp(self) -> str:
+    def _get_timestamp(self, created: float | None = None) -> str:
         """
-        Returns the current timestamp in a formatted string.
+        Returns the timestamp in a formatted string.
+
+        Args:
+            created (float, optional): Seconds since the epoch. Defaults to
+                the current time.
 
         Returns:
-            str: The current timestamp in the specified format.
+            str: The timestamp in the specified format.
         """
-        if self.time_format is not None:
-            return datetime.now(timezone.utc).strftime(self.time_format)
-        return self._get_iso_8601_timestamp()
+        if created is None:
+            created = time.time()
+        if self._time_formatter is not None:
+            return self._time_formatter.format(created)
+        return self._iso_8601_formatter.format(created)
 
     def _format_message(self, message: str,
-                        loglevel: LogLevel) -> dict[str]:
+                        loglevel: LogLevel,
+                        template: str | None = None) -> LogRecord:
         """
         Formats the log message with additional information.
 
+        The clock is read once per record and stored as `created`. The
+        `iso_8601_time` and `asctime` of the record are rendered from it only
+        when a handler accesses them.
+
         Args:
             message (str): The message to log.
             loglevel (LogLevel): The log level of the message.
+            template (str, optional): The message before the arguments were
+                interpolated. Defaults to None, which uses the message.
 
         Returns:
-            dict: A dictionary containing the formatted log message.
+            LogRecord: The log record that is passed to every handler.
         """
-        values = {
-            "loggername": self.name,
-            "iso_8601_time": self._get_iso_8601_timestamp(),
-            "asctime": self._get_timestamp(),
-            "loglevel": loglevel.name,
-            "message": message,
-        }
-        return values
+        return LogRecord(self.name, loglevel.name, loglevel.severity,
+                         message, time.time(), self._iso_8601_formatter,
+                         self._time_formatter, template)
 
     def addHandler(self, handler: Handler) -> None:
         """
@@ -246,94 +349,223 @@ class Logger:
             raise HandlerNotFoundError()
         self.handlers.remove(handler)
 
+    def _render_message(self, message: str, args: tuple) -> str:
+        """
+        Interpolates the positional arguments into the message.
+
+        Zero-argument callables among the arguments (functions, lambdas,
+        bound methods, ...) are called first and replaced by their result.
+        Classes are passed through unchanged. A single non-empty mapping
+        argument is used for `%(name)s`-style interpolation.
+
+        Args:
+            message (str): The message with `%`-style placeholders.
+            args (tuple): The arguments for the placeholders.
+
+        Returns:
+            str: The interpolated message.
+        """
+        if not args:
+            return message
+        args = tuple(arg() if callable(arg) and not isinstance(arg, type)
+                     else arg for arg in args)
+        if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+            return message % args[0]
+        return message % args
+
     def _log(self, message: str,
-             loglevel: LogLevel = LogLevel.INFO) -> None:
+             loglevel: LogLevel = LogLevel.INFO,
+             args: tuple = ()) -> None:
         """
         Logs a message with the specified log level and includes
             a full traceback.
 
+        The arguments are only interpolated into the message once the log
+        level has passed the enabled window and at least one handler will
+        receive the record.
+
         Args:
             message (str): The message to log.
             loglevel (LogLevel, optional): The log level. Defaults to INFO.
                 Must be one of the supported levels:
                 DEBUG, INFO, WARNING, ERROR, CRITICAL.
+            args (tuple, optional): The arguments for the `%`-style
+                placeholders in the message. Defaults to no arguments.
 
         Raises:
             InvalidLogLevelError: If the level is not supported.
         """
         try:
-            self._validate_loglevel(loglevel)
-            if self._loglevel_over_min_loglevel(loglevel):
-                if self._loglevel_under_max_loglevel(loglevel):
-                    formatted_message = self._format_message(message, loglevel)
-                    for handler in self.handlers:
-                        handler.emit(formatted_message)
+            severity = loglevel.severity
+        except AttributeError:
+            raise InvalidLogLevelError(loglevel)
+        if not self._min_severity <= severity <= self._max_severity:
+            return
+        if not self.handlers:
+            return
+        template = message
+        try:
+            message = self._render_message(message, args)
+        except (TypeError, ValueError, KeyError) as e:
+            self.error(f"Failed to format {message!r} with {args!r}: {e}")
+            return
+        try:
+            formatted_message = self._format_message(message, loglevel,
+                                                     template)
+            self._handle(formatted_message)
         except ValueError as e:
             self.error(f"ValueError: {e}")
 
-    def debug(self, message: str) -> None:
+    def log_many(self, messages: Iterable[str | LogRecord],
+                 loglevel: LogLevel = LogLevel.INFO) -> None:
+        """
+        Logs many messages at once and hands them to every handler as a
+        single batch.
+
+        Each message becomes a log record of this logger with the given log
+        level. Already existing `LogRecord` objects, for example replayed from
+        an archive, are passed on unchanged and are filtered by their own log
+        level. Handlers receive the batch through `emit_batch`, which lets
+        them write all records with a single operation.
+
+        Args:
+            messages (Iterable[str | LogRecord]): The messages or log records
+                to log.
+            loglevel (LogLevel, optional): The log level of the messages.
+                Defaults to INFO.
+
+        Raises:
+            InvalidLogLevelError: If the level is not supported.
+        """
+        try:
+            severity = loglevel.severity
+        except AttributeError:
+            raise InvalidLogLevelError(loglevel)
+        if not self.handlers:
+            return
+        enabled = self._min_severity <= severity <= self._max_severity
+        records: list[LogRecord] = []
+        for message in messages:
+            if isinstance(message, LogRecord):
+                if self._min_severity <= message.levelno <= \
+                        self._max_severity:
+                    records.append(message)
+            elif enabled:
+                records.append(self._format_message(message, loglevel))
+        if records:
+            self._handle_batch(records)
+
+    def _handle(self, record: LogRecord) -> None:
+        """
+        Passes a log record to every handler.
+
+        Args:
+            record (LogRecord): The log record to be processed.
+        """
+        for handler in self.handlers:
+            handler.emit(record)
+
+    def _handle_batch(self, records: list[LogRecord]) -> None:
+        """
+        Passes a batch of log records to every handler.
+
+        Handlers without an `emit_batch` method receive the records one by
+        one.
+
+        Args:
+            records (list[LogRecord]): The log records to be processed.
+        """
+        for handler in self.handlers:
+            emit_batch = getattr(handler, "emit_batch", None)
+            if emit_batch is not None:
+                emit_batch(records)
+            else:
+                for record in records:
+                    handler.emit(record)
+
+    def debug(self, message: str, *args: Any) -> None:
         """
         Logs a message at the DEBUG level.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log. It may contain `%`-style
+                placeholders, which are filled with `args` only if the
+                message is actually logged.
+            *args: The arguments for the placeholders. Zero-argument
+                callables are called lazily to produce the argument.
 
         Raises:
             InvalidLogLevelError: If the level is not supported.
         """
 
-        self._log(message, loglevel=LogLevel.DEBUG)
+        self._log(message, _DEBUG, args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """
         Logs a message at the INFO level.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log. It may contain `%`-style
+                placeholders, which are filled with `args` only if the
+                message is actually logged.
+            *args: The arguments for the placeholders. Zero-argument
+                callables are called lazily to produce the argument.
 
         Raises:
             InvalidLogLevelError: If the level is not supported.
         """
 
-        self._log(message, loglevel=LogLevel.INFO)
+        self._log(message, _INFO, args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """
         Logs a message at the WARNING level.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log. It may contain `%`-style
+                placeholders, which are filled with `args` only if the
+                message is actually logged.
+            *args: The arguments for the placeholders. Zero-argument
+                callables are called lazily to produce the argument.
 
         Raises:
             InvalidLogLevelError: If the level is not supported.
         """
 
-        self._log(message, loglevel=LogLevel.WARNING)
+        self._log(message, _WARNING, args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """
         Logs a message at the ERROR level.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log. It may contain `%`-style
+                placeholders, which are filled with `args` only if the
+                message is actually logged.
+            *args: The arguments for the placeholders. Zero-argument
+                callables are called lazily to produce the argument.
 
         Raises:
             InvalidLogLevelError: If the level is not supported.
         """
 
-        self._log(message, loglevel=LogLevel.ERROR)
+        self._log(message, _ERROR, args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """
         Logs a message at the CRITICAL level.
 
         Args:
-            message (str): The message to log.
+            message (str): The message to log. It may contain `%`-style
+                placeholders, which are filled with `args` only if the
+                message is actually logged.
+            *args: The arguments for the placeholders. Zero-argument
+                callables are called lazily to produce the argument.
 
         Raises:
             InvalidLogLevelError: If the level is not supported.
         """
-        self._log(message, loglevel=LogLevel.CRITICAL)
+        self._log(message, _CRITICAL, args)
 
     def catch_debug(self, func) -> Callable:
         """
@@ -354,13 +586,13 @@ class Logger:
         """
         def wrapper(*args, **kwargs):
             try:
-                self.debug(f"'{func.__name__}' with {args}, {kwargs}")
+                self.debug("'%s' with %s, %s", func.__name__, args, kwargs)
                 result = func(*args, **kwargs)
-                self.debug(f"'{func.__name__}' completed successfully, \
-with '{result}'")
+                self.debug("'%s' completed successfully, with '%s'",
+                           func.__name__, lambda: result)
                 return result
             except Exception as e:
-                self.error(f"{func.__name__} failed: {str(e)}")
+                self.error("%s failed: %s", func.__name__, e)
         return wrapper
 
     def catch_info(self, func) -> Callable:
@@ -383,11 +615,11 @@ with '{result}'")
         def wrapper(*args, **kwargs):
             try:
                 result = func(*args, **kwargs)
-                self.info(f"'{func.__name__}' completed successfully, \
-with '{result}'")
+                self.info("'%s' completed successfully, with '%s'",
+                          func.__name__, lambda: result)
                 return result
             except Exception as e:
-                self.error(f"{func.__name__} failed: {str(e)}")
+                self.error("%s failed: %s", func.__name__, e)
         return wrapper
 
     def catch_warning(self, func,
@@ -415,7 +647,7 @@ BaseException.
             try:
                 return func(*args, **kwargs)
             except except_type as e:
-                self.warning(f"{func.__name__} failed: {str(e)}")
+                self.warning("%s failed: %s", func.__name__, e)
         return wrapper
 
     def catch_error(self, func,
@@ -443,7 +675,7 @@ BaseException.
             try:
                 return func(*args, **kwargs)
             except except_type as e:
-                self.error(f"{func.__name__} failed: {str(e)}")
+                self.error("%s failed: %s", func.__name__, e)
         return wrapper
 
     def catch_critical(self, func,
@@ -472,7 +704,7 @@ BaseException.
             try:
                 return func(*args, **kwargs)
             except except_type as e:
-                self.critical(f"{func.__name__} failed: {str(e)}")
+                self.critical("%s failed: %s", func.__name__, e)
         return wrapper
 
     def __repr__(self) -> str:
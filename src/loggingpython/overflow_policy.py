@@ -0,0 +1,67 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `OverflowPolicy` class, an enumeration of the
+strategies a queue-based handler of the `loggingpython` package can apply
+when its bounded queue is full. The policy decides whether the logging thread
+waits for free space or whether a log message is dropped instead.
+
+The `OverflowPolicy` class includes three members: BLOCK, DROP_NEWEST and
+DROP_OLDEST. BLOCK waits until the queue has room again and therefore never
+loses a log message, while the two drop policies never block the logging
+thread and discard either the new or the oldest queued log message.
+
+Example usage:
+
+    from loggingpython import QueueHandler, FileHandler, OverflowPolicy
+
+    # Drop the oldest queued log messages instead of blocking
+    queue_handler = QueueHandler(FileHandler("app"),
+                                 maxsize=1000,
+                                 overflow_policy=OverflowPolicy.DROP_OLDEST)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from enum import Enum
+
+
+class OverflowPolicy(Enum):
+    """
+    `loggingpython`
+
+    Enum class that represents the overflow policies of a bounded queue.
+
+    This class defines three enum members: BLOCK, DROP_NEWEST and
+    DROP_OLDEST. BLOCK makes the logging thread wait until the queue has room
+    again. DROP_NEWEST discards the log message that does not fit into the
+    queue anymore. DROP_OLDEST discards the oldest queued log message to make
+    room for the new one.
+    """
+
+    BLOCK = "BLOCK"
+    DROP_NEWEST = "DROP_NEWEST"
+    DROP_OLDEST = "DROP_OLDEST"
@@ -0,0 +1,124 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the file format of the ring buffer files written by the
+`RingBufferHandler` of the `loggingpython` package, and the reader that
+reconstructs the log messages from such a file, for example after the
+process that wrote it has crashed.
+
+A ring buffer file starts with a header of `HEADER_SIZE` bytes, which holds
+the magic bytes, the capacity of the data area and the head: the total number
+of bytes ever written to the data area. The data area is used as a circular
+buffer. Every log message is stored as its UTF-8 encoded text framed by its
+length in front of it and behind it, so the reader can walk from the head
+backwards through the most recent log messages until it reaches data that
+has already been overwritten. The head is only advanced after a log message
+has been copied completely, so a log message that was interrupted by a crash
+is ignored.
+
+Example usage:
+
+    from loggingpython.ring_buffer import read_ring_buffer
+
+    for line in read_ring_buffer("logs/app.ring"):
+        print(line)
+
+The reader can also be run from the command line, which prints the log
+messages in the order they were written:
+
+    python -m loggingpython.ring_buffer logs/app.ring
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import argparse
+import struct
+
+
+MAGIC: bytes = b"LPRING01"
+HEADER: struct.Struct = struct.Struct("<8sQQ")
+HEADER_SIZE: int = 64
+HEAD: struct.Struct = struct.Struct("<Q")
+HEAD_OFFSET: int = 16
+LENGTH: struct.Struct = struct.Struct("<I")
+FRAME_SIZE: int = 2 * LENGTH.size
+
+
+def read_ring_buffer(file: str) -> list[str]:
+    """
+    Reads the log messages that are still contained in a ring buffer file.
+
+    Args:
+        file (str): The path of the ring buffer file.
+
+    Returns:
+        list[str]: The log messages, from the oldest to the most recent one.
+
+    Raises:
+        ValueError: If the file is not a ring buffer file.
+    """
+    with open(file, "rb") as ring_buffer:
+        content = ring_buffer.read()
+    magic, capacity, head = HEADER.unpack_from(content)
+    if magic != MAGIC or len(content) < HEADER_SIZE + capacity:
+        raise ValueError(f"{file} is not a ring buffer file")
+    data = content[HEADER_SIZE:HEADER_SIZE + capacity]
+
+    def read(position: int, size: int) -> bytes:
+        start = position % capacity
+        end = start + size
+        if end <= capacity:
+            return data[start:end]
+        return data[start:] + data[:end - capacity]
+
+    lines = []
+    oldest = max(head - capacity, 0)
+    position = head
+    while position - FRAME_SIZE >= oldest:
+        length, = LENGTH.unpack(read(position - LENGTH.size, LENGTH.size))
+        start = position - FRAME_SIZE - length
+        if start < oldest:
+            break
+        if LENGTH.unpack(read(start, LENGTH.size))[0] != length:
+            break
+        lines.append(read(start + LENGTH.size, length).decode(
+            "utf-8", errors="replace"))
+        position = start
+    lines.reverse()
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Prints the log messages of a ring buffer file.")
+    parser.add_argument("file", help="the path of the ring buffer file")
+    arguments = parser.parse_args()
+    for line in read_ring_buffer(arguments.file):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
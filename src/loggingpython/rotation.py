@@ -0,0 +1,346 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `Rotation` class, the rotation engine shared by the
+file-based handlers of the `loggingpython` package. A `Rotation` decides
+when a handler has to start a new log file and which file that is, based on
+a rotation interval, a maximum file size or both.
+
+The engine computes the instant of the next time-based rollover once, when a
+log file is started, so that checking for a rollover on every log message
+is a single comparison of two numbers instead of formatting the current
+date. Rollovers by size rename the full log file to a numbered backup, such
+as `app_2024-01-01.log.1`, shift older backups up by one and delete the
+backups beyond the configured count, so that the handler continues with an
+empty file of the original name. With an `Archiver`, every rotated log file
+is handed over to it for compression and retention; the backups are then
+numbered in ascending order and never renamed again, so the archiver can
+work on them while the handler keeps logging.
+
+The stamps in the log file names match `STAMP_PATTERN`, and `name_of`
+returns the name of the handler that writes a log file, so that readers of
+the log files can find the files of the same handler.
+
+Example usage:
+
+    from loggingpython.rotation import Rotation
+
+    rotation = Rotation("logs", "app", "log", max_bytes=10_000_000)
+
+    # In the handler, before writing a log message of `size` bytes
+    if rotation.due(size):
+        file.close()
+        file = open(rotation.rollover(), "a")
+    rotation.size += size
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import math
+import os
+import re
+import time
+from datetime import datetime, timedelta
+
+from .archiver import Archiver
+from .rotation_interval import RotationInterval
+
+
+_CUSTOM_STAMP_FORMAT: str = "%Y-%m-%d_%H-%M-%S"
+
+# The regular expression of the stamps in the log file names: the date,
+# captured in the group `date`, followed by the hour or the time of day of
+# the HOURLY and the custom intervals.
+STAMP_PATTERN: str = r"(?P<date>\d{4}-\d{2}-\d{2})(?:_\d{2}(?:-\d{2}-\d{2})?)?"
+
+_FILE_NAME: re.Pattern = re.compile(
+    rf"(?P<name>.+?)(?:_{STAMP_PATTERN})?\.(?P<extension>[^.]+)")
+
+
+def name_of(file: str) -> str:
+    """
+    Returns the name of a log file without its stamp and extension, which
+    is the name of the handler that writes it.
+
+    Args:
+        file (str): The path of the log file.
+
+    Returns:
+        str: The name the handler was created with.
+    """
+    match = _FILE_NAME.fullmatch(os.path.basename(file))
+    return match["name"] if match else os.path.basename(file)
+
+
+class Rotation:
+    """
+    `loggingpython`
+
+    A class that keeps track of the current log file of a handler and of
+    when it has to be rotated.
+
+    This class stores the path of the current log file, the number of bytes
+    written to it and the epoch timestamp of the next time-based rollover.
+    Intervals are aligned to local midnight: DAILY rolls over at midnight,
+    HOURLY at the start of every hour and a custom `timedelta` at every
+    multiple of it since midnight, where a period that does not fit into the
+    day ends at midnight. Without an interval, the log file names carry no
+    stamp and only the size causes rollovers.
+    """
+
+    def __init__(self,
+                 path: str,
+                 name: str,
+                 extension: str,
+                 interval: RotationInterval | timedelta | None =
+                 RotationInterval.DAILY,
+                 max_bytes: int = 0,
+                 backup_count: int = 5,
+                 archiver: Archiver | None = None) -> None:
+        """
+        Initializes the Rotation and determines the current log file.
+
+        Args:
+            path (str): The directory of the log files.
+            name (str): The name of the log files.
+            extension (str): The file extension of the log files, without
+                the leading dot.
+            interval (RotationInterval | timedelta | None, optional): The
+                interval after which a new log file is started. Defaults to
+                RotationInterval.DAILY. None disables rotation by time.
+            max_bytes (int, optional): The size in bytes after which the log
+                file is rotated to a numbered backup. Defaults to 0, which
+                disables rotation by size.
+            backup_count (int, optional): The number of numbered backups that
+                are kept. Defaults to 5. With an archiver, the retention rules
+                of the archiver apply instead.
+            archiver (Archiver, optional): The archiver that compresses the
+                rotated log files and enforces the retention rules. Defaults
+                to None.
+
+        Raises:
+            ValueError: If the custom interval is not positive.
+        """
+        if isinstance(interval, timedelta) and interval <= timedelta(0):
+            raise ValueError(f"The rotation interval must be positive, got \
+{interval}")
+        self.path: str = path
+        self.name: str = name
+        self.extension: str = extension
+        self.interval: RotationInterval | timedelta | None = interval
+        self.max_bytes: int = max_bytes
+        self.backup_count: int = backup_count
+        self.archiver: Archiver | None = archiver
+        self._max_bytes: float = max_bytes or math.inf
+        self._rotated_file_pattern: re.Pattern = re.compile(
+            rf"{re.escape(name)}(_{STAMP_PATTERN})?\.{re.escape(extension)}"
+            rf"(\.[0-9]+)?(\.gz|\.xz)?")
+
+        self.file: str = ""
+        self.size: int = 0
+        self.rollover_at: float = math.inf
+        self._start(time.time())
+
+    def due(self, size: int = 0) -> bool:
+        """
+        Checks whether the log file has to be rotated before `size` more
+        bytes are written to it.
+
+        A log file that is still empty is never rotated by size, so a single
+        log message larger than `max_bytes` is still written.
+
+        Args:
+            size (int, optional): The number of bytes about to be written.
+                Defaults to 0.
+
+        Returns:
+            bool: True if the log file has to be rotated, False otherwise.
+        """
+        return time.time() >= self.rollover_at or \
+            (self.size + size > self._max_bytes and self.size > 0)
+
+    def rollover(self) -> str:
+        """
+        Rotates the log file.
+
+        The handler must have closed the current log file before. When the
+        interval has ended, the log file of the new interval becomes the
+        current log file. Otherwise the current log file is renamed to a
+        numbered backup and the current log file starts empty. The rotated
+        log file is handed over to the archiver, if there is one.
+
+        Returns:
+            str: The path of the log file to continue with.
+        """
+        now = time.time()
+        rotated = self.file
+        if now >= self.rollover_at:
+            self._start(now)
+            if rotated == self.file:
+                rotated = None
+        else:
+            rotated = self._shift_backups()
+            self.size = 0
+        if self.archiver is not None and rotated is not None and \
+                os.path.exists(rotated):
+            self.archiver.submit(rotated, self)
+        return self.file
+
+    def rotated_files(self) -> list[str]:
+        """
+        Returns the rotated log files of the handler, compressed or not.
+
+        The current log file is not included.
+
+        Returns:
+            list[str]: The paths of the rotated log files.
+        """
+        current = os.path.basename(self.file)
+        return [os.path.join(self.path, filename)
+                for filename in os.listdir(self.path)
+                if filename != current and
+                self._rotated_file_pattern.fullmatch(filename)]
+
+    def _start(self, now: float) -> None:
+        """
+        Makes the log file of the interval containing `now` the current log
+        file and computes the instant of the next time-based rollover.
+
+        Args:
+            now (float): The current epoch timestamp.
+        """
+        if self.interval is None:
+            self.file = os.path.join(self.path,
+                                     f"{self.name}.{self.extension}")
+            self.rollover_at = math.inf
+        else:
+            start, end = self._period(datetime.fromtimestamp(now))
+            self.file = os.path.join(
+                self.path,
+                f"{self.name}_{start.strftime(self._stamp_format())}."
+                f"{self.extension}")
+            self.rollover_at = end.timestamp()
+        try:
+            self.size = os.path.getsize(self.file)
+        except OSError:
+            self.size = 0
+
+    def _period(self, current: datetime) -> tuple[datetime, datetime]:
+        """
+        Returns the start and the end of the interval containing `current`.
+
+        Args:
+            current (datetime): The current local time.
+
+        Returns:
+            tuple[datetime, datetime]: The start and the end of the interval.
+        """
+        midnight = current.replace(hour=0, minute=0, second=0, microsecond=0)
+        next_midnight = datetime.combine(midnight.date() + timedelta(days=1),
+                                         midnight.time())
+        if self.interval is RotationInterval.DAILY:
+            return midnight, next_midnight
+        if self.interval is RotationInterval.HOURLY:
+            start = current.replace(minute=0, second=0, microsecond=0)
+            return start, min(start + timedelta(hours=1), next_midnight)
+        periods = (current - midnight) // self.interval
+        start = midnight + periods * self.interval
+        return start, min(start + self.interval, next_midnight)
+
+    def _stamp_format(self) -> str:
+        """
+        Returns the stamp format of the log file names.
+
+        Returns:
+            str: The strftime format of the stamp.
+        """
+        if isinstance(self.interval, RotationInterval):
+            return self.interval.value
+        return _CUSTOM_STAMP_FORMAT
+
+    def _backup(self, number: int) -> str:
+        """
+        Returns the path of a numbered backup of the current log file.
+
+        Args:
+            number (int): The number of the backup.
+
+        Returns:
+            str: The path of the backup.
+        """
+        return f"{self.file}.{number}"
+
+    def _next_backup_number(self) -> int:
+        """
+        Returns the number following the highest existing backup number of
+        the current log file, compressed or not.
+
+        Returns:
+            int: The number of the next backup.
+        """
+        prefix = os.path.basename(self.file) + "."
+        numbers = [0]
+        for filename in os.listdir(self.path):
+            if filename.startswith(prefix):
+                number = filename[len(prefix):].split(".")[0]
+                if number.isdigit():
+                    numbers.append(int(number))
+        return max(numbers) + 1
+
+    def _shift_backups(self) -> str | None:
+        """
+        Renames the current log file to a numbered backup.
+
+        Without an archiver, the current log file becomes the first backup,
+        the older backups are shifted up by one and the backups beyond
+        `backup_count` are deleted. With an archiver, the current log file
+        becomes the backup with the next higher number.
+
+        Returns:
+            str | None: The path of the new backup, or None if there is none.
+        """
+        if not os.path.exists(self.file):
+            return None
+        if self.archiver is not None:
+            backup = self._backup(self._next_backup_number())
+            os.replace(self.file, backup)
+            return backup
+        if self.backup_count <= 0:
+            os.remove(self.file)
+            return None
+        for number in range(self.backup_count - 1, 0, -1):
+            if os.path.exists(self._backup(number)):
+                os.replace(self._backup(number), self._backup(number + 1))
+        os.replace(self.file, self._backup(1))
+        return self._backup(1)
+
+    def __repr__(self) -> str:
+        return f"Rotation({self.file}, {self.interval}, {self.max_bytes}, \
+{self.backup_count})"
+
+    def __str__(self) -> str:
+        return f"Rotation with: {self.file}, {self.interval}, \
+{self.max_bytes} and {self.backup_count}"
@@ -0,0 +1,64 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `RotationInterval` class, an enumeration of the
+fixed intervals after which a file-based handler of the `loggingpython`
+package starts a new log file. Every interval has a stamp format, which is
+part of the names of the log files written during that interval.
+
+The `RotationInterval` class includes two members: DAILY and HOURLY. Other
+intervals can be given to the handlers as a `datetime.timedelta`, and
+rotation by time can be disabled with None.
+
+Example usage:
+
+    from loggingpython import FileHandler, RotationInterval
+
+    # Start a new log file every hour
+    file_handler = FileHandler("app",
+                               rotation_interval=RotationInterval.HOURLY)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from enum import Enum
+
+
+class RotationInterval(Enum):
+    """
+    `loggingpython`
+
+    Enum class that represents the fixed rotation intervals of log files.
+
+    This class defines two enum members: DAILY and HOURLY. The value of each
+    member is the stamp format of the log file names. DAILY starts a new log
+    file at local midnight and names it with the date, HOURLY starts a new
+    log file at the start of every local hour and names it with the date and
+    the hour.
+    """
+
+    DAILY = "%Y-%m-%d"
+    HOURLY = "%Y-%m-%d_%H"
@@ -0,0 +1,398 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module provides the readers for the log files written by the
+`SegmentHandler` of the `loggingpython` package. The readers load selected
+columns of the log messages straight into NumPy arrays or a pandas
+DataFrame, without parsing the log messages one by one.
+
+The readers first read the small index at the start of every segment. Segments
+whose time range or log levels do not match the filters are skipped without
+being decompressed. Of the other segments, only the selected columns are
+decompressed and wrapped as NumPy arrays. The dictionaries of the logger names
+and the messages of all segments are merged, so the dictionary encoded
+columns turn into pandas categoricals without creating one string per log
+message. Parquet files written with `backend="parquet"` are read with
+pyarrow.
+
+NumPy and pandas are optional dependencies of the `analysis` extra and are
+imported only when a reader is called.
+
+Example usage:
+
+    from loggingpython.segment_reader import read_columns, read_dataframe
+
+    # Load the timestamps and log levels of a segment file as NumPy arrays
+    columns = read_columns("logs/archive_2024-01-01.lpseg",
+                           columns=["created", "levelno"])
+
+    # Load the errors of the last hour as a pandas DataFrame
+    errors = read_dataframe(segment_handler, start=time.time() - 3600,
+                            min_level=LogLevel.ERROR)
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+import json
+import os
+import zlib
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterator, Sequence
+
+from .handler.segmenthandler import SegmentHandler, SEGMENT_HEADER, \
+    SEGMENT_MAGIC
+from .log_levels import LogLevel
+
+
+_DICTIONARY_COLUMNS: tuple[str, ...] = ("loggername", "message")
+_DTYPES: dict[str, str] = {"created": "<i8", "levelno": "|u1",
+                           "loggername": "<i4", "message": "<i4"}
+_SEVERITIES: dict[str, int] = {loglevel.value: loglevel.severity
+                               for loglevel in LogLevel}
+
+
+def read_segment_index(source: str | SegmentHandler) -> list[dict]:
+    """
+    Returns the indexes of the segments of a segment file.
+
+    Args:
+        source (str | SegmentHandler): The path of the segment file, or the
+            handler whose current segment file is read.
+
+    Returns:
+        list[dict]: For every segment, the number of log messages
+            (`records`), the first and the last timestamp in microseconds
+            since the epoch (`min_created`, `max_created`), the number of
+            log messages per log level (`levels`) and the location of the
+            compressed columns (`columns`).
+
+    Raises:
+        FileNotFoundError: If the segment file does not exist.
+    """
+    with open(_file_of(source), "rb") as segment_file:
+        return [index for index, _ in _segments(segment_file)]
+
+
+def read_columns(source: str | SegmentHandler,
+                 columns: Sequence[str] | None = None,
+                 start: datetime | float | None = None,
+                 end: datetime | float | None = None,
+                 min_level: LogLevel | int | None = None) -> dict:
+    """
+    Loads columns of a segment file into NumPy arrays.
+
+    Args:
+        source (str | SegmentHandler): The path of the segment file, or the
+            handler whose current segment file is read. Log messages still
+            buffered in the handler are not included; flush it first.
+        columns (Sequence[str], optional): The columns to be loaded, out of
+            `SegmentHandler.COLUMNS`. Defaults to None, which loads all
+            columns.
+        start (datetime | float, optional): The earliest timestamp, as a
+            datetime or in seconds since the epoch. Defaults to None.
+        end (datetime | float, optional): The latest timestamp, as a
+            datetime or in seconds since the epoch. Defaults to None.
+        min_level (LogLevel | int, optional): The lowest log level, as a
+            LogLevel or as its severity. Defaults to None.
+
+    Returns:
+        dict[str, numpy.ndarray]: The columns: `created` as datetime64[us]
+            in UTC, `levelno` as uint8 and the logger names and messages as
+            object arrays of strings.
+
+    Raises:
+        ValueError: If a column is unknown.
+        FileNotFoundError: If the segment file does not exist.
+        ImportError: If NumPy, or pyarrow for a Parquet file, is not
+            installed.
+    """
+    import numpy as np
+
+    file = _file_of(source)
+    if file.endswith(".parquet"):
+        frame = _read_parquet(file, columns, start, end, min_level)
+        return {name: frame[name].to_numpy() for name in frame.columns}
+    values, dictionaries = _read(file, columns, start, end, min_level)
+    for name, dictionary in dictionaries.items():
+        strings = np.empty(len(dictionary), dtype=object)
+        strings[:] = list(dictionary)
+        values[name] = strings[values[name]]
+    return values
+
+
+def read_dataframe(source: str | SegmentHandler,
+                   columns: Sequence[str] | None = None,
+                   start: datetime | float | None = None,
+                   end: datetime | float | None = None,
+                   min_level: LogLevel | int | None = None):
+    """
+    Loads columns of a segment file into a pandas DataFrame.
+
+    The logger names and the messages become categoricals, and `created`
+    becomes a timezone-aware timestamp in UTC.
+
+    Args:
+        source (str | SegmentHandler): The path of the segment file, or the
+            handler whose current segment file is read. Log messages still
+            buffered in the handler are not included; flush it first.
+        columns (Sequence[str], optional): The columns to be loaded, out of
+            `SegmentHandler.COLUMNS`. Defaults to None, which loads all
+            columns.
+        start (datetime | float, optional): The earliest timestamp, as a
+            datetime or in seconds since the epoch. Defaults to None.
+        end (datetime | float, optional): The latest timestamp, as a
+            datetime or in seconds since the epoch. Defaults to None.
+        min_level (LogLevel | int, optional): The lowest log level, as a
+            LogLevel or as its severity. Defaults to None.
+
+    Returns:
+        pandas.DataFrame: One row per log message.
+
+    Raises:
+        ValueError: If a column is unknown.
+        FileNotFoundError: If the segment file does not exist.
+        ImportError: If pandas, or pyarrow for a Parquet file, is not
+            installed.
+    """
+    import pandas as pd
+
+    file = _file_of(source)
+    if file.endswith(".parquet"):
+        return _read_parquet(file, columns, start, end, min_level)
+    values, dictionaries = _read(file, columns, start, end, min_level)
+    for name, dictionary in dictionaries.items():
+        values[name] = pd.Categorical.from_codes(values[name],
+                                                 categories=list(dictionary))
+    if "created" in values:
+        values["created"] = pd.Series(values["created"]).dt.tz_localize(
+            "UTC")
+    return pd.DataFrame(values)
+
+
+def _read(file: str,
+          columns: Sequence[str] | None,
+          start: datetime | float | None,
+          end: datetime | float | None,
+          min_level: LogLevel | int | None) -> tuple[dict, dict]:
+    """
+    Loads columns of a segment file, with the dictionary encoded columns as
+    codes into merged dictionaries.
+
+    Returns:
+        tuple[dict, dict]: The NumPy arrays by column name, and the merged
+            dictionaries of the dictionary encoded columns, which map every
+            value to its code.
+    """
+    import numpy as np
+
+    selected = _columns(columns)
+    start_us = _microseconds(start)
+    end_us = _microseconds(end)
+    severity = _severity(min_level)
+    parts: dict[str, list] = {name: [] for name in selected}
+    dictionaries = {name: {} for name in _DICTIONARY_COLUMNS
+                    if name in selected}
+
+    with open(file, "rb") as segment_file:
+        def load(name: str, key: str | None = None) -> bytes:
+            location = index["columns"][name]
+            if key is not None:
+                location = location[key]
+            segment_file.seek(body + location["offset"])
+            return zlib.decompress(segment_file.read(location["length"]))
+
+        for index, body in _segments(segment_file):
+            if not _overlaps(index, start_us, end_us, severity):
+                continue
+            loaded = {}
+            mask = None
+            if start_us is not None or end_us is not None:
+                created = loaded["created"] = np.frombuffer(
+                    load("created"), dtype="<i8")
+                if start_us is not None:
+                    mask = created >= start_us
+                if end_us is not None:
+                    mask = (created <= end_us) if mask is None else \
+                        mask & (created <= end_us)
+            if severity is not None:
+                levelno = loaded["levelno"] = np.frombuffer(
+                    load("levelno"), dtype="|u1")
+                mask = (levelno >= severity) if mask is None else \
+                    mask & (levelno >= severity)
+            for name in selected:
+                values = loaded.get(name)
+                if values is None:
+                    values = np.frombuffer(
+                        load(name), dtype=index["columns"][name]["dtype"])
+                if name in dictionaries:
+                    merged = dictionaries[name]
+                    strings = json.loads(load(name, "dictionary"))
+                    codes = np.fromiter(
+                        (merged.setdefault(string, len(merged))
+                         for string in strings),
+                        dtype=np.int32, count=len(strings))
+                    values = codes[values]
+                if mask is not None:
+                    values = values[mask]
+                parts[name].append(values)
+
+    values = {name: np.concatenate(parts[name]) if parts[name] else
+              np.empty(0, dtype=_DTYPES[name]) for name in selected}
+    if "created" in values:
+        values["created"] = values["created"].astype("datetime64[us]")
+    return values, dictionaries
+
+
+def _read_parquet(file: str,
+                  columns: Sequence[str] | None,
+                  start: datetime | float | None,
+                  end: datetime | float | None,
+                  min_level: LogLevel | int | None):
+    """
+    Loads columns of a Parquet file written by a `SegmentHandler` into a
+    pandas DataFrame.
+
+    Returns:
+        pandas.DataFrame: One row per log message.
+    """
+    import pyarrow.parquet as pq
+
+    selected = _columns(columns)
+    filters = []
+    start_us = _microseconds(start)
+    end_us = _microseconds(end)
+    severity = _severity(min_level)
+    if start_us is not None:
+        filters.append(("created", ">=", _timestamp(start_us)))
+    if end_us is not None:
+        filters.append(("created", "<=", _timestamp(end_us)))
+    if severity is not None:
+        filters.append(("levelno", ">=", severity))
+    table = pq.read_table(file, columns=list(selected),
+                          filters=filters or None)
+    return table.to_pandas()
+
+
+def _segments(segment_file: BinaryIO) -> Iterator[tuple[dict, int]]:
+    """
+    Reads the indexes of the segments of a segment file. A segment torn by a
+    crash ends the file.
+
+    Args:
+        segment_file (BinaryIO): The segment file opened in binary mode.
+
+    Returns:
+        Iterator[tuple[dict, int]]: The index of every segment and the
+            position of its compressed columns in the file.
+    """
+    size = os.fstat(segment_file.fileno()).st_size
+    position = 0
+    while position + SEGMENT_HEADER.size <= size:
+        segment_file.seek(position)
+        magic, index_length, body_length = SEGMENT_HEADER.unpack(
+            segment_file.read(SEGMENT_HEADER.size))
+        body = position + SEGMENT_HEADER.size + index_length
+        if magic != SEGMENT_MAGIC or body + body_length > size:
+            return
+        index = json.loads(segment_file.read(index_length))
+        yield index, body
+        position = body + body_length
+
+
+def _overlaps(index: dict,
+              start_us: int | None,
+              end_us: int | None,
+              severity: int | None) -> bool:
+    """
+    Checks with its index whether a segment may contain matching log
+    messages.
+
+    Returns:
+        bool: False if the segment can be skipped, True otherwise.
+    """
+    if start_us is not None and index["max_created"] < start_us:
+        return False
+    if end_us is not None and index["min_created"] > end_us:
+        return False
+    if severity is not None:
+        return any((_SEVERITIES[name] if name in _SEVERITIES else
+                    int(name)) >= severity for name in index["levels"])
+    return True
+
+
+def _columns(columns: Sequence[str] | None) -> tuple[str, ...]:
+    """
+    Validates the selected columns.
+
+    Returns:
+        tuple[str, ...]: The selected columns, or all columns for None.
+
+    Raises:
+        ValueError: If a column is unknown.
+    """
+    if columns is None:
+        return SegmentHandler.COLUMNS
+    for name in columns:
+        if name not in SegmentHandler.COLUMNS:
+            raise ValueError(f"Unknown segment column: {name!r}")
+    return tuple(columns)
+
+
+def _microseconds(moment: datetime | float | None) -> int | None:
+    """
+    Converts a datetime or seconds since the epoch into microseconds since
+    the epoch.
+    """
+    if moment is None:
+        return None
+    if isinstance(moment, datetime):
+        moment = moment.timestamp()
+    return int(moment * 1_000_000)
+
+
+def _timestamp(microseconds: int) -> datetime:
+    """
+    Converts microseconds since the epoch into a timezone-aware datetime.
+    """
+    return datetime.fromtimestamp(microseconds / 1_000_000, timezone.utc)
+
+
+def _severity(min_level: LogLevel | int | None) -> int | None:
+    """
+    Returns the severity of a log level.
+    """
+    if isinstance(min_level, LogLevel):
+        return min_level.severity
+    return min_level
+
+
+def _file_of(source: str | SegmentHandler) -> str:
+    """
+    Returns the path of a segment file.
+    """
+    if isinstance(source, SegmentHandler):
+        return source.file
+    return source
@@ -0,0 +1,129 @@
+# MIT License
+#
+# Copyright (c) 2024 Mr-Major-K
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+This module defines the `TimestampFormatter` class, which renders the
+timestamps of log records within the `loggingpython` package. A log record
+captures the current time exactly once as a numeric epoch timestamp, and the
+`TimestampFormatter` turns that number into the `iso_8601_time` and `asctime`
+strings of the record.
+
+Calling `strftime` for every record is comparatively expensive, although
+everything except the sub-second part of a timestamp only changes once per
+second. The `TimestampFormatter` therefore caches the rendered parts of the
+current second and only formats the microseconds for each record.
+
+Example usage:
+
+    import time
+    from loggingpython.timestamp import TimestampFormatter
+
+    formatter = TimestampFormatter("%Y-%m-%d %H:%M:%S.%f")
+    print(formatter.format(time.time()))
+
+This module is part of the `loggingpython` package, which aims to provide a
+comprehensive logging solution for Python applications, including error
+handling and logging mechanisms for both client and server-side operations.
+"""
+
+from datetime import datetime, timezone
+
+
+class TimestampFormatter:
+    """
+    `loggingpython`
+
+    A class for rendering epoch timestamps with a `strftime` format string.
+
+    The format string is split at its `%f` (microsecond) directives. The parts
+    in between are rendered with `strftime` once per second and cached, so
+    formatting a timestamp within the cached second only needs to render the
+    microseconds. All timestamps are rendered in UTC.
+    """
+
+    def __init__(self, time_format: str) -> None:
+        """
+        Initializes the TimestampFormatter with the given format string.
+
+        Args:
+            time_format (str): A `strftime` format string.
+        """
+        self.time_format: str = time_format
+        self._format_parts: list[str] = self._split_format(time_format)
+        self._cache: tuple[int, list[str]] = (-1, [])
+
+    def _split_format(self, time_format: str) -> list[str]:
+        """
+        Splits the format string at its `%f` directives.
+
+        Escaped percent signs (`%%`) are kept as they are, so `%%f` is not
+        treated as a microsecond directive.
+
+        Args:
+            time_format (str): A `strftime` format string.
+
+        Returns:
+            list: The parts of the format string between the `%f` directives.
+        """
+        parts: list[str] = []
+        part_start = 0
+        index = 0
+        while index < len(time_format) - 1:
+            if time_format[index] != "%":
+                index += 1
+            elif time_format[index + 1] == "f":
+                parts.append(time_format[part_start:index])
+                index += 2
+                part_start = index
+            else:
+                index += 2
+        parts.append(time_format[part_start:])
+        return parts
+
+    def format(self, created: float) -> str:
+        """
+        Renders the given epoch timestamp.
+
+        Args:
+            created (float): Seconds since the epoch, as returned by
+                `time.time()`.
+
+        Returns:
+            str: The rendered timestamp.
+        """
+        second, microseconds = divmod(round(created * 1_000_000), 1_000_000)
+        cached_second, rendered_parts = self._cache
+        if cached_second != second:
+            moment = datetime.fromtimestamp(second, timezone.utc)
+            rendered_parts = [moment.strftime(part)
+                              for part in self._format_parts]
+            self._cache = (second, rendered_parts)
+        if len(rendered_parts) == 1:
+            return rendered_parts[0]
+        return f"{microseconds:06d}".join(rendered_parts)
+
+    def __repr__(self) -> str:
+        return f"TimestampFormatter({self.time_format})"
+
+    def __str__(self) -> str:
+        return f"TimestampFormatter with: {self.time_format}"
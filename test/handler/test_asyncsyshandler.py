@@ -0,0 +1,82 @@
+import asyncio
+import json
+import unittest
+
+from loggingpython.async_logger import AsyncLogger
+from loggingpython.sys_protocolls import SysProtocolls
+from loggingpython.handler.asyncsyshandler import AsyncSysHandler
+from loggingpython.error.server_unreachable_error import \
+    ServerUnreachableError
+
+
+class TestAsyncSysHandler(unittest.TestCase):
+
+    def test_tcp_messages_are_acknowledged(self):
+        received = []
+
+        async def handle(reader, writer):
+            while data := await reader.read(1024):
+                received.append(json.loads(data))
+                writer.write(b"Receive message")
+                await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            logger = AsyncLogger("async")
+            logger.addHandler(AsyncSysHandler(name="tcp", port=port,
+                                              server_name="127.0.0.1"))
+            for index in range(3):
+                logger.info("message %d", index)
+            await logger.aclose()
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(main())
+        self.assertEqual([message["message"] for message in received],
+                         ["message 0", "message 1", "message 2"])
+        self.assertEqual(received[0]["client_name"], "tcp")
+        self.assertEqual(received[0]["loggername"], "async")
+
+    def test_udp_messages(self):
+        received = []
+
+        class Server(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                received.append(json.loads(data))
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            transport, _ = await loop.create_datagram_endpoint(
+                Server, local_addr=("127.0.0.1", 0))
+            port = transport.get_extra_info("sockname")[1]
+            handler = AsyncSysHandler(protocoll=SysProtocolls.UDP,
+                                      server_name="127.0.0.1", port=port)
+            logger = AsyncLogger("async")
+            logger.addHandler(handler)
+            logger.info("datagram")
+            await logger.aflush()
+            while not received:
+                await asyncio.sleep(0.01)
+            await logger.aclose()
+            transport.close()
+
+        asyncio.run(main())
+        self.assertEqual(received[0]["message"], "datagram")
+
+    def test_unreachable_server(self):
+        async def main():
+            server = await asyncio.start_server(lambda r, w: None,
+                                                "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            server.close()
+            await server.wait_closed()
+            await AsyncSysHandler(server_name="127.0.0.1", port=port).connect()
+
+        with self.assertRaises(ServerUnreachableError):
+            asyncio.run(main())
+
+
+if __name__ == '__main__':
+    unittest.main()
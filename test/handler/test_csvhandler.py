@@ -0,0 +1,88 @@
+import csv
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+
+from loggingpython.handler.csvhandler import CSVHandler
+from loggingpython.logger import Logger
+
+
+class TestCSVHandler(unittest.TestCase):
+    def tearDown(self):
+        shutil.rmtree("test_logs", ignore_errors=True)
+
+    def read_rows(self, file):
+        with open(file, "r", newline="") as csv_file:
+            return list(csv.reader(csv_file, delimiter=";"))
+
+    def test_fields_are_quoted(self):
+        handler = CSVHandler("test_csv", "test_logs")
+        logger = Logger("csv")
+        logger.addHandler(handler)
+        messages = ["plain", "semi;colon", 'a "quote"', "line\nbreak", ""]
+        for message in messages:
+            logger.info(message)
+        handler.close()
+        rows = self.read_rows(handler.file.name)
+        self.assertEqual([row[4] for row in rows], messages)
+        self.assertTrue(all(row[0] == "csv" and row[3] == "INFO"
+                            for row in rows))
+
+    def test_batch_is_written_in_one_write(self):
+        handler = CSVHandler("test_csv", "test_logs")
+        writes = []
+        write = handler.file.write
+        handler.file.write = lambda data: writes.append(data) or write(data)
+        handler.emit_batch([{"message": str(number)}
+                            for number in range(10)])
+        handler.close()
+        self.assertEqual(len(writes), 1)
+        self.assertEqual([row[4] for row in self.read_rows(
+            handler.file.name)], [str(number) for number in range(10)])
+
+    def test_header_is_written_once_per_file(self):
+        for _ in range(2):
+            handler = CSVHandler("test_csv", "test_logs", header=True)
+            handler.emit({"message": "message"})
+            handler.close()
+        rows = self.read_rows(handler.file.name)
+        self.assertEqual(rows[0], list(CSVHandler.COLUMNS))
+        self.assertEqual(len(rows), 3)
+
+    def test_header_starts_every_rotated_file(self):
+        handler = CSVHandler("test_csv", "test_logs", header=True,
+                             rotation_interval=None, max_bytes=100)
+        for _ in range(10):
+            handler.emit({"message": "x" * 40})
+        handler.close()
+        files = sorted(os.listdir("test_logs"))
+        self.assertGreater(len(files), 1)
+        for file in files:
+            rows = self.read_rows(os.path.join("test_logs", file))
+            self.assertEqual(rows[0], list(CSVHandler.COLUMNS))
+
+    def test_interval_rollover_onto_an_existing_file_keeps_one_header(self):
+        handler = CSVHandler("test_csv", "test_logs", header=True)
+        handler.emit({"message": "before"})
+        # An interval that has already ended starts the log file of the
+        # current interval again, which already has a header.
+        handler._rotation.rollover_at = 0
+        handler.emit({"message": "after"})
+        handler.close()
+        rows = self.read_rows(handler.file.name)
+        self.assertEqual(rows[0], list(CSVHandler.COLUMNS))
+        self.assertEqual([row[4] for row in rows[1:]], ["before", "after"])
+
+    def test_import_does_not_load_pandas(self):
+        code = "import sys, loggingpython; print('pandas' in sys.modules)"
+        environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.run([sys.executable, "-c", code],
+                                capture_output=True, text=True,
+                                env=environment, check=True).stdout
+        self.assertEqual(output.splitlines()[-1], "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
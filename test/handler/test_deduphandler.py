@@ -0,0 +1,110 @@
+import pickle
+import time
+import unittest
+
+from loggingpython.handler.deduphandler import DedupHandler
+from loggingpython.handler.handler import Handler
+from loggingpython.logger import Logger
+
+
+class RecordingHandler(Handler):
+    def __init__(self):
+        self.records = []
+        self.flushed = 0
+        self.closed = False
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def flush(self):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestDedupHandler(unittest.TestCase):
+    def setUp(self):
+        self.target = RecordingHandler()
+        self.logger = Logger("dedup")
+
+    def messages(self):
+        return [record["message"] for record in self.target.records]
+
+    def test_storm_collapses_into_one_record_and_a_summary(self):
+        handler = DedupHandler(self.target, window=60.0)
+        self.logger.addHandler(handler)
+        for elapsed in range(1000):
+            self.logger.error("Timeout after %d ms", elapsed)
+        self.assertEqual(self.messages(), ["Timeout after 0 ms"])
+        self.assertEqual(handler.suppressed, 999)
+        handler.close()
+        self.assertEqual(len(self.target.records), 2)
+        self.assertRegex(self.target.records[1]["message"],
+                         r"^Timeout after 999 ms \(repeated 999 more times "
+                         r"in \d+\.\d s\)$")
+        self.assertEqual(self.target.records[1]["loglevel"], "ERROR")
+        self.assertTrue(self.target.closed)
+
+    def test_levels_and_templates_are_kept_apart(self):
+        handler = DedupHandler(self.target)
+        self.logger.addHandler(handler)
+        self.logger.error("first")
+        self.logger.warning("first")
+        self.logger.error("second")
+        self.logger.error("first")
+        self.assertEqual(self.messages(), ["first", "first", "second"])
+        handler.close()
+
+    def test_summary_is_emitted_after_the_window(self):
+        handler = DedupHandler(self.target, window=0.05)
+        self.logger.addHandler(handler)
+        self.logger.error("storm")
+        self.logger.error("storm")
+        deadline = time.monotonic() + 5
+        while len(self.target.records) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.target.records), 2)
+        self.assertIn("(repeated 1 more time in", self.messages()[1])
+        self.logger.error("storm")
+        self.assertEqual(self.messages()[2], "storm")
+        handler.close()
+
+    def test_full_table_evicts_the_oldest_window(self):
+        handler = DedupHandler(self.target, max_keys=2)
+        self.logger.addHandler(handler)
+        self.logger.error("a")
+        self.logger.error("a")
+        self.logger.error("b")
+        self.logger.error("c")
+        self.assertEqual(len(handler._windows), 2)
+        self.assertEqual(self.messages()[:3], ["a", "b", "a (repeated 1 "
+                                               "more time in 0.0 s)"])
+        self.assertEqual(self.messages()[3], "c")
+        handler.close()
+
+    def test_flush_emits_pending_summaries(self):
+        handler = DedupHandler(self.target)
+        handler.emit_batch([{"loggername": "dict", "loglevel": "INFO",
+                             "message": "message"}] * 3)
+        handler.flush()
+        self.assertEqual(self.messages(),
+                         ["message",
+                          "message (repeated 2 more times in 0.0 s)"])
+        self.assertEqual(self.target.flushed, 1)
+        handler.close()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            DedupHandler(self.target, window=0)
+        with self.assertRaises(ValueError):
+            DedupHandler(self.target, max_keys=0)
+
+    def test_pickled_record_keeps_its_template(self):
+        record = self.logger._format_message("x 1", self.logger.min_loglevel,
+                                             "x %s")
+        self.assertEqual(pickle.loads(pickle.dumps(record)).template, "x %s")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
 import unittest
+import multiprocessing
 import os
+import time
 
 from datetime import datetime
 from loggingpython.handler.filehandler import FileHandler
+from loggingpython.log_levels import LogLevel
+from loggingpython.logger import Logger
 
 
 class TestFileHandler(unittest.TestCase):
@@ -29,6 +33,19 @@ class TestFileHandler(unittest.TestCase):
             self.assertEqual(len(lines), 1)
             self.assertIn("This is a test message", lines[0])
 
+    def test_batch_writing(self):
+        test_messages = [{"asctime": datetime.now().strftime(
+            "%Y-%m-%d %H:%M:%S"),
+                          "loggername": "test_logger",
+                          "loglevel": "INFO",
+                          "message": f"This is test message {index}"}
+                         for index in range(3)]
+        self.handler.emit_batch(test_messages)
+        with open(self.handler.file.name, "r") as file:
+            lines = file.readlines()
+            self.assertEqual(len(lines), 3)
+            self.assertIn("This is test message 2", lines[2])
+
     def test_file_closing(self):
         test_message = {"asctime": datetime.now().strftime(
             "%Y-%m-%d %H:%M:%S"),
@@ -42,5 +59,133 @@ class TestFileHandler(unittest.TestCase):
             self.handler.file.write("Another test message\n")
 
 
+class TestBufferedFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.logger = Logger("test_logger", min_loglevel=LogLevel.DEBUG)
+
+    def tearDown(self):
+        self.handler.close()
+        if os.path.exists(self.handler.file.name):
+            os.remove(self.handler.file.name)
+
+    def _lines(self):
+        with open(self.handler.file.name, "r") as file:
+            return file.readlines()
+
+    def test_record_trigger(self):
+        self.handler = FileHandler("test_buffered", "test_logs",
+                                   buffered=True, buffer_records=3,
+                                   max_buffer_age=None)
+        self.logger.addHandler(self.handler)
+        self.logger.info("first")
+        self.logger.info("second")
+        self.assertEqual(self._lines(), [])
+        self.logger.info("third")
+        self.assertEqual(len(self._lines()), 3)
+
+    def test_byte_trigger(self):
+        self.handler = FileHandler("test_buffered", "test_logs",
+                                   buffered=True, buffer_bytes=1024,
+                                   max_buffer_age=None)
+        self.logger.addHandler(self.handler)
+        self.logger.log_many(["x" * 100] * 5)
+        self.assertEqual(self._lines(), [])
+        self.logger.log_many(["x" * 100] * 100)
+        self.assertGreater(len(self._lines()), 0)
+
+    def test_level_trigger(self):
+        self.handler = FileHandler("test_buffered", "test_logs",
+                                   buffered=True, max_buffer_age=None,
+                                   flush_level=LogLevel.ERROR)
+        self.logger.addHandler(self.handler)
+        self.logger.warning("warning")
+        self.assertEqual(self._lines(), [])
+        self.logger.error("error")
+        self.assertEqual(len(self._lines()), 2)
+
+    def test_age_trigger(self):
+        self.handler = FileHandler("test_buffered", "test_logs",
+                                   buffered=True, max_buffer_age=0.05)
+        self.logger.addHandler(self.handler)
+        self.logger.info("aged")
+        deadline = time.monotonic() + 5
+        while not self._lines() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self._lines()), 1)
+
+    def test_close_writes_the_buffer(self):
+        self.handler = FileHandler("test_buffered", "test_logs",
+                                   buffered=True, max_buffer_age=None)
+        self.logger.addHandler(self.handler)
+        self.logger.info("buffered")
+        self.handler.close()
+        self.assertEqual(len(self._lines()), 1)
+
+
+def _append_lines(worker: int, count: int) -> None:
+    logger = Logger(f"worker{worker}")
+    handler = FileHandler("test_atomic", "test_logs",
+                          logformat_string="%(loggername)s %(message)s",
+                          atomic_append=True)
+    logger.addHandler(handler)
+    for number in range(count):
+        logger.info(f"{number:06d} " + "x" * 200)
+    handler.close()
+
+
+class TestAtomicAppendFileHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = FileHandler("test_atomic", "test_logs",
+                                   logformat_string="%(message)s",
+                                   atomic_append=True)
+        self.logger = Logger("test_logger")
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.handler.close()
+        if os.path.exists(self.handler.file.name):
+            os.remove(self.handler.file.name)
+
+    def _lines(self):
+        with open(self.handler.file.name, "r", encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def test_message_writing(self):
+        self.logger.info("first")
+        self.logger.info("zweiter Eintrag – ü")
+        self.assertEqual(self._lines(), ["first", "zweiter Eintrag – ü"])
+
+    def test_batch_writing(self):
+        self.logger.log_many([f"message {number}"
+                              for number in range(2000)])
+        self.assertEqual(self._lines(),
+                         [f"message {number}" for number in range(2000)])
+
+    def test_buffered_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FileHandler("test_atomic", "test_logs", buffered=True,
+                        atomic_append=True)
+
+    def test_rotation_by_size_is_rejected(self):
+        with self.assertRaises(ValueError):
+            FileHandler("test_atomic", "test_logs", max_bytes=1000,
+                        atomic_append=True)
+
+    def test_processes_do_not_tear_lines(self):
+        workers = [multiprocessing.Process(target=_append_lines,
+                                           args=(worker, 500))
+                   for worker in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        lines = self._lines()
+        self.assertEqual(len(lines), 2000)
+        for line in lines:
+            loggername, number, payload = line.split(" ")
+            self.assertIn(loggername, {f"worker{n}" for n in range(4)})
+            self.assertEqual(payload, "x" * 200)
+
+
 if __name__ == '__main__':
     unittest.main()
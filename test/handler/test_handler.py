@@ -9,6 +9,19 @@ class TestHandler(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             handler.emit({})
 
+    def test_emit_batch_falls_back_to_emit(self):
+        class RecordingHandler(Handler):
+            def __init__(self):
+                self.records = []
+
+            def emit(self, record):
+                self.records.append(record)
+
+        handler = RecordingHandler()
+        handler.emit_batch([{"message": "first"}, {"message": "second"}])
+        self.assertEqual(handler.records,
+                         [{"message": "first"}, {"message": "second"}])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,198 @@
+import json
+import os
+import shutil
+import sys
+import unittest
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from loggingpython.handler.jsonhandler import JSONHandler
+from loggingpython.json_format import JSONFormat
+from loggingpython.log_reader import read_ndjson
+from loggingpython.logger import Logger
+
+
+class TestNDJSONHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   json_format=JSONFormat.NDJSON)
+        self.logger = Logger(name="test_logger")
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.handler.close()
+        shutil.rmtree("test_json_logs", ignore_errors=True)
+
+    def _lines(self) -> list[str]:
+        with open(self.handler.file, "r", encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def test_one_line_per_record(self):
+        self.logger.info("first")
+        self.logger.warning("zweiter – ü")
+        lines = self._lines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(self.handler.file.endswith(".ndjson"))
+        self.assertEqual(json.loads(lines[1])["message"], "zweiter – ü")
+        self.assertEqual(json.loads(lines[1])["loglevel"], "WARNING")
+        self.assertEqual(self.handler.log_data, {})
+
+    def test_batch(self):
+        self.logger.log_many([f"message {number}" for number in range(100)])
+        self.assertEqual([json.loads(line)["message"]
+                          for line in self._lines()],
+                         [f"message {number}" for number in range(100)])
+
+    def test_size_rotation(self):
+        self.handler.close()
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   max_bytes=300,
+                                   json_format=JSONFormat.NDJSON)
+        self.logger.handlers = [self.handler]
+        for number in range(10):
+            self.logger.info(f"message {number}")
+        self.assertTrue(os.path.exists(self.handler.file + ".1"))
+        self.assertLessEqual(os.path.getsize(self.handler.file), 300)
+
+    def test_read_ndjson(self):
+        self.logger.info("first")
+        self.logger.error("second")
+        with open(self.handler.file, "a") as file:
+            file.write('{"message": "cut sh')
+        self.assertEqual([record["message"]
+                          for record in read_ndjson(self.handler)],
+                         ["first", "second"])
+
+    def test_follow_ndjson(self):
+        reader = read_ndjson(self.handler, follow=True, poll_interval=0.01,
+                             idle_timeout=0.2)
+        self.logger.info("appended")
+        self.assertEqual(next(reader)["message"], "appended")
+        self.assertEqual(list(reader), [])
+
+
+class TestJSONArrayHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   json_format=JSONFormat.ARRAY)
+        self.logger = Logger(name="test_logger")
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.handler.close()
+        shutil.rmtree("test_json_logs", ignore_errors=True)
+
+    def _load(self) -> list:
+        with open(self.handler.file, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    def test_document_stays_valid(self):
+        self.assertEqual(self._load(), [])
+        self.logger.info("first")
+        self.assertEqual([record["message"] for record in self._load()],
+                         ["first"])
+        self.logger.log_many(["second", "third"])
+        self.assertEqual([record["message"] for record in self._load()],
+                         ["first", "second", "third"])
+        self.assertEqual(self.handler.log_data, {})
+
+    def test_existing_array_is_continued(self):
+        self.logger.info("first")
+        self.handler.close()
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   json_format=JSONFormat.ARRAY)
+        self.logger.handlers = [self.handler]
+        self.logger.info("second")
+        self.assertEqual([record["message"] for record in self._load()],
+                         ["first", "second"])
+
+    def test_torn_write_is_repaired(self):
+        self.logger.log_many(["first", "second"])
+        self.handler.close()
+        with open(self.handler.file, "r+b") as file:
+            file.seek(-5, os.SEEK_END)
+            file.truncate()
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   json_format=JSONFormat.ARRAY)
+        self.logger.handlers = [self.handler]
+        self.logger.info("third")
+        self.assertEqual([record["message"] for record in self._load()],
+                         ["first", "third"])
+
+    def test_torn_write_longer_than_a_chunk_is_repaired(self):
+        self.logger.log_many(["first", "second"])
+        self.logger.info("x" * 100000)
+        self.handler.close()
+        with open(self.handler.file, "r+b") as file:
+            file.seek(-50, os.SEEK_END)
+            file.truncate()
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   json_format=JSONFormat.ARRAY)
+        self.logger.handlers = [self.handler]
+        self.logger.info("third")
+        self.assertEqual([record["message"] for record in self._load()],
+                         ["first", "second", "third"])
+
+    def test_document_file_is_not_repaired(self):
+        self.handler.close()
+        document = JSONHandler("test_document", "test_json_logs")
+        document.emit({"message": "first"})
+        with open(document.file, "rb") as file:
+            content = file.read()
+        with self.assertRaises(ValueError):
+            JSONHandler("test_document", "test_json_logs",
+                        json_format=JSONFormat.ARRAY)
+        with open(document.file, "rb") as file:
+            self.assertEqual(file.read(), content)
+
+    def test_size_rotation(self):
+        self.handler.close()
+        self.handler = JSONHandler("test_log", "test_json_logs",
+                                   max_bytes=400,
+                                   json_format=JSONFormat.ARRAY)
+        self.logger.handlers = [self.handler]
+        for number in range(10):
+            self.logger.info(f"message {number}")
+        with open(self.handler.file + ".1", "r") as file:
+            self.assertIsInstance(json.load(file), list)
+        self.assertLessEqual(os.path.getsize(self.handler.file), 400)
+
+    @unittest.skipIf(resource is None, "resource is not available")
+    def test_memory_stays_flat(self):
+        records = int(os.environ.get("LOGGINGPYTHON_RSS_RECORDS", 1_000_000))
+        batch = [f"message {number}" for number in range(1000)]
+        warmup = max(records // 10, 1000)
+        for _ in range(warmup // 1000):
+            self.logger.log_many(batch)
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        for _ in range((records - warmup) // 1000):
+            self.logger.log_many(batch)
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KiB elsewhere.
+        unit = 1 if sys.platform == "darwin" else 1024
+        self.assertLess((after - before) * unit, 16 * 1024 * 1024)
+        with open(self.handler.file, "rb") as file:
+            file.seek(-3, os.SEEK_END)
+            self.assertEqual(file.read(), b"\n]\n")
+
+
+class TestJSONDocumentHandler(unittest.TestCase):
+    def tearDown(self):
+        shutil.rmtree("test_json_logs", ignore_errors=True)
+
+    def test_document_is_rewritten(self):
+        handler = JSONHandler("test_log", "test_json_logs")
+        logger = Logger(name="test_logger")
+        logger.addHandler(handler)
+        logger.info("first")
+        logger.info("second")
+        handler.close()
+        with open(handler.file, "r") as file:
+            self.assertEqual(len(json.load(file)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import threading
+import unittest
+
+from loggingpython.handler.handler import Handler
+from loggingpython.handler.queuehandler import QueueHandler
+from loggingpython.overflow_policy import OverflowPolicy
+
+
+class RecordingHandler(Handler):
+    def __init__(self, gate: threading.Event | None = None):
+        self.records = []
+        self.flushed = 0
+        self.closed = False
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait()
+        self.records.append(record)
+
+    def flush(self):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+class TestQueueHandler(unittest.TestCase):
+
+    def test_records_are_emitted_in_order(self):
+        target = RecordingHandler()
+        handler = QueueHandler(target)
+        for index in range(100):
+            handler.emit({"message": index})
+        self.assertTrue(handler.flush(timeout=5))
+        self.assertEqual([record["message"] for record in target.records],
+                         list(range(100)))
+        self.assertEqual(target.flushed, 1)
+        handler.close()
+        self.assertTrue(target.closed)
+
+    def test_queued_records_are_emitted_in_batches(self):
+        gate = threading.Event()
+        target = RecordingHandler(gate)
+        target.batches = []
+        target.emit_batch = target.batches.append
+        handler = QueueHandler(target)
+        handler.emit({"message": 0})
+        while handler.queue_depth:
+            pass
+        for index in range(1, 4):
+            handler.emit({"message": index})
+        gate.set()
+        handler.close()
+        self.assertEqual([[record["message"] for record in batch]
+                          for batch in target.batches], [[1, 2, 3]])
+
+    def _blocked_handler(self, overflow_policy):
+        gate = threading.Event()
+        target = RecordingHandler(gate)
+        handler = QueueHandler(target, maxsize=2,
+                               overflow_policy=overflow_policy)
+        # The first record is taken by the listener thread, which then waits
+        # for the gate, so the queue itself holds the following records.
+        handler.emit({"message": 0})
+        while handler.queue_depth:
+            pass
+        return gate, target, handler
+
+    def test_drop_newest(self):
+        gate, target, handler = self._blocked_handler(
+            OverflowPolicy.DROP_NEWEST)
+        for index in range(1, 5):
+            handler.emit({"message": index})
+        self.assertEqual(handler.dropped, 2)
+        gate.set()
+        handler.close()
+        self.assertEqual([record["message"] for record in target.records],
+                         [0, 1, 2])
+
+    def test_drop_oldest(self):
+        gate, target, handler = self._blocked_handler(
+            OverflowPolicy.DROP_OLDEST)
+        for index in range(1, 5):
+            handler.emit({"message": index})
+        self.assertEqual(handler.dropped, 2)
+        gate.set()
+        handler.close()
+        self.assertEqual([record["message"] for record in target.records],
+                         [0, 3, 4])
+
+    def test_drop_oldest_keeps_a_queued_flush(self):
+        gate, target, handler = self._blocked_handler(
+            OverflowPolicy.DROP_OLDEST)
+        handler.emit({"message": 1})
+        flusher = threading.Thread(target=handler.flush)
+        flusher.start()
+        while handler.queue_depth < 2:
+            pass
+        for index in range(2, 4):
+            handler.emit({"message": index})
+        self.assertEqual(handler.dropped, 2)
+        gate.set()
+        flusher.join(timeout=5)
+        self.assertFalse(flusher.is_alive())
+        self.assertEqual(target.flushed, 1)
+        handler.close()
+        self.assertEqual([record["message"] for record in target.records],
+                         [0, 3])
+
+    def test_flush_returns_under_sustained_logging(self):
+        target = RecordingHandler()
+        handler = QueueHandler(target)
+        stop = threading.Event()
+
+        def log():
+            while not stop.is_set():
+                handler.emit({"message": "busy"})
+
+        loggers = [threading.Thread(target=log) for _ in range(3)]
+        for logger in loggers:
+            logger.start()
+        try:
+            for _ in range(3):
+                self.assertTrue(handler.flush(timeout=5))
+        finally:
+            stop.set()
+            for logger in loggers:
+                logger.join()
+            handler.close()
+        self.assertGreaterEqual(target.flushed, 3)
+
+    def test_close_is_time_bounded(self):
+        gate, target, handler = self._blocked_handler(OverflowPolicy.BLOCK)
+        handler.emit({"message": 1})
+        handler.close(timeout=0.1)
+        self.assertFalse(target.closed)
+        gate.set()
+
+    def test_emit_after_close_is_dropped(self):
+        target = RecordingHandler()
+        handler = QueueHandler(target)
+        handler.close()
+        handler.emit({"message": 0})
+        self.assertEqual(target.records, [])
+        self.assertEqual(handler.dropped, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
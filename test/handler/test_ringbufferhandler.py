@@ -0,0 +1,86 @@
+import multiprocessing
+import os
+import shutil
+import unittest
+
+from loggingpython.handler.ringbufferhandler import RingBufferHandler
+from loggingpython.logger import Logger
+from loggingpython.ring_buffer import read_ring_buffer
+
+
+LOGDIR = "test_ring_logs"
+
+
+def crash(size):
+    logger = Logger("crash")
+    logger.addHandler(RingBufferHandler("crash", LOGDIR, size=size,
+                                        logformat_string="%(message)s"))
+    for index in range(100):
+        logger.info(f"message {index}")
+    os._exit(1)
+
+
+class TestRingBufferHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = Logger("test_logger")
+
+    def tearDown(self):
+        shutil.rmtree(LOGDIR, ignore_errors=True)
+
+    def _handler(self, size):
+        handler = RingBufferHandler("ring", LOGDIR, size=size,
+                                    logformat_string="%(message)s")
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_messages_are_read_back_in_order(self):
+        handler = self._handler(4096)
+        for index in range(10):
+            self.logger.info(f"message {index}")
+        self.logger.log_many(["batch 1", "batch 2"])
+        handler.close()
+        self.assertEqual(read_ring_buffer(handler.file),
+                         [f"message {index}" for index in range(10)] +
+                         ["batch 1", "batch 2"])
+        self.assertEqual(os.path.getsize(handler.file), 64 + 4096)
+
+    def test_oldest_messages_are_overwritten(self):
+        handler = self._handler(100)
+        for index in range(50):
+            self.logger.info(f"message {index:02d}")
+        handler.close()
+        # Every framed message takes 18 bytes, so 5 fit into 100 bytes.
+        self.assertEqual(read_ring_buffer(handler.file),
+                         [f"message {index:02d}" for index in range(45, 50)])
+
+    def test_history_is_continued(self):
+        handler = self._handler(4096)
+        self.logger.info("first run")
+        handler.close()
+        self.logger.removeHandler(handler)
+        handler = self._handler(4096)
+        self.logger.info("second run")
+        handler.close()
+        self.assertEqual(read_ring_buffer(handler.file),
+                         ["first run", "second run"])
+
+    def test_long_messages_are_truncated(self):
+        handler = self._handler(32)
+        self.logger.info("x" * 100)
+        handler.close()
+        self.assertEqual(read_ring_buffer(handler.file), ["x" * 24])
+
+    def test_messages_survive_a_crash(self):
+        process = multiprocessing.Process(target=crash, args=(1024,))
+        process.start()
+        process.join()
+        self.assertEqual(process.exitcode, 1)
+        lines = read_ring_buffer(os.path.join(LOGDIR, "crash.ring"))
+        self.assertEqual(lines[-1], "message 99")
+        self.assertEqual(lines, [f"message {index}"
+                                 for index in range(100 - len(lines), 100)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import importlib.util
+import os
+import shutil
+import time
+import unittest
+
+from loggingpython.handler.segmenthandler import SegmentHandler
+from loggingpython.log_levels import LogLevel
+from loggingpython.logger import Logger
+from loggingpython.segment_reader import read_columns, read_dataframe, \
+    read_segment_index
+
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestSegmentHandler(unittest.TestCase):
+    def setUp(self):
+        self.logger = Logger("segments", min_loglevel=LogLevel.DEBUG)
+
+    def tearDown(self):
+        shutil.rmtree("test_logs", ignore_errors=True)
+
+    def log(self, handler, records):
+        self.logger.addHandler(handler)
+        for number in range(records):
+            if number % 10 == 0:
+                self.logger.error("request %s failed", number % 3)
+            else:
+                self.logger.info("request %s handled", number % 5)
+
+    def test_segments_are_written_when_full(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 segment_records=100, max_segment_age=None)
+        self.log(handler, 250)
+        self.assertEqual(len(read_segment_index(handler)), 2)
+        handler.close()
+        indexes = read_segment_index(handler)
+        self.assertEqual([index["records"] for index in indexes],
+                         [100, 100, 50])
+        self.assertEqual(indexes[0]["levels"], {"INFO": 90, "ERROR": 10})
+        self.assertLessEqual(indexes[0]["min_created"],
+                             indexes[0]["max_created"])
+
+    def test_torn_segment_is_truncated(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 max_segment_age=None)
+        self.log(handler, 10)
+        handler.close()
+        size = os.path.getsize(handler.file)
+        with open(handler.file, "ab") as segment_file:
+            segment_file.write(b"LPSG\x00\x01")
+        self.assertEqual(len(read_segment_index(handler)), 1)
+
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 max_segment_age=None)
+        self.assertEqual(os.path.getsize(handler.file), size)
+        self.log(handler, 10)
+        handler.close()
+        self.assertEqual(len(read_segment_index(handler)), 2)
+
+    def test_other_file_is_not_truncated(self):
+        os.makedirs("test_logs")
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 max_segment_age=None)
+        handler.close()
+        with open(handler.file, "wb") as other_file:
+            other_file.write(b"not a segment file")
+        with self.assertRaises(ValueError):
+            SegmentHandler("test_segments", "test_logs",
+                           max_segment_age=None)
+        self.assertEqual(os.path.getsize(handler.file), 18)
+
+    def test_segment_is_written_when_its_oldest_message_is_due(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 max_segment_age=3600)
+        self.log(handler, 10)
+        with handler._lock:
+            self.assertGreater(handler._flush_if_due(), 3500)
+            self.assertFalse(os.path.exists(handler.file))
+            handler._started -= 3600
+            self.assertEqual(handler._flush_if_due(), 3600)
+        self.assertEqual(len(read_segment_index(handler)), 1)
+        handler.close()
+
+    def test_rotation_by_size(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 segment_records=10, max_segment_age=None,
+                                 rotation_interval=None, max_bytes=500)
+        self.log(handler, 100)
+        handler.close()
+        self.assertGreater(len(os.listdir("test_logs")), 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SegmentHandler("test_segments", "test_logs", backend="orc")
+        with self.assertRaises(ValueError):
+            SegmentHandler("test_segments", "test_logs", segment_records=0)
+
+    @unittest.skipUnless(HAS_PANDAS, "NumPy and pandas are not installed")
+    def test_read_columns(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 segment_records=64, max_segment_age=None)
+        before = time.time()
+        self.log(handler, 200)
+        handler.emit({"loggername": "dict", "loglevel": "WARNING",
+                      "message": "from a dict"})
+        handler.close()
+        columns = read_columns(handler)
+        self.assertEqual(len(columns["created"]), 201)
+        self.assertEqual(str(columns["created"].dtype), "datetime64[us]")
+        self.assertGreaterEqual(
+            columns["created"][0].astype("int64"), int(before * 1e6))
+        self.assertEqual(columns["levelno"][:2].tolist(), [40, 20])
+        self.assertEqual(columns["message"][:2].tolist(),
+                         ["request 0 failed", "request 1 handled"])
+        self.assertEqual(columns["loggername"][-1], "dict")
+        self.assertEqual(columns["levelno"][-1], 30)
+
+        selected = read_columns(handler, columns=["levelno"],
+                                min_level=LogLevel.ERROR)
+        self.assertEqual(list(selected), ["levelno"])
+        self.assertEqual(len(selected["levelno"]), 20)
+        self.assertEqual(len(read_columns(handler, start=time.time() + 60)
+                             ["message"]), 0)
+        with self.assertRaises(ValueError):
+            read_columns(handler, columns=["asctime"])
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_read_dataframe(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 segment_records=64, max_segment_age=None)
+        self.log(handler, 200)
+        handler.close()
+        frame = read_dataframe(handler, min_level=LogLevel.ERROR)
+        self.assertEqual(len(frame), 20)
+        self.assertEqual(str(frame["message"].dtype), "category")
+        self.assertEqual(sorted(frame["message"].unique()),
+                         ["request 0 failed", "request 1 failed",
+                          "request 2 failed"])
+        self.assertEqual(str(frame["created"].dt.tz), "UTC")
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_parquet_backend(self):
+        handler = SegmentHandler("test_segments", "test_logs",
+                                 segment_records=64, max_segment_age=None,
+                                 backend="parquet")
+        self.log(handler, 200)
+        handler.close()
+        self.assertTrue(handler.file.endswith(".parquet"))
+        frame = read_dataframe(handler, min_level=LogLevel.ERROR)
+        self.assertEqual(len(frame), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import shutil
+import unittest
+
+from loggingpython import getBasicLogger
+from loggingpython.handler import CSVHandler, FileHandler, SharedHandler
+from loggingpython.logger import Logger
+
+
+class TestSharedHandler(unittest.TestCase):
+    def tearDown(self):
+        shutil.rmtree("test_logs", ignore_errors=True)
+
+    def test_same_target_shares_one_handler(self):
+        first = SharedHandler(FileHandler, "test_shared", "test_logs")
+        second = SharedHandler(FileHandler, "test_shared",
+                               "test_logs/../test_logs")
+        self.assertIs(first.handler, second.handler)
+        self.assertEqual(first.references, 2)
+        first.close()
+        second.close()
+
+    def test_different_targets_are_not_shared(self):
+        log = SharedHandler(FileHandler, "test_shared", "test_logs")
+        other = SharedHandler(FileHandler, "test_other", "test_logs")
+        csv = SharedHandler(CSVHandler, "test_shared", "test_logs")
+        self.assertIsNot(log.handler, other.handler)
+        self.assertIsNot(log.handler, csv.handler)
+        for handler in (log, other, csv):
+            handler.close()
+
+    def test_last_reference_closes_the_handler(self):
+        first = SharedHandler(FileHandler, "test_shared", "test_logs")
+        second = SharedHandler(FileHandler, "test_shared", "test_logs")
+        first.close()
+        first.close()
+        self.assertFalse(second.handler.file.closed)
+        self.assertEqual(second.references, 1)
+        second.close()
+        self.assertTrue(second.handler.file.closed)
+        self.assertEqual(second.references, 0)
+
+        third = SharedHandler(FileHandler, "test_shared", "test_logs")
+        self.assertIsNot(third.handler, second.handler)
+        third.close()
+
+    def test_loggers_write_through_one_file(self):
+        handlers = [SharedHandler(FileHandler, "test_shared", "test_logs",
+                                  logformat_string="%(loggername)s")
+                    for _ in range(3)]
+        for number, handler in enumerate(handlers):
+            logger = Logger(f"logger{number}")
+            logger.addHandler(handler)
+            logger.info("message")
+        file = handlers[0].handler.file.name
+        for handler in handlers:
+            handler.close()
+        with open(file, "r") as log_file:
+            self.assertEqual(log_file.read().splitlines(),
+                             ["logger0", "logger1", "logger2"])
+
+    def test_basic_loggers_share_the_file_handler(self):
+        first = getBasicLogger()
+        second = getBasicLogger()
+        self.assertIs(first.handlers[0].handler, second.handlers[0].handler)
+        first.handlers[0].close()
+        second.handlers[0].close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import shutil
+import sqlite3
+import unittest
+
+from loggingpython.handler.sqlhandler import SQLHandler
+from loggingpython.log_levels import LogLevel
+from loggingpython.logger import Logger
+
+
+class TestSQLHandler(unittest.TestCase):
+    def setUp(self):
+        self.handler = SQLHandler("test_log", "test_sql_logs")
+        self.logger = Logger(name="test_logger")
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.handler.close()
+        if os.path.exists("test_sql_logs"):
+            shutil.rmtree("test_sql_logs")
+
+    def _messages(self) -> list[str]:
+        self.handler.flush()
+        with sqlite3.connect(self.handler.file) as conn:
+            rows = conn.execute("SELECT message FROM logs").fetchall()
+        return [row[0] for row in rows]
+
+    def test_emit(self):
+        self.logger.info("This is a test message")
+        self.assertEqual(self._messages(), ["This is a test message"])
+
+    def test_emit_batch(self):
+        self.logger.log_many([f"message {index}" for index in range(5)],
+                             LogLevel.INFO)
+        self.assertEqual(self._messages(),
+                         [f"message {index}" for index in range(5)])
+
+    def test_emit_batch_of_identical_messages_stores_every_row(self):
+        self.logger.log_many(["same"] * 5000, LogLevel.INFO)
+        self.assertEqual(self._messages(), ["same"] * 5000)
+
+    def test_table_keyed_by_hash_is_migrated(self):
+        self.handler.close()
+        os.remove(self.handler.file)
+        with sqlite3.connect(self.handler.file) as conn:
+            conn.execute("CREATE TABLE logs (hash_message TEXT PRIMARY KEY, "
+                         "message TEXT, loglevel TEXT, asctime TEXT, "
+                         "iso_8601_time TEXT, loggername TEXT)")
+            conn.execute("INSERT INTO logs (hash_message, message) "
+                         "VALUES ('1', 'old')")
+        conn.close()
+        self.handler = SQLHandler("test_log", "test_sql_logs")
+        self.logger.handlers = [self.handler]
+        self.logger.log_many(["a", "b", "a", "c", "d", "e"], LogLevel.INFO)
+        self.assertEqual(self._messages(), ["old", "a", "b", "a", "c", "d",
+                                            "e"])
+        self.assertEqual(self.handler.dropped, 0)
+
+    def test_rows_violating_a_constraint_are_counted(self):
+        self.handler.flush()
+        with sqlite3.connect(self.handler.file) as conn:
+            conn.execute("CREATE TRIGGER reject BEFORE INSERT ON logs "
+                         "WHEN NEW.message = 'bad' "
+                         "BEGIN SELECT RAISE(ABORT, 'rejected'); END")
+        conn.close()
+        self.logger.log_many(["a", "bad", "b"], LogLevel.INFO)
+        self.assertEqual(self._messages(), ["a", "b"])
+        self.assertEqual(self.handler.dropped, 1)
+
+    def test_writes_use_wal_and_one_connection(self):
+        self.logger.info("first")
+        self.handler.flush()
+        with sqlite3.connect(self.handler.file) as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+        self.assertTrue(self.handler._writer.is_alive())
+
+    def test_close_commits_queued_records(self):
+        for index in range(1000):
+            self.logger.info(f"message {index}")
+        self.handler.close()
+        self.assertFalse(self.handler._writer.is_alive())
+        self.assertEqual(len(self._messages()), 1000)
+        self.logger.info("after close")
+        self.assertEqual(self.handler.dropped, 1)
+        self.handler.close()
+
+    def test_rotation_by_size(self):
+        handler = SQLHandler("test_rotation", "test_sql_logs",
+                             rotation_interval=None, max_bytes=16384,
+                             batch_size=100)
+        for index in range(2000):
+            handler.emit({"message": f"message {index}"})
+            if index % 100 == 0:
+                handler.flush()
+        handler.close()
+        self.assertTrue(os.path.exists(handler.file + ".1"))
+
+    def test_invalid_synchronous_mode(self):
+        with self.assertRaises(ValueError):
+            SQLHandler("test_log", "test_sql_logs", synchronous="SOMETIMES")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import gzip
+import importlib.util
+import os
+import shutil
+import unittest
+from datetime import date
+
+from loggingpython.archiver import Archiver
+
+from loggingpython.handler.csvhandler import CSVHandler
+from loggingpython.handler.filehandler import FileHandler
+from loggingpython.handler.jsonhandler import JSONHandler
+from loggingpython.handler.sqlhandler import SQLHandler
+from loggingpython.json_format import JSONFormat
+from loggingpython.log_levels import LogLevel
+from loggingpython.logger import Logger
+
+if importlib.util.find_spec("pandas") is not None:
+    from loggingpython.analysis import load, load_log
+
+LINE = "2024-01-0{day}T12:00:00.000000+0000: [app]: [{level}]: {message}\n"
+
+
+@unittest.skipUnless(importlib.util.find_spec("pandas"),
+                     "pandas is not installed")
+class TestAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.logger = Logger("analysis", min_loglevel=LogLevel.DEBUG)
+
+    def tearDown(self):
+        shutil.rmtree("test_logs", ignore_errors=True)
+
+    def log(self, *handlers):
+        for handler in handlers:
+            self.logger.addHandler(handler)
+        for number in range(5):
+            self.logger.info(f"message {number}")
+        self.logger.error('multi\nline; "quoted"')
+        for handler in handlers:
+            handler.close()
+
+    def test_every_format_round_trips(self):
+        handlers = [
+            FileHandler("test_analysis", "test_logs"),
+            CSVHandler("test_analysis", "test_logs", header=True),
+            JSONHandler("test_analysis", "test_logs"),
+            JSONHandler("test_ndjson", "test_logs",
+                        json_format=JSONFormat.NDJSON),
+            JSONHandler("test_array", "test_logs",
+                        json_format=JSONFormat.ARRAY),
+            SQLHandler("test_analysis", "test_logs"),
+        ]
+        self.log(*handlers)
+        for handler in handlers:
+            with self.subTest(handler=handler):
+                frame = load(handler)
+                self.assertEqual(list(frame["message"]),
+                                 [f"message {number}" for number in range(5)]
+                                 + ['multi\nline; "quoted"'])
+                self.assertTrue(frame["loglevel"].cat.ordered)
+                self.assertEqual(len(frame[frame["loglevel"] >= "ERROR"]), 1)
+                self.assertEqual(str(frame["loggername"].dtype), "category")
+                self.assertEqual(str(frame["asctime"].dt.tz), "UTC")
+
+    def test_chunks_keep_multi_line_messages(self):
+        handler = FileHandler("test_analysis", "test_logs")
+        self.log(handler)
+        chunks = list(load_log(handler, chunksize=2))
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))
+        messages = [message for chunk in chunks
+                    for message in chunk["message"]]
+        self.assertEqual(messages[-1], 'multi\nline; "quoted"')
+        self.assertEqual(len(messages), 6)
+
+    def test_date_range_spans_daily_files(self):
+        os.makedirs("test_logs")
+        for day in range(1, 5):
+            with open(f"test_logs/app_2024-01-0{day}.log", "w") as log_file:
+                log_file.write(LINE.format(day=day, level="INFO",
+                                           message=f"day {day}"))
+        os.rename("test_logs/app_2024-01-02.log",
+                  "test_logs/app_2024-01-02.log.1")
+        with gzip.open("test_logs/app_2024-01-02.log.2.gz", "wt") as archive:
+            archive.write(LINE.format(day=2, level="DEBUG", message="older"))
+        with open("test_logs/app_2024-01-02.log", "w") as log_file:
+            log_file.write(LINE.format(day=2, level="ERROR",
+                                       message="newer"))
+
+        frame = load_log("test_logs/app_2024-01-03.log",
+                         start_date="2024-01-02", end_date="2024-01-03")
+        self.assertEqual(list(frame["message"]),
+                         ["older", "day 2", "newer", "day 3"])
+        self.assertEqual(list(frame["loglevel"]),
+                         ["DEBUG", "INFO", "ERROR", "INFO"])
+        self.assertEqual(len(load_log("test_logs/app_2024-01-01.log",
+                                      start_date="2024-01-03")), 2)
+
+    def test_date_range_orders_archived_backups(self):
+        archiver = Archiver(None)
+        handler = FileHandler("app", "test_logs", max_bytes=200,
+                              archiver=archiver)
+        self.logger.addHandler(handler)
+        for number in range(10):
+            self.logger.info(f"message {number}")
+        handler.close()
+        self.assertTrue(archiver.flush(timeout=10))
+        archiver.close()
+        self.assertTrue(os.path.exists(handler.file.name + ".2"))
+        frame = load_log(handler, start_date=date.today())
+        self.assertEqual(list(frame["message"]),
+                         [f"message {number}" for number in range(10)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import gzip
+import lzma
+import os
+import shutil
+import time
+import unittest
+from datetime import timedelta
+
+from loggingpython.archiver import Archiver
+from loggingpython.compression import Compression
+from loggingpython.rotation import Rotation
+from loggingpython.logger import Logger
+from loggingpython.handler.filehandler import FileHandler
+
+
+LOGDIR = "test_archiver_logs"
+
+
+class TestArchiver(unittest.TestCase):
+
+    def tearDown(self):
+        self.archiver.close()
+        shutil.rmtree(LOGDIR, ignore_errors=True)
+
+    def _log(self, archiver, count):
+        handler = FileHandler("app", LOGDIR, logformat_string="%(message)s",
+                              rotation_interval=None, max_bytes=20,
+                              archiver=archiver)
+        logger = Logger("test_logger")
+        logger.addHandler(handler)
+        for index in range(count):
+            logger.info(f"message {index}")
+        handler.close()
+        self.assertTrue(archiver.flush(timeout=10))
+
+    def test_rotated_files_are_compressed(self):
+        for compression, opener in ((Compression.GZIP, gzip.open),
+                                    (Compression.LZMA, lzma.open)):
+            with self.subTest(compression=compression):
+                self.archiver = Archiver(compression)
+                self._log(self.archiver, 6)
+                extension = compression.value
+                self.assertEqual(sorted(os.listdir(LOGDIR)),
+                                 ["app.log", f"app.log.1.{extension}",
+                                  f"app.log.2.{extension}"])
+                with opener(os.path.join(LOGDIR,
+                                         f"app.log.1.{extension}")) as file:
+                    self.assertEqual(file.read(), b"message 0\nmessage 1\n")
+                self.assertEqual(self.archiver.compressed, 2)
+                self.assertEqual(self.archiver.queue_depth, 0)
+                self.assertIsNone(self.archiver.current)
+                self.archiver.close()
+                shutil.rmtree(LOGDIR)
+
+    def test_retention_by_count(self):
+        self.archiver = Archiver(None, max_files=2)
+        self._log(self.archiver, 10)
+        self.assertEqual(sorted(os.listdir(LOGDIR)),
+                         ["app.log", "app.log.3", "app.log.4"])
+        self.assertEqual(self.archiver.deleted, 2)
+
+    def test_retention_by_age_and_bytes(self):
+        os.makedirs(LOGDIR)
+        rotation = Rotation(LOGDIR, "app", "log")
+        now = time.time()
+        for day, size in ((1, 100), (2, 100), (3, 100), (40, 100)):
+            file = os.path.join(LOGDIR, f"app_2024-01-{day:02d}.log")
+            with open(file, "w") as handle:
+                handle.write("x" * size)
+            os.utime(file, (now - day * 86400, now - day * 86400))
+        with open(os.path.join(LOGDIR, "app_errors_2024-01-01.log"),
+                  "w") as handle:
+            handle.write("not part of the rotation")
+
+        self.archiver = Archiver(None, max_age=timedelta(days=30),
+                                 max_bytes=250)
+        self.archiver.submit(os.path.join(LOGDIR, "app_2024-01-01.log"),
+                             rotation)
+        self.assertTrue(self.archiver.flush(timeout=10))
+        self.assertEqual(sorted(os.listdir(LOGDIR)),
+                         ["app_2024-01-01.log", "app_2024-01-02.log",
+                          "app_errors_2024-01-01.log"])
+
+    def test_retention_ignores_handlers_with_overlapping_names(self):
+        os.makedirs(LOGDIR)
+        rotation = Rotation(LOGDIR, "app", "log")
+        other = Rotation(LOGDIR, "app_2", "log")
+        now = time.time()
+        for filename in ("app_2024-01-01.log", "app_2024-01-02.log",
+                         "app_2_2024-01-01.log",
+                         os.path.basename(other.file)):
+            file = os.path.join(LOGDIR, filename)
+            with open(file, "w") as handle:
+                handle.write("x")
+            os.utime(file, (now - 86400, now - 86400))
+        self.assertEqual(sorted(rotation.rotated_files()),
+                         [os.path.join(LOGDIR, "app_2024-01-01.log"),
+                          os.path.join(LOGDIR, "app_2024-01-02.log")])
+
+        self.archiver = Archiver(None, max_files=0)
+        self.archiver.submit(os.path.join(LOGDIR, "app_2024-01-01.log"),
+                             rotation)
+        self.assertTrue(self.archiver.flush(timeout=10))
+        self.assertEqual(sorted(os.listdir(LOGDIR)),
+                         sorted(["app_2_2024-01-01.log",
+                                 os.path.basename(other.file)]))
+
+    def test_failures_are_counted(self):
+        os.makedirs(LOGDIR)
+        rotation = Rotation(LOGDIR, "app", "log")
+        self.archiver = Archiver()
+        self.archiver.submit(os.path.join(LOGDIR, "missing.log"), rotation)
+        self.assertTrue(self.archiver.flush(timeout=10))
+        self.assertEqual(self.archiver.failed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from loggingpython.async_logger import AsyncLogger
+from loggingpython.log_levels import LogLevel
+from loggingpython.overflow_policy import OverflowPolicy
+from loggingpython.handler.handler import Handler
+from loggingpython.handler.asynchandler import AsyncHandler
+from loggingpython.handler.executorhandler import ExecutorHandler
+
+
+class RecordingHandler(Handler):
+    def __init__(self):
+        self.records = []
+        self.threads = set()
+        self.flushed = 0
+        self.closed = False
+
+    def emit(self, record):
+        self.threads.add(threading.get_ident())
+        self.records.append(record)
+
+    def flush(self):
+        self.flushed += 1
+
+    def close(self):
+        self.closed = True
+
+
+class RecordingAsyncHandler(AsyncHandler):
+    def __init__(self):
+        self.records = []
+        self.closed = False
+
+    async def aemit(self, record):
+        await asyncio.sleep(0)
+        self.records.append(record)
+
+    async def aclose(self):
+        self.closed = True
+
+
+class SlowHandler(Handler):
+    def emit(self, record):
+        time.sleep(0.05)
+
+
+class TestAsyncLogger(unittest.TestCase):
+
+    def test_records_reach_sync_and_async_handlers(self):
+        sync_handler = RecordingHandler()
+        async_handler = RecordingAsyncHandler()
+
+        async def main():
+            logger = AsyncLogger("async", min_loglevel=LogLevel.DEBUG)
+            logger.addHandler(sync_handler)
+            logger.addHandler(async_handler)
+            for index in range(50):
+                logger.debug("message %d", index)
+            logger.log_many(["batch"])
+            await logger.aclose()
+
+        asyncio.run(main())
+        expected = [f"message {index}" for index in range(50)] + ["batch"]
+        for handler in (sync_handler, async_handler):
+            self.assertEqual([record["message"] for record in handler.records],
+                             expected)
+            self.assertTrue(handler.closed)
+        self.assertEqual(sync_handler.flushed, 1)
+        self.assertNotIn(threading.get_ident(), sync_handler.threads)
+
+    def test_log_calls_do_not_wait_for_handlers(self):
+        async def main():
+            logger = AsyncLogger("async")
+            logger.addHandler(SlowHandler())
+            start = time.perf_counter()
+            for _ in range(10):
+                logger.info("message")
+            elapsed = time.perf_counter() - start
+            await logger.aclose()
+            return elapsed
+
+        self.assertLess(asyncio.run(main()), 0.05)
+
+    def test_executor_handler_uses_one_worker_thread(self):
+        target = RecordingHandler()
+
+        async def main():
+            logger = AsyncLogger("async")
+            logger.addHandler(ExecutorHandler(target))
+            for index in range(20):
+                logger.info("message %d", index)
+                await asyncio.sleep(0)
+            await logger.aclose()
+
+        asyncio.run(main())
+        self.assertEqual(len(target.records), 20)
+        self.assertEqual(len(target.threads), 1)
+        self.assertNotIn(threading.get_ident(), target.threads)
+        self.assertTrue(target.closed)
+
+    def test_records_from_other_threads(self):
+        target = RecordingHandler()
+
+        async def main():
+            logger = AsyncLogger("async")
+            logger.addHandler(target)
+            logger.info("start")
+            thread = threading.Thread(
+                target=lambda: [logger.info("thread") for _ in range(10)])
+            thread.start()
+            await asyncio.get_running_loop().run_in_executor(None,
+                                                             thread.join)
+            await logger.aclose()
+
+        asyncio.run(main())
+        self.assertEqual(len(target.records), 11)
+
+    def test_records_before_the_loop_runs_are_kept(self):
+        target = RecordingHandler()
+        logger = AsyncLogger("async")
+        logger.addHandler(target)
+        logger.info("early")
+        self.assertEqual(logger.queue_depth, 1)
+        asyncio.run(logger.aflush())
+        self.assertEqual([record["message"] for record in target.records],
+                         ["early"])
+        logger.info("second loop")
+        asyncio.run(logger.aclose())
+        self.assertEqual(len(target.records), 2)
+
+    def test_overflow_policies(self):
+        for overflow_policy, expected in (
+                (OverflowPolicy.DROP_NEWEST, ["0", "1"]),
+                (OverflowPolicy.DROP_OLDEST, ["2", "3"])):
+            with self.subTest(overflow_policy=overflow_policy):
+                target = RecordingHandler()
+                logger = AsyncLogger("async", maxsize=2,
+                                     overflow_policy=overflow_policy)
+                logger.addHandler(target)
+                for index in range(4):
+                    logger.info(str(index))
+                self.assertEqual(logger.dropped, 2)
+                asyncio.run(logger.aclose())
+                self.assertEqual(
+                    [record["message"] for record in target.records],
+                    expected)
+
+    def test_block_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            AsyncLogger("async", overflow_policy=OverflowPolicy.BLOCK)
+
+
+if __name__ == '__main__':
+    unittest.main()
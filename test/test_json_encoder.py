@@ -0,0 +1,63 @@
+import json
+import unittest
+from unittest import mock
+
+from loggingpython import json_encoder
+from loggingpython.json_encoder import JSONEncoder
+from loggingpython.log_levels import LogLevel
+from loggingpython.logger import Logger
+
+
+class TestJSONEncoder(unittest.TestCase):
+    def setUp(self):
+        logger = Logger(name="test_logger")
+        self.record = logger._format_message("Grüße 👋", LogLevel.INFO)
+        self.backends = ["json"]
+        if json_encoder.orjson is not None:
+            self.backends.append("orjson")
+
+    def test_encodes_all_fields(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                data = JSONEncoder(backend=backend).encode(self.record)
+                self.assertEqual(json.loads(data), dict(self.record))
+                self.assertNotIn(b'": "', data)
+                self.assertIn("👋".encode("utf-8"), data)
+
+    def test_static_fields_are_spliced(self):
+        for backend in self.backends:
+            with self.subTest(backend=backend):
+                encoder = JSONEncoder({"client_name": "client",
+                                       "service": {"version": [1, 4]}},
+                                      backend=backend)
+                self.assertEqual(json.loads(encoder.encode(self.record)),
+                                 dict(self.record, client_name="client",
+                                      service={"version": [1, 4]}))
+
+    def test_static_fields_replace_record_fields(self):
+        encoder = JSONEncoder({"loggername": "fixed"},
+                              fields=("loggername", "message"))
+        self.assertEqual(json.loads(encoder.encode(self.record)),
+                         {"message": "Grüße 👋", "loggername": "fixed"})
+
+    def test_only_static_fields(self):
+        encoder = JSONEncoder({"a": 1}, fields=())
+        self.assertEqual(json.loads(encoder.encode(self.record)), {"a": 1})
+        self.assertEqual(JSONEncoder(fields=()).encode(self.record), b"{}")
+
+    def test_mapping_record(self):
+        encoder = JSONEncoder(fields=("loglevel", "message"))
+        self.assertEqual(json.loads(encoder.encode({"message": "dict"})),
+                         {"loglevel": "", "message": "dict"})
+
+    def test_backend_selection(self):
+        with self.assertRaises(ValueError):
+            JSONEncoder(backend="ujson")
+        with mock.patch.object(json_encoder, "orjson", None):
+            self.assertEqual(JSONEncoder().backend, "json")
+            with self.assertRaises(ImportError):
+                JSONEncoder(backend="orjson")
+
+
+if __name__ == '__main__':
+    unittest.main()
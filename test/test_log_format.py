@@ -0,0 +1,99 @@
+import importlib.util
+import unittest
+
+from loggingpython.error.invalid_log_format_error import InvalidLogFormatError
+from loggingpython.handler.consolehandler import ConsoleHandler
+from loggingpython.log_format import LogFormat
+from loggingpython.log_levels import LogLevel
+from loggingpython.logger import Logger
+
+
+class TestLogFormat(unittest.TestCase):
+
+    def setUp(self):
+        logger = Logger(name="test_logger")
+        self.record = logger._format_message("Test message", LogLevel.INFO)
+
+    def test_render_matches_percent_formatting(self):
+        logformat_strings = [
+            "%(asctime)s: [%(loggername)s]: [%(loglevel)s]: %(message)s",
+            "%(message)s",
+            "%(loglevel)-8s|%(message)20s|100%%",
+            "static text",
+        ]
+        for logformat_string in logformat_strings:
+            with self.subTest(logformat_string=logformat_string):
+                self.assertEqual(LogFormat(logformat_string).render(
+                    self.record), logformat_string % self.record)
+
+    def test_referenced_fields(self):
+        logformat = LogFormat("[%(loglevel)s] %(message)s %(loglevel)s")
+        self.assertEqual(logformat.fields,
+                         ("loglevel", "message", "loglevel"))
+
+    def test_unreferenced_timestamps_are_not_rendered(self):
+        LogFormat("[%(loglevel)s] %(message)s").render(self.record)
+        with self.assertRaises(AttributeError):
+            self.record._asctime
+
+    def test_render_dict(self):
+        logformat = LogFormat("[%(loglevel)s] %(message)s")
+        self.assertEqual(logformat.render({"message": "Test message"}),
+                         "[] Test message")
+
+    def test_parse_is_the_inverse_of_render(self):
+        logformat_strings = [
+            "%(asctime)s: [%(loggername)s]: [%(loglevel)s]: %(message)s",
+            "%(loglevel)-8s|%(message)20s|100%%",
+            "[%(loglevel)s] %(message)s %(loglevel)s",
+        ]
+        for logformat_string in logformat_strings:
+            with self.subTest(logformat_string=logformat_string):
+                logformat = LogFormat(logformat_string)
+                values = logformat.parse(logformat.render(self.record))
+                for field, value in values.items():
+                    self.assertEqual(value, getattr(self.record, field))
+
+    def test_parse_mismatch(self):
+        logformat = LogFormat("[%(loglevel)s] %(message)s")
+        self.assertIsNone(logformat.parse("no brackets"))
+        self.assertEqual(logformat.parse("[INFO] a [b] c"),
+                         {"loglevel": "INFO", "message": "a [b] c"})
+
+    @unittest.skipUnless(importlib.util.find_spec("pandas"),
+                         "pandas is not installed")
+    def test_parse_lines_matches_parse(self):
+        import pandas as pd
+
+        logformat = LogFormat("%(loglevel)-8s|%(message)s|%(loglevel)s")
+        lines = ["INFO    |a|b|INFO", "no match", "ERROR   ||ERROR"]
+        frame = logformat.parse_lines(pd.Series(lines))
+        self.assertEqual(list(frame.columns), ["loglevel", "message"])
+        self.assertEqual(frame.iloc[0].to_dict(), logformat.parse(lines[0]))
+        self.assertTrue(frame.iloc[1].isna().all())
+        self.assertEqual(frame.iloc[2].to_dict(), logformat.parse(lines[2]))
+
+    def test_unknown_field(self):
+        with self.assertRaises(InvalidLogFormatError):
+            LogFormat("%(unknown)s")
+
+    def test_invalid_placeholder(self):
+        for logformat_string in ["%(message)", "%s", "50% done"]:
+            with self.subTest(logformat_string=logformat_string):
+                with self.assertRaises(InvalidLogFormatError):
+                    LogFormat(logformat_string)
+
+    def test_handler_fails_fast(self):
+        with self.assertRaises(InvalidLogFormatError):
+            ConsoleHandler(logformat_string="%(unknown)s")
+
+    def test_extra_fields(self):
+        logformat = LogFormat("[%(client_name)s] %(message)s",
+                              fields=("client_name", "message"))
+        self.assertEqual(logformat.render({"client_name": "client",
+                                           "message": "Test message"}),
+                         "[client] Test message")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import glob
+import json
+import multiprocessing
+import os
+import shutil
+import threading
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from loggingpython.log_funnel import LogFunnel
+from loggingpython.logger import Logger
+from loggingpython.handler.filehandler import FileHandler
+from loggingpython.handler.jsonhandler import JSONHandler
+
+
+LOGDIR = "test_funnel_logs"
+
+_logger = Logger("worker")
+
+
+def init_worker(handler):
+    _logger.addHandler(handler)
+
+
+def work(index):
+    for number in range(25):
+        _logger.info("task %d record %d", index, number)
+    return index
+
+
+def crash(handler):
+    init_worker(handler)
+    for number in range(1000):
+        _logger.info("before crash %d", number)
+    os._exit(1)
+
+
+def survive(handler):
+    init_worker(handler)
+    work(0)
+
+
+class TestLogFunnel(unittest.TestCase):
+
+    def tearDown(self):
+        shutil.rmtree(LOGDIR, ignore_errors=True)
+
+    def _lines(self):
+        lines = []
+        for path in glob.glob(os.path.join(LOGDIR, "*.log")):
+            with open(path) as file:
+                lines.extend(file.read().splitlines())
+        return lines
+
+    def test_pool_workers_write_through_one_process(self):
+        funnel = LogFunnel(partial(FileHandler, "funnel", LOGDIR),
+                           partial(JSONHandler, "funnel", LOGDIR))
+        with ProcessPoolExecutor(2, initializer=init_worker,
+                                 initargs=(funnel.handler(),)) as pool:
+            self.assertEqual(sorted(pool.map(work, range(4))),
+                             [0, 1, 2, 3])
+        funnel.close()
+
+        self.assertFalse(funnel.process.is_alive())
+        self.assertEqual(len(self._lines()), 100)
+        for path in glob.glob(os.path.join(LOGDIR, "*.json")):
+            with open(path) as file:
+                self.assertEqual(len(json.load(file)), 100)
+
+    def test_crashed_worker_does_not_stop_the_writer(self):
+        funnel = LogFunnel(partial(FileHandler, "funnel", LOGDIR,
+                                   logformat_string="%(message)s"))
+        crashed = multiprocessing.Process(target=crash,
+                                          args=(funnel.handler(),))
+        crashed.start()
+        crashed.join()
+        self.assertEqual(crashed.exitcode, 1)
+        survivor = multiprocessing.Process(target=survive,
+                                           args=(funnel.handler(),))
+        survivor.start()
+        survivor.join(10)
+        self.assertEqual(survivor.exitcode, 0)
+        parent = Logger("parent")
+        parent.addHandler(funnel.handler())
+        parent.info("after crash")
+
+        closer = threading.Thread(target=funnel.close)
+        closer.start()
+        closer.join(10)
+        self.assertFalse(closer.is_alive())
+        self.assertFalse(funnel.process.is_alive())
+        lines = self._lines()
+        self.assertEqual([line for line in lines
+                          if line.startswith("task 0 ")],
+                         [f"task 0 record {number}" for number in range(25)])
+        self.assertEqual([line for line in lines
+                          if line.startswith("before crash ")],
+                         [f"before crash {number}" for number in range(1000)])
+        self.assertEqual(lines[-1], "after crash")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,15 @@ class TestLogLevel(unittest.TestCase):
         self.assertEqual(LogLevel.ERROR.value, "ERROR")
         self.assertEqual(LogLevel.CRITICAL.value, "CRITICAL")
 
+    def test_log_level_severities(self):
+        severities = [loglevel.severity for loglevel in LogLevel]
+        self.assertEqual(severities, sorted(severities))
+        self.assertEqual(LogLevel.DEBUG.severity, 10)
+        self.assertEqual(LogLevel.CRITICAL.severity, 50)
+
+    def test_log_level_lookup_by_value(self):
+        self.assertIs(LogLevel("WARNING"), LogLevel.WARNING)
+
 
 if __name__ == '__main__':
     unittest.main()
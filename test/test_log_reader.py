@@ -0,0 +1,94 @@
+import os
+import shutil
+import unittest
+
+from loggingpython.handler.filehandler import FileHandler
+from loggingpython.log_levels import LogLevel
+from loggingpython.log_reader import read_log
+from loggingpython.logger import Logger
+
+
+class TestLogReader(unittest.TestCase):
+    def setUp(self):
+        self.logger = Logger("test_logger", min_loglevel=LogLevel.DEBUG)
+
+    def tearDown(self):
+        self.handler.close()
+        shutil.rmtree("test_logs", ignore_errors=True)
+
+    def _handler(self, **options):
+        self.handler = FileHandler("test_reader", "test_logs", **options)
+        self.logger.addHandler(self.handler)
+        return self.handler
+
+    def test_read_default_format(self):
+        self._handler()
+        self.logger.info("first")
+        self.logger.error("second: [with] separators")
+        records = list(read_log(self.handler.file.name))
+        self.assertEqual([record["message"] for record in records],
+                         ["first", "second: [with] separators"])
+        self.assertEqual(records[1]["loglevel"], "ERROR")
+        self.assertEqual(records[1]["loggername"], "test_logger")
+
+    def test_read_from_handler_with_custom_format(self):
+        self._handler(logformat_string="%(loglevel)-8s| %(message)s")
+        self.logger.warning("custom")
+        self.assertEqual(list(read_log(self.handler)),
+                         [{"loglevel": "WARNING", "message": "custom"}])
+
+    def test_multi_line_message(self):
+        self._handler()
+        self.logger.info("line one\nline two")
+        self.logger.info("next")
+        records = list(read_log(self.handler, chunk_size=7))
+        self.assertEqual([record["message"] for record in records],
+                         ["line one\nline two", "next"])
+
+    def test_follow_appends(self):
+        self._handler(logformat_string="%(message)s")
+        self.logger.info("existing")
+        reader = read_log(self.handler, follow=True, from_end=True,
+                          poll_interval=0.01, idle_timeout=0.2)
+        self.logger.info("appended")
+        self.assertEqual(next(reader), {"message": "appended"})
+        self.logger.info("later")
+        self.assertEqual(next(reader), {"message": "later"})
+        self.assertEqual(list(reader), [])
+
+    def test_follow_size_rollover(self):
+        self._handler(logformat_string="%(message)s", max_bytes=30)
+        reader = read_log(self.handler, follow=True, poll_interval=0.01,
+                          idle_timeout=0.2)
+        for number in range(6):
+            self.logger.info(f"message number {number}")
+            self.assertEqual(next(reader),
+                             {"message": f"message number {number}"})
+        self.assertTrue(os.path.exists(self.handler.file.name + ".1"))
+        self.assertEqual(list(reader), [])
+
+    def test_follow_daily_rollover(self):
+        self._handler(logformat_string="%(message)s")
+        self.logger.info("today")
+        reader = read_log(self.handler, follow=True, poll_interval=0.01,
+                          idle_timeout=0.2)
+        self.assertEqual(next(reader), {"message": "today"})
+        next_day = os.path.join("test_logs", "test_reader_9999-12-31.log")
+        with open(next_day, "w") as file:
+            file.write("tomorrow\n")
+        self.assertEqual(list(reader), [{"message": "tomorrow"}])
+
+    def test_follow_skips_handlers_with_overlapping_names(self):
+        self._handler(logformat_string="%(message)s")
+        self.logger.info("today")
+        reader = read_log(self.handler, follow=True, poll_interval=0.01,
+                          idle_timeout=0.2)
+        self.assertEqual(next(reader), {"message": "today"})
+        other = os.path.join("test_logs", "test_reader_2_9999-12-31.log")
+        with open(other, "w") as file:
+            file.write("another handler\n")
+        self.assertEqual(list(reader), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import pickle
+import tracemalloc
+import unittest
+
+from loggingpython.handler.handler import Handler
+from loggingpython.log_levels import LogLevel
+from loggingpython.log_record import LogRecord
+from loggingpython.logger import Logger
+
+
+class RetainingHandler(Handler):
+    def __init__(self):
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(self._format_message(record))
+
+
+class TestLogRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = Logger(name="test_logger",
+                             time_format="%Y-%m-%d %H:%M:%S")
+        self.record = self.logger._format_message("Test message",
+                                                  LogLevel.WARNING)
+
+    def test_mapping_access(self):
+        self.assertEqual(self.record["loggername"], "test_logger")
+        self.assertEqual(self.record["loglevel"], "WARNING")
+        self.assertEqual(self.record.get("message"), "Test message")
+        self.assertEqual(self.record.get("unknown", ""), "")
+        self.assertEqual(set(self.record), set(LogRecord.FIELDS))
+
+    def test_percent_formatting(self):
+        self.assertEqual("[%(loglevel)s] %(message)s" % self.record,
+                         "[WARNING] Test message")
+
+    def test_timestamps_are_rendered_lazily(self):
+        with self.assertRaises(AttributeError):
+            self.record._asctime
+        self.assertEqual(len(self.record["asctime"]), 19)
+        self.assertEqual(self.record._asctime, self.record["asctime"])
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.record, "__dict__"))
+
+    def test_pickle(self):
+        data = pickle.dumps(self.record)
+        record = pickle.loads(data)
+        self.assertEqual(dict(record), dict(self.record))
+        self.assertEqual(record.levelno, self.record.levelno)
+        self.assertEqual(record.created, self.record.created)
+        self.assertNotIn(b"TimestampFormatter", data)
+
+    def test_handlers_share_one_record(self):
+        handlers = [RetainingHandler() for _ in range(3)]
+        for handler in handlers:
+            self.logger.addHandler(handler)
+        self.logger.info("Test message")
+        first, second, third = (handler.records[0] for handler in handlers)
+        self.assertIs(first, second)
+        self.assertIs(second, third)
+
+    def _bytes_per_record(self, handler_count: int,
+                          count: int = 1000) -> float:
+        logger = Logger(name="test_logger")
+        handlers = [RetainingHandler() for _ in range(handler_count)]
+        for handler in handlers:
+            logger.addHandler(handler)
+        message = "Test message"
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(count):
+                logger.info(message)
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return (after - before) / count
+
+    def test_bytes_allocated_per_record(self):
+        # The slotted record without rendered timestamps plus the list slot
+        # of the retaining handler stays well below a dict-based record.
+        self.assertLess(self._bytes_per_record(1), 160)
+
+    def test_bytes_allocated_per_record_with_fan_out(self):
+        # Additional handlers only add a reference, never a copy.
+        single = self._bytes_per_record(1)
+        fan_out = self._bytes_per_record(3)
+        self.assertLess(fan_out - single, 2 * 16)
+
+
+if __name__ == '__main__':
+    unittest.main()
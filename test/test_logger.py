@@ -39,6 +39,94 @@ class TestLogger(unittest.TestCase):
         with self.assertRaises(InvalidLogLevelError):
             self.logger._validate_loglevel("INVALID_LEVEL")
 
+    def test_is_enabled_for(self):
+        self.logger.min_loglevel = LogLevel.WARNING
+        self.logger.max_loglevel = LogLevel.ERROR
+        self.assertFalse(self.logger.isEnabledFor(LogLevel.INFO))
+        self.assertTrue(self.logger.isEnabledFor(LogLevel.WARNING))
+        self.assertTrue(self.logger.isEnabledFor(LogLevel.ERROR))
+        self.assertFalse(self.logger.isEnabledFor(LogLevel.CRITICAL))
+
+    def test_is_enabled_for_invalid_log_level(self):
+        with self.assertRaises(InvalidLogLevelError):
+            self.logger.isEnabledFor("INVALID_LEVEL")
+
+    def test_disabled_level_is_not_emitted(self):
+        self.handler.emit = MagicMock()
+        self.logger.addHandler(self.handler)
+        self.logger.debug("Test message")
+        self.handler.emit.assert_not_called()
+
+    def test_lazy_interpolation(self):
+        self.handler.emit = MagicMock()
+        self.logger.addHandler(self.handler)
+        self.logger.info("user %s took %d ms", "alice", 12)
+        record = self.handler.emit.call_args[0][0]
+        self.assertEqual(record["message"], "user alice took 12 ms")
+
+    def test_lazy_interpolation_with_mapping(self):
+        self.handler.emit = MagicMock()
+        self.logger.addHandler(self.handler)
+        self.logger.info("user %(user)s", {"user": "alice"})
+        record = self.handler.emit.call_args[0][0]
+        self.assertEqual(record["message"], "user alice")
+
+    def test_callable_argument_is_evaluated_lazily(self):
+        self.handler.emit = MagicMock()
+        self.logger.addHandler(self.handler)
+        expensive = MagicMock(return_value="value")
+        self.logger.debug("expensive %s", expensive)
+        expensive.assert_not_called()
+        self.logger.info("expensive %s", expensive)
+        expensive.assert_called_once_with()
+        record = self.handler.emit.call_args[0][0]
+        self.assertEqual(record["message"], "expensive value")
+
+    def test_no_interpolation_without_handlers(self):
+        expensive = MagicMock(return_value="value")
+        self.logger.info("expensive %s", expensive)
+        expensive.assert_not_called()
+
+    def test_class_argument_is_not_called(self):
+        self.handler.emit = MagicMock()
+        self.logger.addHandler(self.handler)
+        self.logger.info("type %s", int)
+        record = self.handler.emit.call_args[0][0]
+        self.assertEqual(record["message"], "type <class 'int'>")
+
+    def test_invalid_interpolation_is_logged_as_error(self):
+        self.handler.emit = MagicMock()
+        self.logger.addHandler(self.handler)
+        self.logger.info("%s and %s", "only one")
+        record = self.handler.emit.call_args[0][0]
+        self.assertEqual(record["loglevel"], LogLevel.ERROR.name)
+
+    def test_timestamps_are_rendered_from_one_clock_read(self):
+        self.logger.time_format = "%Y-%m-%dT%H:%M:%S.%f%z"
+        record = self.logger._format_message("Test message", LogLevel.INFO)
+        self.assertEqual(record["asctime"], record["iso_8601_time"])
+        self.assertIsInstance(record.created, float)
+
+    def test_log_many(self):
+        self.handler.emit_batch = MagicMock()
+        self.logger.addHandler(self.handler)
+        self.logger.log_many(["first", "second"], LogLevel.WARNING)
+        records = self.handler.emit_batch.call_args[0][0]
+        self.assertEqual([record["message"] for record in records],
+                         ["first", "second"])
+        self.assertEqual(records[0]["loglevel"], "WARNING")
+
+    def test_log_many_filters_disabled_records(self):
+        self.handler.emit_batch = MagicMock()
+        self.logger.addHandler(self.handler)
+        replayed = self.logger._format_message("replayed", LogLevel.DEBUG)
+        self.logger.log_many(["first", replayed], LogLevel.DEBUG)
+        self.handler.emit_batch.assert_not_called()
+
+    def test_set_invalid_min_loglevel(self):
+        with self.assertRaises(InvalidLogLevelError):
+            self.logger.min_loglevel = "INVALID_LEVEL"
+
 
 if __name__ == '__main__':
     unittest.main()
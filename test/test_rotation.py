@@ -0,0 +1,150 @@
+import os
+import shutil
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta
+
+from loggingpython.rotation import Rotation, name_of
+from loggingpython.rotation_interval import RotationInterval
+from loggingpython.logger import Logger
+from loggingpython.handler.filehandler import FileHandler
+from loggingpython.handler.csvhandler import CSVHandler
+from loggingpython.handler.jsonhandler import JSONHandler
+from loggingpython.handler.sqlhandler import SQLHandler
+
+
+LOGDIR = "test_rotation_logs"
+
+
+class TestRotation(unittest.TestCase):
+
+    def setUp(self):
+        os.makedirs(LOGDIR, exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(LOGDIR, ignore_errors=True)
+
+    def test_daily_file_name_and_deadline(self):
+        rotation = Rotation(LOGDIR, "app", "log")
+        today = datetime.now().strftime("%Y-%m-%d")
+        self.assertEqual(rotation.file,
+                         os.path.join(LOGDIR, f"app_{today}.log"))
+        midnight = datetime.combine(datetime.now().date() + timedelta(days=1),
+                                    datetime.min.time())
+        self.assertEqual(rotation.rollover_at, midnight.timestamp())
+        self.assertFalse(rotation.due())
+
+    def test_periods(self):
+        current = datetime(2024, 3, 5, 13, 47, 12)
+        hourly = Rotation(LOGDIR, "app", "log", RotationInterval.HOURLY)
+        self.assertEqual(hourly._period(current),
+                         (datetime(2024, 3, 5, 13), datetime(2024, 3, 5, 14)))
+        custom = Rotation(LOGDIR, "app", "log", timedelta(minutes=25))
+        self.assertEqual(custom._period(current),
+                         (datetime(2024, 3, 5, 13, 45),
+                          datetime(2024, 3, 5, 14, 10)))
+        self.assertEqual(custom._period(datetime(2024, 3, 5, 23, 55)),
+                         (datetime(2024, 3, 5, 23, 45),
+                          datetime(2024, 3, 6)))
+
+    def test_expired_interval_starts_a_new_file(self):
+        rotation = Rotation(LOGDIR, "app", "log", timedelta(seconds=1))
+        rotation.rollover_at = time.time() - 1
+        self.assertTrue(rotation.due())
+        rotation.rollover()
+        self.assertGreater(rotation.rollover_at, time.time())
+
+    def test_size_rollover_keeps_numbered_backups(self):
+        rotation = Rotation(LOGDIR, "app", "log", None, max_bytes=10,
+                            backup_count=2)
+        self.assertEqual(rotation.file, os.path.join(LOGDIR, "app.log"))
+        for content in ("first", "second", "third", "fourth"):
+            if rotation.due(len(content)):
+                rotation.rollover()
+            with open(rotation.file, "a") as file:
+                file.write(content)
+            rotation.size += len(content)
+        with open(rotation.file) as file:
+            self.assertEqual(file.read(), "fourth")
+        with open(rotation.file + ".1") as file:
+            self.assertEqual(file.read(), "third")
+        with open(rotation.file + ".2") as file:
+            self.assertEqual(file.read(), "second")
+        self.assertFalse(os.path.exists(rotation.file + ".3"))
+
+    def test_name_of(self):
+        self.assertEqual(name_of("logs/app_2026-10-18.log"), "app")
+        self.assertEqual(name_of("logs/app_2_2026-10-18_13.log"), "app_2")
+        self.assertEqual(name_of("app_2026-10-18_13-30-00.csv"), "app")
+        self.assertEqual(name_of("logs/app.log"), "app")
+
+    def test_invalid_interval(self):
+        with self.assertRaises(ValueError):
+            Rotation(LOGDIR, "app", "log", timedelta(0))
+
+
+class TestHandlerRotation(unittest.TestCase):
+
+    def setUp(self):
+        self.logger = Logger("test_logger")
+
+    def tearDown(self):
+        shutil.rmtree(LOGDIR, ignore_errors=True)
+
+    def test_file_handler_rotates_by_size(self):
+        handler = FileHandler("app", LOGDIR, logformat_string="%(message)s",
+                              rotation_interval=None, max_bytes=20)
+        self.logger.addHandler(handler)
+        for index in range(5):
+            self.logger.info(f"message {index}")
+        handler.close()
+        self.assertEqual(sorted(os.listdir(LOGDIR)),
+                         ["app.log", "app.log.1", "app.log.2"])
+        with open(os.path.join(LOGDIR, "app.log")) as file:
+            self.assertEqual(file.read(), "message 4\n")
+
+    def test_concurrent_size_rollovers(self):
+        for handler_class in (FileHandler, CSVHandler):
+            with self.subTest(handler=handler_class.__name__):
+                handler = handler_class("app", LOGDIR,
+                                        logformat_string="%(message)s",
+                                        rotation_interval=None,
+                                        max_bytes=20000, backup_count=100)
+                logger = Logger("test_logger")
+                logger.addHandler(handler)
+
+                def log(thread):
+                    for index in range(1500):
+                        logger.info(f"thread {thread} message {index}")
+
+                threads = [threading.Thread(target=log, args=(thread,))
+                           for thread in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                handler.close()
+                lines = 0
+                for file in os.listdir(LOGDIR):
+                    with open(os.path.join(LOGDIR, file)) as log_file:
+                        lines += len(log_file.read().splitlines())
+                self.assertGreater(len(os.listdir(LOGDIR)), 2)
+                self.assertEqual(lines, 8 * 1500)
+                shutil.rmtree(LOGDIR)
+
+    def test_handlers_survive_an_interval_rollover(self):
+        handlers = [FileHandler("app", LOGDIR), CSVHandler("app", LOGDIR),
+                    JSONHandler("app", LOGDIR), SQLHandler("app", LOGDIR)]
+        for handler in handlers:
+            self.logger.addHandler(handler)
+            handler._rotation.rollover_at = 0
+        self.logger.info("after midnight")
+        for handler in handlers:
+            handler.flush()
+            self.assertGreater(handler._rotation.rollover_at, time.time())
+            handler.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from datetime import datetime, timezone
+
+from loggingpython.timestamp import TimestampFormatter
+
+
+class TestTimestampFormatter(unittest.TestCase):
+
+    def test_matches_strftime(self):
+        time_format = "%Y-%m-%dT%H:%M:%S.%f%z"
+        formatter = TimestampFormatter(time_format)
+        created = 1700000000.123456
+        expected = datetime.fromtimestamp(
+            1700000000, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.") + \
+            "123456+0000"
+        self.assertEqual(formatter.format(created), expected)
+
+    def test_format_without_microseconds(self):
+        formatter = TimestampFormatter("%Y-%m-%d %H:%M:%S")
+        self.assertEqual(formatter.format(1700000000.5),
+                         "2023-11-14 22:13:20")
+
+    def test_escaped_percent_is_not_a_microsecond_directive(self):
+        formatter = TimestampFormatter("%S %%f %f")
+        self.assertEqual(formatter.format(1700000000.25), "20 %f 250000")
+
+    def test_cache_is_updated_for_a_new_second(self):
+        formatter = TimestampFormatter("%S.%f")
+        self.assertEqual(formatter.format(1700000000.1), "20.100000")
+        self.assertEqual(formatter.format(1700000001.2), "21.200000")
+        self.assertEqual(formatter.format(1700000001.3), "21.300000")
+
+
+if __name__ == '__main__':
+    unittest.main()